@@ -72,43 +72,47 @@ class ActionExecutor:
     """Executes actions triggered by gesture events."""
 
     def __init__(self):
-        self._last_triggered: dict[str, float] = {}
+        self._last_triggered: dict[int, float] = {}  # id(action) -> monotonic
         self._http_session = None
+        # One dict lookup per action instead of an if/elif chain on the type
+        self._handlers = {
+            ActionType.KEYBOARD: self._exec_keyboard,
+            ActionType.SHELL: self._exec_shell,
+            ActionType.WEBHOOK: self._exec_webhook,
+            ActionType.OSC: self._exec_osc,
+            ActionType.LOG: self._exec_log,
+        }
 
     async def execute(self, action: Action, context: dict | None = None) -> bool:
         """Execute a single action. Returns True on success."""
-        # Cooldown check
-        key = f"{action.type.value}:{id(action)}"
-        now = time.monotonic()
+        # Cooldown check; only actions with a cooldown need a timestamp
         if action.cooldown > 0:
+            key = id(action)
+            now = time.monotonic()
             last = self._last_triggered.get(key, 0)
             if now - last < action.cooldown:
                 return False
-        self._last_triggered[key] = now
+            self._last_triggered[key] = now
 
+        handler = self._handlers.get(action.type)
+        if handler is None:
+            return False
         try:
-            if action.type == ActionType.KEYBOARD:
-                return await self._exec_keyboard(action.params)
-            elif action.type == ActionType.SHELL:
-                return await self._exec_shell(action.params)
-            elif action.type == ActionType.WEBHOOK:
-                return await self._exec_webhook(action.params, context)
-            elif action.type == ActionType.OSC:
-                return await self._exec_osc(action.params)
-            elif action.type == ActionType.LOG:
-                logger.info(
-                    "Action LOG: %s (context: %s)",
-                    action.params.get("message", "gesture triggered"),
-                    context,
-                )
-                return True
+            return await handler(action.params, context)
         except Exception as e:
             logger.error("Action %s failed: %s", action.type.value, e)
             return False
 
-        return False
+    async def _exec_log(self, params: dict, context: dict | None) -> bool:
+        """Log the event (useful for testing mappings)."""
+        logger.info(
+            "Action LOG: %s (context: %s)",
+            params.get("message", "gesture triggered"),
+            context,
+        )
+        return True
 
-    async def _exec_keyboard(self, params: dict) -> bool:
+    async def _exec_keyboard(self, params: dict, context: dict | None) -> bool:
         """Send keyboard shortcut via xdotool."""
         keys = params.get("keys", "")
         if not keys:
@@ -125,7 +129,7 @@ class ActionExecutor:
             return False
         return True
 
-    async def _exec_shell(self, params: dict) -> bool:
+    async def _exec_shell(self, params: dict, context: dict | None) -> bool:
         """Run a shell command."""
         command = params.get("command", "")
         if not command:
@@ -184,7 +188,7 @@ class ActionExecutor:
         async with self._http_session.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
             return 200 <= resp.status < 300
 
-    async def _exec_osc(self, params: dict) -> bool:
+    async def _exec_osc(self, params: dict, context: dict | None) -> bool:
         """Send OSC message."""
         address = params.get("address", "/gesture")
         host = params.get("host", "127.0.0.1")
@@ -19,6 +19,8 @@ from typing import Optional
 
 import numpy as np
 
+from gesture_engine.gestures import _PIP_IDX, _TIP_IDX, _WRIST
+
 
 @dataclass
 class BimanualEvent:
@@ -39,6 +41,11 @@ class _HandState:
     timestamp: float
 
 
+# L-shape check: thumb and index extended, middle and ring curled
+_L_TIPS = _TIP_IDX[:4]
+_L_PIPS = _PIP_IDX[:4]
+
+
 class BimanualDetector:
     """Detects two-hand gestures from pairs of hand landmarks.
 
@@ -66,7 +73,8 @@ class BimanualDetector:
         self.clap_velocity = clap_velocity
         self.frame_tolerance = frame_tolerance
 
-        self._history: deque[tuple[_HandState, _HandState, float]] = deque(
+        # (left, right, timestamp, planar inter-hand distance)
+        self._history: deque[tuple[_HandState, _HandState, float, float]] = deque(
             maxlen=history_size
         )
         self._last_distance: Optional[float] = None
@@ -93,30 +101,36 @@ class BimanualDetector:
             self._last_distance = None
             return []
 
-        # Take first two hands, sort by x-centroid (left vs right)
-        pair = sorted(hands[:2], key=lambda h: h[1].mean(axis=0)[0])
-        left_lm, right_lm = pair[0][1], pair[1][1]
-        left_c = left_lm.mean(axis=0)
-        right_c = right_lm.mean(axis=0)
+        # Take first two hands; both centroids and the inter-hand distance
+        # come from one stacked pass and are shared by every detector
+        both = np.stack((hands[0][1], hands[1][1]))
+        centroids = both.mean(axis=1)
+        if centroids[1, 0] < centroids[0, 0]:
+            # Sort by x-centroid (left vs right)
+            both = both[::-1]
+            centroids = centroids[::-1]
+        left_lm, right_lm = both
+        left_c, right_c = centroids
+        distance = float(np.linalg.norm(left_c[:2] - right_c[:2]))
 
         left_state = _HandState(centroid=left_c, landmarks=left_lm, timestamp=now)
         right_state = _HandState(centroid=right_c, landmarks=right_lm, timestamp=now)
-        self._history.append((left_state, right_state, now))
+        self._history.append((left_state, right_state, now, distance))
 
         events: list[BimanualEvent] = []
 
         # --- Pinch to zoom ---
-        zoom_evt = self._detect_zoom(left_c, right_c, now)
+        zoom_evt = self._detect_zoom(left_c, right_c, distance, now)
         if zoom_evt:
             events.append(zoom_evt)
 
         # --- Clap ---
-        clap_evt = self._detect_clap(left_c, right_c, now)
+        clap_evt = self._detect_clap(left_c, right_c, distance, now)
         if clap_evt:
             events.append(clap_evt)
 
         # --- Frame ---
-        frame_evt = self._detect_frame(left_lm, right_lm, left_c, right_c, now)
+        frame_evt = self._detect_frame(both, left_c, right_c, distance, now)
         if frame_evt:
             events.append(frame_evt)
 
@@ -139,11 +153,9 @@ class BimanualDetector:
         self._cooldowns[gesture] = now
 
     def _detect_zoom(
-        self, left_c: np.ndarray, right_c: np.ndarray, now: float
+        self, left_c: np.ndarray, right_c: np.ndarray, distance: float, now: float
     ) -> Optional[BimanualEvent]:
         """Detect pinch-to-zoom by tracking inter-hand distance changes."""
-        distance = float(np.linalg.norm(left_c[:2] - right_c[:2]))
-
         if self._last_distance is not None:
             delta = distance - self._last_distance
             if abs(delta) > self.zoom_threshold and self._check_cooldown("pinch_zoom", now, 0.1):
@@ -162,13 +174,12 @@ class BimanualDetector:
         return None
 
     def _detect_clap(
-        self, left_c: np.ndarray, right_c: np.ndarray, now: float
+        self, left_c: np.ndarray, right_c: np.ndarray, distance: float, now: float
     ) -> Optional[BimanualEvent]:
         """Detect clap: hands rapidly converging to near-contact."""
         if not self._check_cooldown("clap", now, 1.0):
             return None
 
-        distance = float(np.linalg.norm(left_c[:2] - right_c[:2]))
         if distance > self.clap_distance:
             return None
 
@@ -176,12 +187,11 @@ class BimanualDetector:
         if len(self._history) < 5:
             return None
 
-        prev_left, prev_right, prev_t = self._history[-5]
+        _, _, prev_t, prev_dist = self._history[-5]
         dt = now - prev_t
         if dt < 1e-6:
             return None
 
-        prev_dist = float(np.linalg.norm(prev_left.centroid[:2] - prev_right.centroid[:2]))
         velocity = (prev_dist - distance) / dt
 
         if velocity > self.clap_velocity:
@@ -198,45 +208,42 @@ class BimanualDetector:
 
     def _detect_frame(
         self,
-        left_lm: np.ndarray,
-        right_lm: np.ndarray,
+        both: np.ndarray,
         left_c: np.ndarray,
         right_c: np.ndarray,
+        distance: float,
         now: float,
     ) -> Optional[BimanualEvent]:
         """Detect frame gesture: two L-shapes forming a rectangle.
 
         Each hand should have thumb + index extended forming an L.
         The two Ls should face each other.
+
+        Args:
+            both: Left and right landmarks stacked, shape (2, 21, 3).
         """
         if not self._check_cooldown("frame", now, 1.0):
             return None
 
-        def is_l_shape(lm: np.ndarray) -> bool:
-            """Check if thumb and index are extended, others curled."""
-            wrist = lm[0]
-            # Thumb tip vs IP
-            thumb_ext = np.linalg.norm(lm[4] - wrist) > np.linalg.norm(lm[3] - wrist)
-            # Index tip vs PIP
-            index_ext = np.linalg.norm(lm[8] - wrist) > np.linalg.norm(lm[6] - wrist)
-            # Others curled
-            middle_curled = np.linalg.norm(lm[12] - wrist) < np.linalg.norm(lm[10] - wrist)
-            ring_curled = np.linalg.norm(lm[16] - wrist) < np.linalg.norm(lm[14] - wrist)
-
-            return thumb_ext and index_ext and middle_curled and ring_curled
+        # Tip and PIP distances from the wrist for both hands at once
+        # (squared: same ordering, no sqrt)
+        wrists = both[:, _WRIST, None]
+        tips = both[:, _L_TIPS] - wrists
+        pips = both[:, _L_PIPS] - wrists
+        tip_sq = (tips * tips).sum(-1)
+        pip_sq = (pips * pips).sum(-1)
+        l_shape = (tip_sq[:, :2] > pip_sq[:, :2]).all() and (tip_sq[:, 2:] < pip_sq[:, 2:]).all()
 
-        if is_l_shape(left_lm) and is_l_shape(right_lm):
+        if l_shape:
             # Check that thumbs point toward each other (y-axis roughly aligned)
-            left_thumb_dir = left_lm[4] - left_lm[2]
-            right_thumb_dir = right_lm[4] - right_lm[2]
+            thumb_dx = both[:, 4, 0] - both[:, 2, 0]
 
             # Thumbs should point in roughly opposite x-directions
-            if left_thumb_dir[0] * right_thumb_dir[0] < 0:
+            if thumb_dx[0] * thumb_dx[1] < 0:
                 self._set_cooldown("frame", now)
-                width = float(np.linalg.norm(left_c[:2] - right_c[:2]))
                 return BimanualEvent(
                     gesture="frame",
-                    value=width,
+                    value=distance,
                     confidence=0.85,
                     left_centroid=left_c,
                     right_centroid=right_c,
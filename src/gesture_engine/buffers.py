@@ -0,0 +1,156 @@
+"""Fixed-size NumPy ring buffers for rolling statistics.
+
+Replaces `deque(maxlen=N)` where the window is reduced with sum/min/max/
+percentile: the samples live in one preallocated array, so reductions
+run as single NumPy calls instead of iterating Python floats.
+`SummingRingBuffer` additionally keeps the window sum up to date for
+O(1) averages, and `SmoothingWindow` keeps label counts for O(1)
+majority votes.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity ring of scalars backed by a preallocated array.
+
+    Usage:
+        buf = RingBuffer(60)
+        buf.append(0.016)
+        avg = float(buf.view().mean())
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._head = 0  # next write position
+        self._size = 0
+
+    def append(self, value):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def view(self) -> np.ndarray:
+        """All stored samples as a contiguous view, in storage order.
+
+        Use for order-independent reductions (mean, min, max, percentiles).
+        The view aliases the buffer and is invalidated by later appends.
+        """
+        return self._data[:self._size]
+
+    def values(self) -> np.ndarray:
+        """Stored samples as a new array, oldest first."""
+        if self._size < self._capacity:
+            return self._data[:self._size].copy()
+        return np.concatenate((self._data[self._head:], self._data[:self._head]))
+
+    def last(self):
+        """Most recently appended sample."""
+        if not self._size:
+            raise IndexError("last() on empty RingBuffer")
+        return self._data[self._head - 1]
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class SummingRingBuffer(RingBuffer):
+    """RingBuffer that keeps a running sum, so `mean()` is O(1).
+
+    The sum is adjusted by the evicted sample on each wrapping append and
+    recomputed exactly each time the write head returns to slot 0, which
+    bounds floating-point drift to one pass over the window.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        super().__init__(capacity, dtype)
+        self._sum = 0.0
+
+    def append(self, value):
+        head = self._head
+        if self._size == self._capacity:
+            self._sum -= float(self._data[head])
+        super().append(value)
+        if self._head == 0:
+            self._sum = float(self._data[:self._size].sum())
+        else:
+            self._sum += float(self._data[head])
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def mean(self) -> float:
+        return self._sum / self._size if self._size else 0.0
+
+    def clear(self):
+        super().clear()
+        self._sum = 0.0
+
+
+class SmoothingWindow:
+    """Sliding window of small-integer labels with incremental counts.
+
+    Each append updates the per-label counts for the one entry entering
+    and the one leaving, so `majority()` never rescans the window.
+    Labels are non-negative ints (e.g. interned gesture IDs); the count
+    table grows on demand.
+    """
+
+    def __init__(self, capacity: int, num_labels: int = 8):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._ring = np.zeros(capacity, dtype=np.int32)
+        self._counts = np.zeros(max(1, num_labels), dtype=np.int32)
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+
+    def append(self, label: int):
+        if label >= len(self._counts):
+            grown = np.zeros(max(label + 1, 2 * len(self._counts)), dtype=np.int32)
+            grown[:len(self._counts)] = self._counts
+            self._counts = grown
+        head = self._head
+        if self._size == self._capacity:
+            self._counts[self._ring[head]] -= 1
+        else:
+            self._size += 1
+        self._counts[label] += 1
+        self._ring[head] = label
+        self._head = (head + 1) % self._capacity
+
+    def majority(self) -> Optional[int]:
+        """Label held by more than half the window, or None."""
+        best = int(self._counts.argmax())
+        if self._counts[best] > self._size // 2:
+            return best
+        return None
+
+    def clear(self):
+        self._counts[:] = 0
+        self._head = 0
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
@@ -107,6 +107,9 @@ class DrawingCanvas:
         self._last_point: Optional[tuple[float, float]] = None
         self._drawing = False
         self._point_buffer: deque = deque(maxlen=smoothing)
+        # Running sums of the buffered points, so smoothing is O(1) per frame
+        self._sum_x = 0.0
+        self._sum_y = 0.0
 
         # Clear detection
         self._shake_positions: deque = deque(maxlen=15)
@@ -167,13 +170,7 @@ class DrawingCanvas:
                 self._current_color = new_color
                 commands.append(DrawCommand(type="color", color=new_color, timestamp=now))
 
-            # Smooth the point
-            self._point_buffer.append((tip_x, tip_y))
-            if len(self._point_buffer) >= 2:
-                smooth_x = sum(p[0] for p in self._point_buffer) / len(self._point_buffer)
-                smooth_y = sum(p[1] for p in self._point_buffer) / len(self._point_buffer)
-            else:
-                smooth_x, smooth_y = tip_x, tip_y
+            smooth_x, smooth_y = self._smooth(tip_x, tip_y)
 
             if self._last_point is not None:
                 lx, ly = self._last_point
@@ -199,7 +196,7 @@ class DrawingCanvas:
             # No recognized drawing gesture — stop drawing
             self._drawing = False
             self._last_point = None
-            self._point_buffer.clear()
+            self._reset_smoothing()
 
         # Trim history
         if len(self._history) > self._max_history:
@@ -208,6 +205,28 @@ class DrawingCanvas:
 
         return commands
 
+    def _smooth(self, x: float, y: float) -> tuple[float, float]:
+        """Add a point to the smoothing window; return the window mean."""
+        buf = self._point_buffer
+        if not buf.maxlen:
+            return x, y
+        if len(buf) == buf.maxlen:
+            old_x, old_y = buf[0]
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+        buf.append((x, y))
+        self._sum_x += x
+        self._sum_y += y
+        n = len(buf)
+        if n < 2:
+            return x, y
+        return self._sum_x / n, self._sum_y / n
+
+    def _reset_smoothing(self):
+        self._point_buffer.clear()
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+
     def _detect_shake(self, now: float) -> bool:
         """Detect rapid horizontal shaking (open hand shake = clear)."""
         if now < self._shake_cooldown:
@@ -238,7 +257,7 @@ class DrawingCanvas:
         """Programmatically clear the canvas."""
         self._history = [DrawCommand(type="clear")]
         self._last_point = None
-        self._point_buffer.clear()
+        self._reset_smoothing()
 
     @property
     def command_count(self) -> int:
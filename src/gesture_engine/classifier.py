@@ -7,7 +7,16 @@ from typing import Optional
 
 import numpy as np
 
-from gesture_engine.gestures import GestureRegistry
+from gesture_engine.gestures import _PIP_IDX, _TIP_IDX, _WRIST, GestureRegistry
+
+_PAIR_I, _PAIR_J = np.triu_indices(len(_TIP_IDX), k=1)
+# Every distance feature as one (from, to) landmark gather: the 10
+# fingertip pairs, then tip→wrist (5), then pip→wrist (5)
+_DIST_FROM = np.concatenate((_TIP_IDX[_PAIR_I], _TIP_IDX, _PIP_IDX))
+_DIST_TO = np.concatenate((_TIP_IDX[_PAIR_J], [_WRIST] * 5, [_WRIST] * 5))
+
+# Entries kept by the per-hand feature cache (replayed / held-still frames)
+_FEATURE_CACHE_SIZE = 256
 
 
 class GestureClassifier:
@@ -18,7 +27,10 @@ class GestureClassifier:
     2. Learned: Lightweight MLP trained on landmark features (higher accuracy)
 
     The rule-based mode works out of the box. The learned mode requires
-    collecting examples and training via the `train()` method.
+    collecting examples and training via the `train()` method. A learned
+    model exported to ONNX (optionally int8-quantized, see
+    `ModelExporter.to_onnx_int8`) can be loaded instead of the PyTorch
+    checkpoint; inference then runs on ONNX Runtime.
     """
 
     def __init__(
@@ -28,8 +40,12 @@ class GestureClassifier:
     ):
         self._registry = registry or GestureRegistry.with_defaults()
         self._model = None
+        self._session = None  # onnxruntime.InferenceSession for .onnx models
+        self._input_name = ""
         self._label_map: dict[int, str] = {}
         self._feature_dim: Optional[int] = None
+        # landmark bytes -> read-only feature vector, least recently used first
+        self._feature_cache: dict[bytes, np.ndarray] = {}
 
         if model_path:
             self.load_model(model_path)
@@ -50,7 +66,9 @@ class GestureClassifier:
             return None
         return result[0].name, result[1]
 
-    def extract_features(self, landmarks: np.ndarray) -> np.ndarray:
+    def extract_features(
+        self, landmarks: np.ndarray, use_cache: bool = False
+    ) -> np.ndarray:
         """Extract feature vector from landmarks for ML classification.
 
         Features include:
@@ -61,75 +79,161 @@ class GestureClassifier:
 
         Total: 81 features
 
+        With `use_cache`, results are memoized by the landmark bytes in a
+        small LRU cache, so identical frames (replays, a hand held still
+        on a static image) skip the computation.
+
         Args:
             landmarks: Normalized landmarks, shape (21, 3).
+            use_cache: Look the result up in (and add it to) the cache.
+
+        Returns:
+            Feature vector, shape (81,). Without `use_cache` it is a fresh
+            array; cached vectors are shared and read-only.
+        """
+        landmarks = np.ascontiguousarray(landmarks, dtype=np.float32)
+        if not use_cache:
+            return self.extract_features_batch(landmarks[None])[0]
+
+        cache = self._feature_cache
+        key = landmarks.tobytes()
+        features = cache.pop(key, None)
+        if features is None:
+            features = self.extract_features_batch(landmarks[None])[0]
+            features.flags.writeable = False
+            if len(cache) >= _FEATURE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = features  # (re)insert as most recently used
+        return features
+
+    def extract_features_batch(self, landmarks: np.ndarray) -> np.ndarray:
+        """Vectorized `extract_features` over a stack of hands.
+
+        Args:
+            landmarks: Normalized landmarks, shape (N, 21, 3).
 
         Returns:
-            Feature vector, shape (81,).
+            Feature matrix, shape (N, 81).
         """
-        features = []
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        n = landmarks.shape[0]
 
-        # Raw landmark positions (63 features)
-        features.extend(landmarks.flatten())
+        # All 20 distances in one gather + einsum + sqrt
+        diff = landmarks[:, _DIST_FROM] - landmarks[:, _DIST_TO]
+        dists = np.sqrt(np.einsum("npk,npk->np", diff, diff))
 
         # Pairwise fingertip distances (10 features)
-        tips = [4, 8, 12, 16, 20]
-        for i in range(len(tips)):
-            for j in range(i + 1, len(tips)):
-                dist = np.linalg.norm(landmarks[tips[i]] - landmarks[tips[j]])
-                features.append(dist)
+        pair_dists = dists[:, :10]
 
         # Finger extension ratios: tip_dist / pip_dist from wrist (5 features)
-        pips = [3, 6, 10, 14, 18]
-        wrist = landmarks[0]
-        for tip, pip in zip(tips, pips):
-            tip_dist = np.linalg.norm(landmarks[tip] - wrist)
-            pip_dist = np.linalg.norm(landmarks[pip] - wrist) + 1e-8
-            features.append(tip_dist / pip_dist)
+        tip_dist = dists[:, 10:15]
+        pip_dist = dists[:, 15:] + 1e-8
 
         # Palm orientation: normal vector of palm triangle (3 features)
-        v1 = landmarks[5] - landmarks[0]   # wrist → index_mcp
-        v2 = landmarks[17] - landmarks[0]  # wrist → pinky_mcp
+        v1 = landmarks[:, 5] - landmarks[:, 0]   # wrist → index_mcp
+        v2 = landmarks[:, 17] - landmarks[:, 0]  # wrist → pinky_mcp
         palm_normal = np.cross(v1, v2)
-        norm = np.linalg.norm(palm_normal) + 1e-8
-        features.extend(palm_normal / norm)
-
-        return np.array(features, dtype=np.float32)
-
-    def classify(self, landmarks: np.ndarray) -> Optional[tuple[str, float]]:
+        norm = np.sqrt(np.einsum("nk,nk->n", palm_normal, palm_normal)) + 1e-8
+
+        return np.concatenate(
+            (
+                landmarks.reshape(n, -1),  # raw landmark positions (63)
+                pair_dists,
+                tip_dist / pip_dist,
+                palm_normal / norm[:, None],
+            ),
+            axis=1,
+        ).astype(np.float32, copy=False)
+
+    def classify(
+        self, landmarks: np.ndarray, use_cache: bool = False
+    ) -> Optional[tuple[str, float]]:
         """Classify gesture using best available method.
 
         Uses learned model if loaded, otherwise falls back to rule-based.
+        `use_cache` routes learned-model features through the
+        `extract_features` cache; worth it only where identical frames
+        repeat (e.g. replaying a recording), not on live camera input.
         """
-        if self._model is not None:
-            return self._classify_learned(landmarks)
+        if self._model is not None or self._session is not None:
+            return self._classify_learned(landmarks, use_cache)
         return self.classify_rule_based(landmarks)
 
-    def _classify_learned(
+    def classify_batch(
         self, landmarks: np.ndarray
+    ) -> list[Optional[tuple[str, float]]]:
+        """Classify a stack of hands, shape (N, 21, 3), in one call.
+
+        With a learned model the whole batch goes through a single forward
+        pass; rule-based matching scores every hand against every gesture
+        in one vectorized pass (`GestureRegistry.match_batch`).
+        """
+        if self._model is not None or self._session is not None:
+            return self._classify_learned_batch(landmarks)
+        return [
+            None if result is None else (result[0].name, result[1])
+            for result in self._registry.match_batch(landmarks)
+        ]
+
+    def _classify_learned(
+        self, landmarks: np.ndarray, use_cache: bool = False
     ) -> Optional[tuple[str, float]]:
         """Classify using the trained MLP model."""
+        if not use_cache:
+            return self._classify_learned_batch(landmarks[None])[0]
+        features = self.extract_features(landmarks, use_cache=True)[None]
+        return self._classify_learned_batch(landmarks[None], features)[0]
+
+    def _classify_learned_batch(
+        self, landmarks: np.ndarray, features: Optional[np.ndarray] = None
+    ) -> list[Optional[tuple[str, float]]]:
+        if self._session is not None:
+            return self._classify_onnx_batch(landmarks, features)
+
         try:
             import torch
         except ImportError:
             # Fallback to rule-based if torch unavailable
-            return self.classify_rule_based(landmarks)
+            return [self.classify_rule_based(lm) for lm in landmarks]
 
-        features = self.extract_features(landmarks)
-        tensor = torch.FloatTensor(features).unsqueeze(0)
+        if features is None:
+            features = self.extract_features_batch(landmarks)
+        elif not features.flags.writeable:
+            features = features.copy()  # cached vector; torch wants writable memory
+        tensor = torch.from_numpy(features)
 
         with torch.no_grad():
             logits = self._model(tensor)
             probs = torch.softmax(logits, dim=1)
             confidence, predicted = torch.max(probs, 1)
 
-        label = self._label_map.get(predicted.item(), "unknown")
-        return label, confidence.item()
+        return [
+            (self._label_map.get(idx, "unknown"), conf)
+            for idx, conf in zip(predicted.tolist(), confidence.tolist())
+        ]
+
+    def _classify_onnx_batch(
+        self, landmarks: np.ndarray, features: Optional[np.ndarray] = None
+    ) -> list[Optional[tuple[str, float]]]:
+        """Classify using the loaded ONNX Runtime session."""
+        if features is None:
+            features = self.extract_features_batch(landmarks)
+        logits = self._session.run(None, {self._input_name: features})[0]
+
+        # Max softmax probability without materializing the distribution
+        predicted = logits.argmax(axis=1)
+        shifted = logits - logits[np.arange(len(logits)), predicted][:, None]
+        confidence = 1.0 / np.exp(shifted).sum(axis=1)
+
+        return [
+            (self._label_map.get(idx, "unknown"), conf)
+            for idx, conf in zip(predicted.tolist(), confidence.tolist())
+        ]
 
     def train(
         self,
         X: np.ndarray,
-        y: list[str],
+        y: list[str] | np.ndarray,
         epochs: int = 100,
         lr: float = 0.001,
         save_path: Optional[str | Path] = None,
@@ -138,7 +242,9 @@ class GestureClassifier:
 
         Args:
             X: Landmark arrays, shape (N, 21, 3).
-            y: Gesture labels, length N.
+            y: Gesture labels, length N: a list or array of names, or an
+                already-encoded integer array (the class names are then
+                the distinct integers as strings, e.g. "2").
             epochs: Training epochs.
             lr: Learning rate.
             save_path: Optional path to save trained model.
@@ -150,14 +256,15 @@ class GestureClassifier:
         import torch.nn as nn
         from torch.utils.data import DataLoader, TensorDataset
 
-        # Build label mapping
-        unique_labels = sorted(set(y))
-        label_to_idx = {label: i for i, label in enumerate(unique_labels)}
-        self._label_map = {i: label for label, i in label_to_idx.items()}
+        # Build label mapping: one sort in NumPy instead of a dict lookup
+        # per sample; classes come out sorted, targets index into them
+        classes, targets = np.unique(np.asarray(y), return_inverse=True)
+        # Names are always str, as classify() and the pipeline expect
+        unique_labels = [str(c) for c in classes.tolist()]
+        self._label_map = dict(enumerate(unique_labels))
 
         # Extract features
-        features = np.array([self.extract_features(x) for x in X])
-        targets = np.array([label_to_idx[label] for label in y])
+        features = self.extract_features_batch(X)
 
         self._feature_dim = features.shape[1]
         num_classes = len(unique_labels)
@@ -175,8 +282,8 @@ class GestureClassifier:
 
         # Train
         dataset = TensorDataset(
-            torch.FloatTensor(features),
-            torch.LongTensor(targets),
+            torch.from_numpy(features),
+            torch.from_numpy(targets.reshape(-1)).long(),
         )
         loader = DataLoader(dataset, batch_size=32, shuffle=True)
         optimizer = torch.optim.Adam(self._model.parameters(), lr=lr)
@@ -207,6 +314,7 @@ class GestureClassifier:
         accuracy = correct / total if total > 0 else 0
 
         self._model.eval()
+        self._session = None
 
         if save_path:
             self.save_model(save_path)
@@ -228,7 +336,16 @@ class GestureClassifier:
         }, path)
 
     def load_model(self, path: str | Path):
-        """Load a trained model."""
+        """Load a trained model.
+
+        ``.onnx`` files (from `ModelExporter`) are run with ONNX Runtime and
+        need the ``.labels.json`` written next to them; anything else is
+        treated as a PyTorch checkpoint from `save_model`.
+        """
+        if Path(path).suffix == ".onnx":
+            self._load_onnx(Path(path))
+            return
+
         import torch
         import torch.nn as nn
 
@@ -248,3 +365,26 @@ class GestureClassifier:
         )
         self._model.load_state_dict(checkpoint["model_state"])
         self._model.eval()
+        self._session = None
+
+    def _load_onnx(self, path: Path):
+        """Create a persistent ONNX Runtime session for `path`."""
+        import json
+
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = ort.InferenceSession(
+            str(path), options, providers=["CPUExecutionProvider"]
+        )
+
+        with open(path.with_suffix(".labels.json")) as f:
+            labels = json.load(f)
+
+        model_input = session.get_inputs()[0]
+        self._session = session
+        self._input_name = model_input.name
+        self._label_map = {int(idx): label for idx, label in labels.items()}
+        self._feature_dim = model_input.shape[1]
+        self._model = None
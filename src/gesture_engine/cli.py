@@ -216,7 +216,7 @@ def replay(
     for frame in play_fn:
         for hand in frame.hands:
             # Feed through classifier directly since we have landmarks
-            result = pipeline.classifier.classify(hand)
+            result = pipeline.classifier.classify(hand, use_cache=True)
             if result:
                 name, conf = result
                 typer.echo(f"   → {name}: {conf:.2f}")
@@ -8,6 +8,51 @@ except ImportError:
     mp = None
 
 
+def _normalize_hand(landmarks: np.ndarray) -> np.ndarray:
+    """Wrist-center and scale one hand with a single output allocation.
+
+    Squared radii come from one `einsum` (no `linalg.norm` temporaries)
+    and the scale is applied in place on the centered copy.
+    """
+    centered = landmarks - landmarks[HandDetector.WRIST]
+    max_sq = np.einsum("ij,ij->i", centered, centered).max()
+    centered *= 1.0 / (np.sqrt(max_sq) + 1e-8)
+    return centered
+
+
+# Canonical wrist-centered palm used as the alignment target:
+# wrist, index MCP, middle MCP, pinky MCP with fingers pointing up (-y)
+_PALM_INDICES = [0, 5, 9, 17]
+_CANONICAL_PALM = np.array([
+    [0.0, 0.0, 0.0],
+    [-0.12, -0.38, 0.0],
+    [0.0, -0.40, 0.0],
+    [0.20, -0.32, 0.0],
+], dtype=np.float64)
+
+
+def _align_hand(landmarks: np.ndarray) -> np.ndarray:
+    """Wrist-center, rotate to the canonical palm pose, and scale to unit size.
+
+    The rotation is the Kabsch fit of the four palm landmarks onto
+    `_CANONICAL_PALM`. Rotation and scale are folded into one 3x3 matrix
+    that is applied in a single matmul.
+    """
+    centered = landmarks.astype(np.float64) - landmarks[HandDetector.WRIST]
+    src = centered[_PALM_INDICES]
+    src = src - src.mean(axis=0)
+    tgt = _CANONICAL_PALM - _CANONICAL_PALM.mean(axis=0)
+
+    u, _, vt = np.linalg.svd(src.T @ tgt)
+    # Keep a proper rotation (no reflection)
+    d = 1.0 if np.linalg.det(vt.T @ u.T) >= 0 else -1.0
+    rotation = vt.T @ np.diag([1.0, 1.0, d]) @ u.T
+
+    max_sq = np.einsum("ij,ij->i", centered, centered).max()
+    transform = rotation / (np.sqrt(max_sq) + 1e-8)
+    return (centered @ transform.T).astype(landmarks.dtype)
+
+
 class HandDetector:
     """Extracts 21 3D hand landmarks per hand using MediaPipe Hands.
 
@@ -39,6 +84,13 @@ class HandDetector:
             )
 
         self.max_hands = max_hands
+        # Reused landmark buffers; a buffer is handed out again only after
+        # `len(self._pool)` further hands, i.e. a few frames later
+        self._pool = [
+            np.empty((self.NUM_LANDMARKS, self.LANDMARK_DIM), dtype=np.float32)
+            for _ in range(max_hands * 4)
+        ]
+        self._pool_idx = 0
         self._hands = mp.solutions.hands.Hands(
             static_image_mode=static_image_mode,
             max_num_hands=max_hands,
@@ -49,6 +101,10 @@ class HandDetector:
     def detect(self, frame_rgb: np.ndarray) -> list[np.ndarray]:
         """Detect hands and return landmark arrays.
 
+        The returned arrays are pooled buffers that get overwritten by
+        later calls. Consume them within the frame, or use `detect_copy()`
+        if they need to outlive it.
+
         Args:
             frame_rgb: RGB image as numpy array (H, W, 3), uint8.
 
@@ -62,15 +118,19 @@ class HandDetector:
             return []
 
         hands = []
+        pool = self._pool
         for hand_landmarks in results.multi_hand_landmarks:
-            landmarks = np.array(
-                [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
-                dtype=np.float32,
-            )
-            hands.append(landmarks)
+            buf = pool[self._pool_idx]
+            self._pool_idx = (self._pool_idx + 1) % len(pool)
+            buf[:] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+            hands.append(buf)
 
         return hands
 
+    def detect_copy(self, frame_rgb: np.ndarray) -> list[np.ndarray]:
+        """Like `detect()`, but returns arrays owned by the caller."""
+        return [h.copy() for h in self.detect(frame_rgb)]
+
     def detect_normalized(self, frame_rgb: np.ndarray) -> list[np.ndarray]:
         """Detect hands and return wrist-centered, scale-normalized landmarks.
 
@@ -81,15 +141,35 @@ class HandDetector:
         Returns:
             List of normalized landmark arrays, each shape (21, 3).
         """
-        raw_hands = self.detect(frame_rgb)
-        normalized = []
+        return [_normalize_hand(lm) for lm in self.detect(frame_rgb)]
 
-        for landmarks in raw_hands:
-            centered = landmarks - landmarks[self.WRIST]
-            scale = np.max(np.linalg.norm(centered, axis=1)) + 1e-8
-            normalized.append(centered / scale)
+    def detect_both(
+        self, frame_rgb: np.ndarray
+    ) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Raw and normalized landmarks from a single inference pass.
 
-        return normalized
+        Equivalent to calling `detect()` and `detect_normalized()` on the
+        same frame, but runs MediaPipe once. The raw arrays are pooled
+        buffers, as with `detect()`.
+
+        Returns:
+            (raw landmarks, normalized landmarks), index-aligned per hand.
+        """
+        raw = self.detect(frame_rgb)
+        return raw, [_normalize_hand(lm) for lm in raw]
+
+    def detect_aligned(self, frame_rgb: np.ndarray) -> list[np.ndarray]:
+        """Like `detect_normalized()`, but also rotates each hand so the palm
+        faces a canonical direction, making landmarks rotation-invariant.
+
+        Rule-based matching only uses distances and angles, which are
+        already rotation-invariant; this is mainly useful for learned
+        models trained on raw landmark positions.
+
+        Returns:
+            List of aligned landmark arrays, each shape (21, 3).
+        """
+        return [_align_hand(lm) for lm in self.detect(frame_rgb)]
 
     def close(self):
         """Release MediaPipe resources."""
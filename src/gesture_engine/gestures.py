@@ -7,7 +7,7 @@ import math
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -19,6 +19,32 @@ class FingerState(Enum):
     ANY = "any"  # don't care
 
 
+# Fingertip and PIP landmarks, thumb to pinky (thumb uses IP instead of PIP)
+_TIP_IDX = np.array([4, 8, 12, 16, 20])
+_PIP_IDX = np.array([3, 6, 10, 14, 18])
+_WRIST = 0
+
+
+def _finger_extended(landmarks: np.ndarray) -> list[bool]:
+    """Per-finger extension, thumb to pinky, in one vectorized pass.
+
+    A finger is extended when its tip is farther from the wrist than its
+    PIP joint; squared distances give the same ordering without a sqrt.
+    """
+    wrist = landmarks[_WRIST]
+    tips = landmarks[_TIP_IDX] - wrist
+    pips = landmarks[_PIP_IDX] - wrist
+    return ((tips * tips).sum(-1) > (pips * pips).sum(-1)).tolist()
+
+
+def _finger_extended_batch(landmarks: np.ndarray) -> np.ndarray:
+    """`_finger_extended` over a stack of hands: (N, 21, 3) → bool (N, 5)."""
+    wrist = landmarks[:, _WRIST, None]
+    tips = landmarks[:, _TIP_IDX] - wrist
+    pips = landmarks[:, _PIP_IDX] - wrist
+    return (tips * tips).sum(-1) > (pips * pips).sum(-1)
+
+
 @dataclass
 class GestureDefinition:
     """A gesture defined by finger states and optional geometric constraints.
@@ -40,8 +66,8 @@ class GestureDefinition:
     constraints: list[dict] = field(default_factory=list)
 
     # Landmark indices for fingertip and PIP joints
-    _FINGER_TIPS = [4, 8, 12, 16, 20]
-    _FINGER_PIPS = [3, 6, 10, 14, 18]  # thumb uses IP instead of PIP
+    _FINGER_TIPS = _TIP_IDX.tolist()
+    _FINGER_PIPS = _PIP_IDX.tolist()  # thumb uses IP instead of PIP
     _WRIST = 0
 
     def match(self, landmarks: np.ndarray) -> tuple[bool, float]:
@@ -53,17 +79,17 @@ class GestureDefinition:
         Returns:
             (matched, confidence) tuple.
         """
-        finger_states = self._get_finger_states(landmarks)
-        expected = [self.thumb, self.index, self.middle, self.ring, self.pinky]
+        extended = _finger_extended(landmarks)
+        expected = (self.thumb, self.index, self.middle, self.ring, self.pinky)
 
         matches = 0
         checked = 0
 
-        for actual, expected_state in zip(finger_states, expected):
-            if expected_state == FingerState.ANY:
+        for is_extended, expected_state in zip(extended, expected):
+            if expected_state is FingerState.ANY:
                 continue
             checked += 1
-            if actual == expected_state:
+            if is_extended == (expected_state is FingerState.EXTENDED):
                 matches += 1
 
         if checked == 0:
@@ -85,19 +111,10 @@ class GestureDefinition:
 
     def _get_finger_states(self, landmarks: np.ndarray) -> list[FingerState]:
         """Determine extension state of each finger."""
-        states = []
-        wrist = landmarks[self._WRIST]
-
-        for tip_idx, pip_idx in zip(self._FINGER_TIPS, self._FINGER_PIPS):
-            tip_dist = np.linalg.norm(landmarks[tip_idx] - wrist)
-            pip_dist = np.linalg.norm(landmarks[pip_idx] - wrist)
-
-            if tip_dist > pip_dist:
-                states.append(FingerState.EXTENDED)
-            else:
-                states.append(FingerState.CURLED)
-
-        return states
+        return [
+            FingerState.EXTENDED if ext else FingerState.CURLED
+            for ext in _finger_extended(landmarks)
+        ]
 
     def _check_constraints(self, landmarks: np.ndarray) -> float:
         """Evaluate geometric constraints. Returns score in [0, 1]."""
@@ -111,7 +128,7 @@ class GestureDefinition:
             if kind == "distance":
                 # Distance between two landmarks within a range
                 a, b = constraint["landmarks"]
-                dist = np.linalg.norm(landmarks[a] - landmarks[b])
+                dist = math.dist(landmarks[a].tolist(), landmarks[b].tolist())
                 lo, hi = constraint.get("min", 0), constraint.get("max", float("inf"))
                 scores.append(1.0 if lo <= dist <= hi else 0.0)
 
@@ -164,19 +181,86 @@ class GestureRegistry:
 
     def __init__(self):
         self._gestures: list[GestureDefinition] = []
+        self._match_fn: Optional[Callable] = None
+        # (expected, checked, n_checked, min_confidence) tables for match_batch
+        self._batch_tables: Optional[tuple[np.ndarray, ...]] = None
 
     def register(self, gesture: GestureDefinition):
         """Add a gesture definition to the registry."""
         self._gestures.append(gesture)
+        self._match_fn = None
+        self._batch_tables = None
 
     def match(
         self, landmarks: np.ndarray
     ) -> Optional[tuple[GestureDefinition, float]]:
         """Find the best matching gesture for given landmarks.
 
+        Uses the specialized matcher from `compile()`, building it on
+        first use.
+
         Returns:
             (gesture, confidence) for the best match, or None if no match.
         """
+        if self._match_fn is None:
+            self.compile()
+        return self._match_fn(landmarks)
+
+    def match_batch(
+        self, landmarks: np.ndarray
+    ) -> list[Optional[tuple[GestureDefinition, float]]]:
+        """`match` over a stack of hands, shape (N, 21, 3), in one pass.
+
+        Finger states for every hand are one vectorized call, and finger
+        confidences for every (hand, gesture) pair come from one
+        comparison against the registered gestures' expected states.
+        Geometric constraints are still evaluated per hand, only for
+        gestures that have them. Results equal ``match`` per hand.
+        """
+        landmarks = np.asarray(landmarks)
+        n = len(landmarks)
+        if not self._gestures or n == 0:
+            return [None] * n
+        if self._batch_tables is None:
+            self._build_batch_tables()
+        expected, checked, n_checked, min_conf = self._batch_tables
+
+        extended = _finger_extended_batch(landmarks)
+        agree = ((extended[:, None, :] == expected) & checked).sum(axis=-1)
+        conf = np.where(n_checked > 0, agree / np.maximum(n_checked, 1), 1.0)
+
+        for g, gesture in enumerate(self._gestures):
+            if gesture.constraints:
+                scores = [gesture._check_constraints(lm) for lm in landmarks]
+                conf[:, g] = 0.7 * conf[:, g] + 0.3 * np.array(scores)
+
+        # argmax picks the first of equal scores, as the sequential
+        # matchers keep the earliest-registered gesture on ties
+        scores = np.where(conf >= min_conf, conf, -1.0)
+        best = scores.argmax(axis=1)
+        best_conf = scores[np.arange(n), best]
+        return [
+            None if c < 0 else (self._gestures[g], c)
+            for g, c in zip(best.tolist(), best_conf.tolist())
+        ]
+
+    def _build_batch_tables(self):
+        states = [
+            (g.thumb, g.index, g.middle, g.ring, g.pinky) for g in self._gestures
+        ]
+        expected = np.array(
+            [[s is FingerState.EXTENDED for s in row] for row in states]
+        )
+        checked = np.array(
+            [[s is not FingerState.ANY for s in row] for row in states]
+        )
+        min_conf = np.array([g.min_confidence for g in self._gestures])
+        self._batch_tables = (expected, checked, checked.sum(axis=1), min_conf)
+
+    def match_interpreted(
+        self, landmarks: np.ndarray
+    ) -> Optional[tuple[GestureDefinition, float]]:
+        """Reference matcher that calls `GestureDefinition.match` per gesture."""
         best: Optional[tuple[GestureDefinition, float]] = None
 
         for gesture in self._gestures:
@@ -186,6 +270,63 @@ class GestureRegistry:
 
         return best
 
+    def compile(self):
+        """Generate a matcher specialized to the registered gestures.
+
+        Finger states are computed once per call (instead of once per
+        gesture) and each gesture's expected states and threshold are
+        inlined as constants, so the hot path is straight-line code with
+        no enum comparisons or list iteration. `register()` invalidates
+        the compiled matcher; call `compile()` again after mutating a
+        registered definition in place (this also refreshes the tables
+        behind `match_batch`).
+        """
+        self._batch_tables = None
+        ns: dict = {"_finger_extended": _finger_extended}
+        src = [
+            "def _match(lm):",
+            "    e0, e1, e2, e3, e4 = _finger_extended(lm)",
+            "    best = None",
+            "    best_conf = 0.0",
+        ]
+
+        for i, gesture in enumerate(self._gestures):
+            ns[f"_g{i}"] = gesture
+            # Bound, not inlined: the repr of a NumPy scalar or inf is not
+            # a literal the generated source could evaluate
+            ns[f"_t{i}"] = float(gesture.min_confidence)
+            expected = [
+                gesture.thumb, gesture.index, gesture.middle,
+                gesture.ring, gesture.pinky,
+            ]
+            terms = [
+                f"e{k}" if state == FingerState.EXTENDED else f"(not e{k})"
+                for k, state in enumerate(expected)
+                if state != FingerState.ANY
+            ]
+            if terms:
+                finger_conf = f"({' + '.join(terms)}) / {len(terms)}"
+            else:
+                finger_conf = "1.0"
+
+            if gesture.constraints:
+                conf = f"0.7 * {finger_conf} + 0.3 * _g{i}._check_constraints(lm)"
+            else:
+                conf = finger_conf
+
+            src.append(f"    c = {conf}")
+            src.append(
+                f"    if c >= _t{i} "
+                f"and (best is None or c > best_conf):"
+            )
+            src.append(f"        best = _g{i}")
+            src.append("        best_conf = c")
+
+        src.append("    return None if best is None else (best, best_conf)")
+
+        exec("\n".join(src), ns)
+        self._match_fn = ns["_match"]
+
     def load_from_file(self, path: str | Path):
         """Load gesture definitions from a JSON file."""
         with open(path) as f:
@@ -0,0 +1,326 @@
+"""Compiled numeric kernels for per-frame hot paths.
+
+Kernels are JIT-compiled with Numba when it is installed
+(``pip install gesture-engine[jit]``). Without Numba, each public kernel
+falls back to an equivalent vectorized NumPy implementation, so results
+are the same either way — only the per-call overhead differs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+
+def _centroids_and_sq_dists_numpy(
+    hands: np.ndarray, track_centroids: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Detection centroids and the detection × track squared-distance matrix.
+
+    Squared distances avoid the sqrt; compare them against a squared
+    threshold.
+
+    Args:
+        hands: Stacked float32 landmarks, shape (D, 21, 3).
+        track_centroids: Existing float32 track centroids, shape (T, 3).
+
+    Returns:
+        (centroids (D, 3), squared distances (D, T)).
+    """
+    centroids = hands.mean(axis=1)
+    diff = centroids[:, None, :] - track_centroids[None, :, :]
+    return centroids, np.einsum("ijk,ijk->ij", diff, diff)
+
+
+if HAS_NUMBA:
+
+    @numba.njit(
+        "Tuple((f4[:, :], f4[:, :]))(f4[:, :, ::1], f4[:, ::1])",
+        cache=True, fastmath=True,
+    )
+    def _centroids_and_sq_dists_jit(hands, track_centroids):
+        n_det, n_lm, dim = hands.shape
+        n_trk = track_centroids.shape[0]
+        centroids = np.zeros((n_det, dim), dtype=np.float32)
+        for d in range(n_det):
+            for i in range(n_lm):
+                for k in range(dim):
+                    centroids[d, k] += hands[d, i, k]
+            for k in range(dim):
+                centroids[d, k] /= n_lm
+        sq_dists = np.empty((n_det, n_trk), dtype=np.float32)
+        for d in range(n_det):
+            for t in range(n_trk):
+                acc = np.float32(0.0)
+                for k in range(dim):
+                    diff = centroids[d, k] - track_centroids[t, k]
+                    acc += diff * diff
+                sq_dists[d, t] = acc
+        return centroids, sq_dists
+
+    centroids_and_sq_dists = _centroids_and_sq_dists_jit
+else:
+    centroids_and_sq_dists = _centroids_and_sq_dists_numpy
+
+
+def _dtw_band_dists_numpy(dist: np.ndarray, window: int) -> float:
+    """Sakoe-Chiba banded DTW over precomputed point distances.
+
+    Args:
+        dist: float32 step costs, shape (N, M); ``dist[i, j]`` is the
+            distance between query point i and template point j. The
+            recurrence itself accumulates in float64.
+        window: Band half-width; cells with |i - j| > window are skipped.
+
+    Returns:
+        Accumulated path cost divided by (N + M); inf if the band never
+        reaches the final cell.
+    """
+    n, m = dist.shape
+    rows = dist.tolist()
+    inf = float("inf")
+    # Two rolling DP rows instead of the full (N+1, M+1) matrix
+    prev = [0.0] + [inf] * m
+    for i in range(1, n + 1):
+        curr = [inf] * (m + 1)
+        d_row = rows[i - 1]
+        for j in range(max(1, i - window), min(m, i + window) + 1):
+            curr[j] = d_row[j - 1] + min(prev[j], curr[j - 1], prev[j - 1])
+        prev = curr
+    return prev[m] / (n + m)
+
+
+def _dtw_band_numpy(s: np.ndarray, t: np.ndarray, window: int) -> float:
+    """Sakoe-Chiba banded DTW between two paths, normalized by n + m.
+
+    Point distances come from one vectorized pass; only the DP recurrence
+    runs in Python, over plain floats.
+
+    Args:
+        s: Query path, float32 shape (N, D), N >= 1.
+        t: Template path, float32 shape (M, D), M >= 1.
+        window: Band half-width.
+    """
+    diff = s[:, None, :].astype(np.float64) - t[None, :, :]
+    return _dtw_band_dists_numpy(np.sqrt(np.einsum("ijk,ijk->ij", diff, diff)), window)
+
+
+if HAS_NUMBA:
+
+    # No "ninf"/"nnan" fast-math flags: cells outside the band hold inf
+    @numba.njit(
+        "f8(f4[:, ::1], f4[:, ::1], i8)",
+        cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+    )
+    def _dtw_band_jit(s, t, window):
+        n, dim = s.shape
+        m = t.shape[0]
+        # Two rolling DP rows instead of the full (N+1, M+1) matrix
+        prev = np.full(m + 1, np.inf)
+        curr = np.full(m + 1, np.inf)
+        prev[0] = 0.0
+        for i in range(1, n + 1):
+            curr[:] = np.inf
+            for j in range(max(1, i - window), min(m, i + window) + 1):
+                acc = 0.0
+                for k in range(dim):
+                    diff = np.float64(s[i - 1, k]) - t[j - 1, k]
+                    acc += diff * diff
+                best = prev[j - 1]
+                if prev[j] < best:
+                    best = prev[j]
+                if curr[j - 1] < best:
+                    best = curr[j - 1]
+                curr[j] = np.sqrt(acc) + best
+            prev, curr = curr, prev
+        return prev[m] / (n + m)
+
+    # Fixed-dimension copies of _dtw_band_jit: the tracker's dimension is
+    # set at construction, so the per-cell distance is straight-line
+    # scalar code with no loop over coordinates.
+    @numba.njit(
+        "f8(f4[:, ::1], f4[:, ::1], i8)",
+        cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+    )
+    def _dtw_band_2d_jit(s, t, window):
+        n = s.shape[0]
+        m = t.shape[0]
+        prev = np.full(m + 1, np.inf)
+        curr = np.full(m + 1, np.inf)
+        prev[0] = 0.0
+        for i in range(1, n + 1):
+            curr[:] = np.inf
+            sx = np.float64(s[i - 1, 0])
+            sy = np.float64(s[i - 1, 1])
+            for j in range(max(1, i - window), min(m, i + window) + 1):
+                dx = sx - t[j - 1, 0]
+                dy = sy - t[j - 1, 1]
+                best = prev[j - 1]
+                if prev[j] < best:
+                    best = prev[j]
+                if curr[j - 1] < best:
+                    best = curr[j - 1]
+                curr[j] = np.sqrt(dx * dx + dy * dy) + best
+            prev, curr = curr, prev
+        return prev[m] / (n + m)
+
+    @numba.njit(
+        "f8(f4[:, ::1], f4[:, ::1], i8)",
+        cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+    )
+    def _dtw_band_3d_jit(s, t, window):
+        n = s.shape[0]
+        m = t.shape[0]
+        prev = np.full(m + 1, np.inf)
+        curr = np.full(m + 1, np.inf)
+        prev[0] = 0.0
+        for i in range(1, n + 1):
+            curr[:] = np.inf
+            sx = np.float64(s[i - 1, 0])
+            sy = np.float64(s[i - 1, 1])
+            sz = np.float64(s[i - 1, 2])
+            for j in range(max(1, i - window), min(m, i + window) + 1):
+                dx = sx - t[j - 1, 0]
+                dy = sy - t[j - 1, 1]
+                dz = sz - t[j - 1, 2]
+                best = prev[j - 1]
+                if prev[j] < best:
+                    best = prev[j]
+                if curr[j - 1] < best:
+                    best = curr[j - 1]
+                curr[j] = np.sqrt(dx * dx + dy * dy + dz * dz) + best
+            prev, curr = curr, prev
+        return prev[m] / (n + m)
+
+    @numba.njit(
+        "f8(f4[:, ::1], i8)",
+        cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+    )
+    def _dtw_band_dists_jit(dist, window):
+        n, m = dist.shape
+        prev = np.full(m + 1, np.inf)
+        curr = np.full(m + 1, np.inf)
+        prev[0] = 0.0
+        for i in range(1, n + 1):
+            curr[:] = np.inf
+            for j in range(max(1, i - window), min(m, i + window) + 1):
+                best = prev[j - 1]
+                if prev[j] < best:
+                    best = prev[j]
+                if curr[j - 1] < best:
+                    best = curr[j - 1]
+                curr[j] = dist[i - 1, j - 1] + best
+            prev, curr = curr, prev
+        return prev[m] / (n + m)
+
+    dtw_band = _dtw_band_jit
+    dtw_band_2d = _dtw_band_2d_jit
+    dtw_band_3d = _dtw_band_3d_jit
+    dtw_band_dists = _dtw_band_dists_jit
+else:
+    dtw_band = _dtw_band_numpy
+    dtw_band_2d = dtw_band_3d = _dtw_band_numpy
+    dtw_band_dists = _dtw_band_dists_numpy
+
+
+def _resample_path_numpy(
+    points: np.ndarray,
+    n_points: int,
+    diffs: np.ndarray | None = None,
+    seg_lengths: np.ndarray | None = None,
+) -> np.ndarray:
+    """Resample a path to `n_points` evenly spaced along its arc length.
+
+    Args:
+        points: Path, shape (N, D) with N >= 2.
+        n_points: Output length.
+        diffs: Optional precomputed ``np.diff(points, axis=0)``.
+        seg_lengths: Optional precomputed norms of `diffs`.
+
+    Returns:
+        float32 (n_points, D); every row is ``points[0]`` if the path has
+        (near) zero length.
+    """
+    if diffs is None:
+        diffs = np.diff(points, axis=0)
+    if seg_lengths is None:
+        seg_lengths = np.linalg.norm(diffs, axis=1)
+    cum_length = np.concatenate([[0], np.cumsum(seg_lengths)])
+    total = cum_length[-1]
+
+    if total < 1e-8:
+        return np.tile(points[0], (n_points, 1)).astype(np.float32, copy=False)
+
+    # Interpolate at evenly spaced arc lengths, all targets at once
+    target_lengths = np.linspace(0, total, n_points)
+    idx = np.searchsorted(cum_length, target_lengths, side="right") - 1
+    np.minimum(idx, len(points) - 2, out=idx)
+    t_param = (target_lengths - cum_length[idx]) / np.maximum(seg_lengths[idx], 1e-8)
+    return (points[idx] + t_param[:, None] * diffs[idx]).astype(np.float32)
+
+
+if HAS_NUMBA:
+
+    @numba.njit("f4[:, ::1](f4[:, ::1], i8)", cache=True)
+    def _resample_path_jit(points, n_points):
+        n, dim = points.shape
+        out = np.empty((n_points, dim), dtype=np.float32)
+        cum = np.empty(n)
+        cum[0] = 0.0
+        for i in range(1, n):
+            acc = 0.0
+            for k in range(dim):
+                d = np.float64(points[i, k]) - points[i - 1, k]
+                acc += d * d
+            cum[i] = cum[i - 1] + np.sqrt(acc)
+        total = cum[n - 1]
+
+        if total < 1e-8:
+            for r in range(n_points):
+                out[r] = points[0]
+            return out
+
+        # Targets increase monotonically, so one forward walk finds each
+        # target's segment (the searchsorted of the NumPy version)
+        step = total / (n_points - 1) if n_points > 1 else 0.0
+        seg = 0
+        for r in range(n_points):
+            target = total if r > 0 and r == n_points - 1 else r * step
+            while seg < n - 2 and cum[seg + 1] <= target:
+                seg += 1
+            length = cum[seg + 1] - cum[seg]
+            t = (target - cum[seg]) / (length if length > 1e-8 else 1e-8)
+            for k in range(dim):
+                a = np.float64(points[seg, k])
+                out[r, k] = a + t * (points[seg + 1, k] - a)
+        return out
+
+    resample_path = _resample_path_jit
+else:
+    resample_path = _resample_path_numpy
+
+
+def warmup():
+    """Run each kernel once ahead of the first frame.
+
+    Kernels with an explicit signature compile (or load from cache) at
+    import; the call makes sure any remaining first-call setup happens
+    here rather than inside the frame loop.
+    """
+    if not HAS_NUMBA:
+        return
+    dummy = np.zeros((1, 21, 3), dtype=np.float32)
+    centroids_and_sq_dists(dummy, np.zeros((1, 3), dtype=np.float32))
+    path = np.zeros((2, 2), dtype=np.float32)
+    dtw_band(path, path, 1)
+    dtw_band_2d(path, path, 1)
+    path3 = np.zeros((2, 3), dtype=np.float32)
+    dtw_band_3d(path3, path3, 1)
+    dtw_band_dists(np.zeros((2, 2), dtype=np.float32), 1)
+    resample_path(path, 4)
@@ -17,59 +17,195 @@ Tracked metrics:
 
 from __future__ import annotations
 
+import io
 import time
 import threading
+import weakref
+from bisect import bisect_left
 from collections import Counter
 from typing import Optional
 
 
+def _header(name: str, help_text: str, kind: str) -> str:
+    return f"# HELP {name} {help_text}\n# TYPE {name} {kind}\n"
+
+
+# Constant HELP/TYPE blocks, built once instead of on every scrape
+_HDR_UPTIME = _header(
+    "gesture_engine_uptime_seconds", "Time since server start", "gauge")
+_HDR_GESTURES = _header(
+    "gesture_engine_gestures_total", "Total gesture detections by name", "counter")
+_HDR_SEQUENCES = _header(
+    "gesture_engine_sequences_total", "Total sequence detections", "counter")
+_HDR_TRAJECTORIES = _header(
+    "gesture_engine_trajectories_total", "Total trajectory matches", "counter")
+_HDR_BIMANUAL = _header(
+    "gesture_engine_bimanual_total", "Total bimanual gesture detections", "counter")
+_HDR_FRAMES = _header(
+    "gesture_engine_frames_total", "Total frames processed", "counter")
+_HDR_HANDS = _header(
+    "gesture_engine_hands_detected_total",
+    "Total hands detected across all frames", "counter")
+_HDR_DETECTION_RATE = _header(
+    "gesture_engine_hand_detection_rate",
+    "Exponential moving average of hand detection", "gauge")
+_HDR_CONNECTIONS = _header(
+    "gesture_engine_active_connections", "Current WebSocket connections", "gauge")
+
+
+class _ThreadToken:
+    """Stored in a thread-local; collected when its thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_on_thread_exit(local: threading.local, owner, shard) -> None:
+    """Call ``owner._retire(shard)`` once the calling thread has exited.
+
+    Thread-local values are dropped when their thread ends, so a
+    finalizer on a token kept next to the shard fires then. The owner is
+    held weakly, so a live thread does not keep its collector alive.
+    """
+    token = local.token = _ThreadToken()
+    owner_ref = weakref.ref(owner)
+
+    def retire():
+        target = owner_ref()
+        if target is not None:
+            target._retire(shard)
+
+    weakref.finalize(token, retire)
+
+
+class _HistogramShard:
+    """Per-thread histogram state; the last bucket slot is the +Inf overflow."""
+
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, n_buckets: int):
+        self.bucket_counts = [0] * (n_buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
 class _Histogram:
-    """Simple histogram with configurable buckets."""
+    """Simple histogram with configurable buckets.
+
+    Each observation lands in exactly one bucket, found by bisection;
+    cumulative ``le`` counts are only built at render time. State is
+    sharded per thread like the collector's counters, so `observe` takes
+    no lock.
+    """
 
     def __init__(self, buckets: list[float]):
         self.buckets = sorted(buckets)
-        self.bucket_counts = [0] * len(self.buckets)
-        self.count = 0
-        self.sum = 0.0
-        self._lock = threading.Lock()
+        self._local = threading.local()
+        # The first shard holds the folded totals of exited threads
+        self._shards: list[_HistogramShard] = [_HistogramShard(len(self.buckets))]
+        self._lock = threading.RLock()  # guards the shard list, not observe
+
+    def _shard(self) -> _HistogramShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _HistogramShard(len(self.buckets))
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+            _retire_on_thread_exit(self._local, self, shard)
+        return shard
+
+    def _retire(self, shard: _HistogramShard):
+        """Fold an exited thread's shard into the base shard."""
+        with self._lock:
+            base = self._shards[0]
+            for i, c in enumerate(shard.bucket_counts):
+                base.bucket_counts[i] += c
+            base.count += shard.count
+            base.sum += shard.sum
+            self._shards.remove(shard)
 
     def observe(self, value: float):
+        shard = self._shard()
+        shard.bucket_counts[bisect_left(self.buckets, value)] += 1
+        shard.count += 1
+        shard.sum += value
+
+    @property
+    def bucket_counts(self) -> list[int]:
+        """Non-cumulative counts per bucket, followed by the +Inf overflow."""
+        totals = [0] * (len(self.buckets) + 1)
         with self._lock:
-            self.count += 1
-            self.sum += value
-            for i, b in enumerate(self.buckets):
-                if value <= b:
-                    self.bucket_counts[i] += 1
+            for shard in self._shards:
+                for i, c in enumerate(list(shard.bucket_counts)):
+                    totals[i] += c
+        return totals
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return sum(shard.count for shard in self._shards)
+
+    @property
+    def sum(self) -> float:
+        with self._lock:
+            return sum(shard.sum for shard in self._shards)
 
     def render(self, name: str, help_text: str) -> str:
         lines = [
             f"# HELP {name} {help_text}",
             f"# TYPE {name} histogram",
         ]
-        with self._lock:
-            cumulative = 0
-            for i, b in enumerate(self.buckets):
-                cumulative += self.bucket_counts[i]
-                lines.append(f'{name}_bucket{{le="{b}"}} {cumulative}')
-            lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
-            lines.append(f"{name}_sum {self.sum:.6f}")
-            lines.append(f"{name}_count {self.count}")
+        counts = self.bucket_counts
+        cumulative = 0
+        for i, b in enumerate(self.buckets):
+            cumulative += counts[i]
+            lines.append(f'{name}_bucket{{le="{b}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'{name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum {self.sum:.6f}")
+        lines.append(f"{name}_count {cumulative}")
         return "\n".join(lines)
 
 
-class MetricsCollector:
-    """Collects and exposes Prometheus metrics for GestureEngine."""
+class _MetricsShard:
+    """Per-thread counters. Only the owning thread ever writes to a shard."""
+
+    __slots__ = (
+        "gesture_counts", "gesture_id_counts", "sequence_counts",
+        "trajectory_counts", "bimanual_counts", "frames_total", "hands_total",
+    )
 
     def __init__(self):
-        self._gesture_counts: Counter = Counter()
-        self._sequence_counts: Counter = Counter()
-        self._trajectory_counts: Counter = Counter()
-        self._bimanual_counts: Counter = Counter()
-        self._frames_total = 0
-        self._hands_total = 0
+        self.gesture_counts: Counter = Counter()
+        self.gesture_id_counts: list[int] = []  # indexed by registered gesture ID
+        self.sequence_counts: Counter = Counter()
+        self.trajectory_counts: Counter = Counter()
+        self.bimanual_counts: Counter = Counter()
+        self.frames_total = 0
+        self.hands_total = 0
+
+
+class MetricsCollector:
+    """Collects and exposes Prometheus metrics for GestureEngine.
+
+    Counters are sharded per thread so the `record_*` hot path never
+    takes a lock; shards are summed when metrics are read. When a thread
+    exits, its shard is folded into a base shard, so short-lived threads
+    (e.g. executor workers) do not grow the shard list.
+    """
+
+    def __init__(self, render_ttl: float = 0.25):
+        self._local = threading.local()
+        # The first shard holds the folded totals of exited threads
+        self._shards: list[_MetricsShard] = [_MetricsShard()]
         self._active_connections = 0
         self._hand_detection_rate = 0.0
-        self._lock = threading.Lock()
+        # Guards the shard list and name registration; record_* never takes it
+        self._lock = threading.RLock()
+
+        # Gesture names interned to dense integer IDs (append-only)
+        self._gesture_ids: list[str] = []
+        self._gesture_index: dict[str, int] = {}
 
         # Latency histogram: buckets from 1ms to 100ms
         self._latency = _Histogram(
@@ -78,112 +214,191 @@ class MetricsCollector:
 
         self._start_time = time.time()
 
-    def record_gesture(self, name: str):
+        # render() output is reused until something is recorded or the TTL
+        # lapses (uptime is the only metric that changes on its own)
+        self._render_ttl = render_ttl
+        self._render_cache: Optional[tuple[float, str]] = None
+        self._dirty = True
+
+    def _shard(self) -> _MetricsShard:
+        """Return the calling thread's shard, creating it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _MetricsShard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+            _retire_on_thread_exit(self._local, self, shard)
+        return shard
+
+    def _retire(self, shard: _MetricsShard):
+        """Fold an exited thread's shard into the base shard."""
+        with self._lock:
+            base = self._shards[0]
+            base.gesture_counts.update(shard.gesture_counts)
+            base.sequence_counts.update(shard.sequence_counts)
+            base.trajectory_counts.update(shard.trajectory_counts)
+            base.bimanual_counts.update(shard.bimanual_counts)
+            ids = base.gesture_id_counts
+            if len(ids) < len(shard.gesture_id_counts):
+                ids.extend([0] * (len(shard.gesture_id_counts) - len(ids)))
+            for gesture_id, count in enumerate(shard.gesture_id_counts):
+                ids[gesture_id] += count
+            base.frames_total += shard.frames_total
+            base.hands_total += shard.hands_total
+            self._shards.remove(shard)
+
+    def _merged(self, attr: str) -> Counter:
+        """Sum one counter family across all shards."""
+        total: Counter = Counter()
         with self._lock:
-            self._gesture_counts[name] += 1
+            for shard in self._shards:
+                # dict() copies in one C call, safe against concurrent inserts
+                total.update(dict(getattr(shard, attr)))
+        return total
+
+    def _merged_gestures(self) -> Counter:
+        """Gesture counts from both the by-name and by-ID paths."""
+        total = self._merged("gesture_counts")
+        with self._lock:
+            id_counts = [list(shard.gesture_id_counts) for shard in self._shards]
+        # Names are snapshotted after the counts: an ID is registered before
+        # it is ever counted, so every counted ID has a name by now
+        names = list(self._gesture_ids)
+        for counts in id_counts:
+            for gesture_id, count in enumerate(counts):
+                if count:
+                    total[names[gesture_id]] += count
+        return total
 
-    def record_sequence(self, name: str):
+    @property
+    def _frames_total(self) -> int:
         with self._lock:
-            self._sequence_counts[name] += 1
+            return sum(shard.frames_total for shard in self._shards)
 
-    def record_trajectory(self, name: str):
+    @property
+    def _hands_total(self) -> int:
         with self._lock:
-            self._trajectory_counts[name] += 1
+            return sum(shard.hands_total for shard in self._shards)
 
-    def record_bimanual(self, name: str):
+    def register_gesture_name(self, name: str) -> int:
+        """Intern a gesture name and return its ID for `record_gesture_id`.
+
+        Registering the same name twice returns the same ID.
+        """
         with self._lock:
-            self._bimanual_counts[name] += 1
+            gesture_id = self._gesture_index.get(name)
+            if gesture_id is None:
+                gesture_id = len(self._gesture_ids)
+                self._gesture_ids.append(name)
+                self._gesture_index[name] = gesture_id
+        return gesture_id
+
+    def record_gesture(self, name: str):
+        self._shard().gesture_counts[name] += 1
+        self._dirty = True
+
+    def record_gesture_id(self, gesture_id: int):
+        """Count a gesture by the ID from `register_gesture_name`."""
+        counts = self._shard().gesture_id_counts
+        try:
+            counts[gesture_id] += 1
+        except IndexError:
+            # Names registered after this shard was sized
+            counts.extend([0] * (len(self._gesture_ids) - len(counts)))
+            counts[gesture_id] += 1
+        self._dirty = True
+
+    def record_sequence(self, name: str):
+        self._shard().sequence_counts[name] += 1
+        self._dirty = True
+
+    def record_trajectory(self, name: str):
+        self._shard().trajectory_counts[name] += 1
+        self._dirty = True
+
+    def record_bimanual(self, name: str):
+        self._shard().bimanual_counts[name] += 1
+        self._dirty = True
 
     def record_frame(self, latency_seconds: float, hands_detected: int):
-        with self._lock:
-            self._frames_total += 1
-            self._hands_total += hands_detected
+        shard = self._shard()
+        shard.frames_total += 1
+        shard.hands_total += hands_detected
         self._latency.observe(latency_seconds)
 
         # Update detection rate (exponential moving average)
         rate = 1.0 if hands_detected > 0 else 0.0
         self._hand_detection_rate = 0.95 * self._hand_detection_rate + 0.05 * rate
+        self._dirty = True
 
     def set_connections(self, count: int):
-        self._active_connections = count
+        if count != self._active_connections:
+            self._active_connections = count
+            self._dirty = True
 
     def render(self) -> str:
         """Render all metrics in Prometheus text exposition format."""
-        lines: list[str] = []
+        now = time.monotonic()
+        cached = self._render_cache
+        if (
+            cached is not None
+            and not self._dirty
+            and now - cached[0] < self._render_ttl
+        ):
+            return cached[1]
+        # Clear before reading so records made during the rebuild re-dirty it
+        self._dirty = False
+
+        buf = io.StringIO()
+        write = buf.write
 
-        # Uptime
         uptime = time.time() - self._start_time
-        lines.append("# HELP gesture_engine_uptime_seconds Time since server start")
-        lines.append("# TYPE gesture_engine_uptime_seconds gauge")
-        lines.append(f"gesture_engine_uptime_seconds {uptime:.1f}")
-        lines.append("")
-
-        # Gesture counts
-        lines.append("# HELP gesture_engine_gestures_total Total gesture detections by name")
-        lines.append("# TYPE gesture_engine_gestures_total counter")
-        with self._lock:
-            for name, count in sorted(self._gesture_counts.items()):
-                lines.append(f'gesture_engine_gestures_total{{gesture="{name}"}} {count}')
-        lines.append("")
+        write(_HDR_UPTIME)
+        write(f"gesture_engine_uptime_seconds {uptime:.1f}\n\n")
+
+        write(_HDR_GESTURES)
+        for name, count in sorted(self._merged_gestures().items()):
+            write(f'gesture_engine_gestures_total{{gesture="{name}"}} {count}\n')
+        write("\n")
+
+        write(_HDR_SEQUENCES)
+        for name, count in sorted(self._merged("sequence_counts").items()):
+            write(f'gesture_engine_sequences_total{{sequence="{name}"}} {count}\n')
+        write("\n")
+
+        write(_HDR_TRAJECTORIES)
+        for name, count in sorted(self._merged("trajectory_counts").items()):
+            write(f'gesture_engine_trajectories_total{{trajectory="{name}"}} {count}\n')
+        write("\n")
+
+        write(_HDR_BIMANUAL)
+        for name, count in sorted(self._merged("bimanual_counts").items()):
+            write(f'gesture_engine_bimanual_total{{gesture="{name}"}} {count}\n')
+        write("\n")
+
+        write(self._latency.render(
+            "gesture_engine_frame_latency_seconds",
+            "Frame processing latency in seconds"
+        ))
+        write("\n\n")
 
-        # Sequence counts
-        lines.append("# HELP gesture_engine_sequences_total Total sequence detections")
-        lines.append("# TYPE gesture_engine_sequences_total counter")
-        with self._lock:
-            for name, count in sorted(self._sequence_counts.items()):
-                lines.append(f'gesture_engine_sequences_total{{sequence="{name}"}} {count}')
-        lines.append("")
+        write(_HDR_FRAMES)
+        write(f"gesture_engine_frames_total {self._frames_total}\n\n")
 
-        # Trajectory counts
-        lines.append("# HELP gesture_engine_trajectories_total Total trajectory matches")
-        lines.append("# TYPE gesture_engine_trajectories_total counter")
-        with self._lock:
-            for name, count in sorted(self._trajectory_counts.items()):
-                lines.append(f'gesture_engine_trajectories_total{{trajectory="{name}"}} {count}')
-        lines.append("")
+        write(_HDR_HANDS)
+        write(f"gesture_engine_hands_detected_total {self._hands_total}\n\n")
 
-        # Bimanual counts
-        lines.append("# HELP gesture_engine_bimanual_total Total bimanual gesture detections")
-        lines.append("# TYPE gesture_engine_bimanual_total counter")
-        with self._lock:
-            for name, count in sorted(self._bimanual_counts.items()):
-                lines.append(f'gesture_engine_bimanual_total{{gesture="{name}"}} {count}')
-        lines.append("")
+        write(_HDR_DETECTION_RATE)
+        write(f"gesture_engine_hand_detection_rate {self._hand_detection_rate:.4f}\n\n")
 
-        # Frame latency histogram
-        lines.append(self._latency.render(
-            "gesture_engine_frame_latency_seconds",
-            "Frame processing latency in seconds"
-        ))
-        lines.append("")
-
-        # Frames total
-        lines.append("# HELP gesture_engine_frames_total Total frames processed")
-        lines.append("# TYPE gesture_engine_frames_total counter")
-        lines.append(f"gesture_engine_frames_total {self._frames_total}")
-        lines.append("")
-
-        # Hands detected
-        lines.append("# HELP gesture_engine_hands_detected_total Total hands detected across all frames")
-        lines.append("# TYPE gesture_engine_hands_detected_total counter")
-        lines.append(f"gesture_engine_hands_detected_total {self._hands_total}")
-        lines.append("")
-
-        # Hand detection rate
-        lines.append("# HELP gesture_engine_hand_detection_rate Exponential moving average of hand detection")
-        lines.append("# TYPE gesture_engine_hand_detection_rate gauge")
-        lines.append(f"gesture_engine_hand_detection_rate {self._hand_detection_rate:.4f}")
-        lines.append("")
-
-        # Active connections
-        lines.append("# HELP gesture_engine_active_connections Current WebSocket connections")
-        lines.append("# TYPE gesture_engine_active_connections gauge")
-        lines.append(f"gesture_engine_active_connections {self._active_connections}")
-        lines.append("")
-
-        return "\n".join(lines) + "\n"
+        write(_HDR_CONNECTIONS)
+        write(f"gesture_engine_active_connections {self._active_connections}\n\n")
+
+        output = buf.getvalue()
+        self._render_cache = (now, output)
+        return output
 
     @property
     def gesture_counts(self) -> dict[str, int]:
-        with self._lock:
-            return dict(self._gesture_counts)
+        return dict(self._merged_gestures())
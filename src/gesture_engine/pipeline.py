@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import time
 from collections import deque
 from dataclasses import dataclass, field
@@ -9,20 +10,22 @@ from typing import Callable, Optional
 
 import numpy as np
 
+from gesture_engine.buffers import RingBuffer, SmoothingWindow, SummingRingBuffer
 from gesture_engine.classifier import GestureClassifier
 from gesture_engine.detector import HandDetector
 from gesture_engine.gestures import GestureRegistry
+from gesture_engine.kernels import centroids_and_sq_dists, warmup as warmup_kernels
 from gesture_engine.profiler import PipelineProfiler
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureEvent:
     """A detected gesture event with metadata."""
     gesture: str
     confidence: float
     hand_index: int
     hand_id: int  # stable tracking ID across frames
-    landmarks: np.ndarray
+    landmarks: np.ndarray  # float32, shape (21, 3)
     timestamp: float
 
 
@@ -40,12 +43,13 @@ class PipelineStats:
 
 @dataclass
 class TrackedHand:
-    """A hand being tracked across frames."""
+    """A hand being tracked across frames (snapshot from `HandTracker.get_track`)."""
     hand_id: int
     landmarks: np.ndarray
     last_seen: float
     gesture_history: deque  # recent gestures for smoothing
     frames_tracked: int = 0
+    centroid: Optional[np.ndarray] = None  # cached mean of landmarks
 
 
 class HandTracker:
@@ -53,88 +57,196 @@ class HandTracker:
 
     Assigns stable IDs to hands so multi-hand gestures work properly.
     Uses centroid distance for matching — simple but effective for ≤4 hands.
+
+    Track state is stored structure-of-arrays: active tracks occupy slots
+    ``[0, active_count)`` of preallocated id, landmark, centroid, last-seen
+    and frame-count arrays, so matching reads contiguous memory and a
+    matched hand is copied into its slot instead of allocating.
     """
 
-    def __init__(self, max_distance: float = 0.3, timeout: float = 0.5):
+    def __init__(self, max_distance: float = 0.3, timeout: float = 0.5, capacity: int = 4):
         self._next_id = 0
-        self._tracked: dict[int, TrackedHand] = {}
         self._max_distance = max_distance
         self._timeout = timeout
-
-    def update(self, hands: list[np.ndarray], now: float) -> list[tuple[int, np.ndarray]]:
+        self._count = 0
+        self._slot_of: dict[int, int] = {}  # hand_id → slot
+        self._histories: dict[int, deque] = {}  # hand_id → recent gestures
+        # (last_seen, hand_id) per update; entries superseded by a later
+        # update are skipped when popped
+        self._expiry_heap: list[tuple[float, int]] = []
+        self._ids = np.empty(0, dtype=np.int64)
+        self._landmarks = np.empty((0, 21, 3), dtype=np.float32)
+        self._centroids = np.empty((0, 3), dtype=np.float32)
+        self._last_seen = np.empty(0, dtype=np.float64)
+        self._frames_tracked = np.empty(0, dtype=np.int32)
+        self._resize(max(1, capacity))
+
+    def _resize(self, capacity: int):
+        """Reallocate the slot arrays, keeping the active slots."""
+        n = self._count
+        for attr in ("_ids", "_landmarks", "_centroids", "_last_seen", "_frames_tracked"):
+            old = getattr(self, attr)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, attr, new)
+
+    def _add(self, landmarks: np.ndarray, centroid: np.ndarray, now: float) -> int:
+        """Start a new track in the next free slot. Returns its hand ID."""
+        if self._count == len(self._ids):
+            self._resize(2 * len(self._ids))
+        slot = self._count
+        hid = self._next_id
+        self._next_id += 1
+        self._ids[slot] = hid
+        self._landmarks[slot] = landmarks
+        self._centroids[slot] = centroid
+        self._last_seen[slot] = now
+        self._frames_tracked[slot] = 0
+        self._slot_of[hid] = slot
+        self._histories[hid] = deque(maxlen=10)
+        heapq.heappush(self._expiry_heap, (now, hid))
+        self._count += 1
+        return hid
+
+    def _remove(self, slot: int):
+        """Drop the track in `slot`, moving the last active track into it."""
+        hid = int(self._ids[slot])
+        last = self._count - 1
+        if slot != last:
+            for arr in (self._ids, self._landmarks, self._centroids,
+                        self._last_seen, self._frames_tracked):
+                arr[slot] = arr[last]
+            self._slot_of[int(self._ids[slot])] = slot
+        del self._slot_of[hid]
+        self._histories.pop(hid, None)
+        self._count = last
+
+    def update(
+        self, hands: list[np.ndarray] | np.ndarray, now: float
+    ) -> list[tuple[int, np.ndarray]]:
         """Match detected hands to tracked hands.
 
+        `hands` may also be a caller-owned float32 ``(K, 21, 3)`` block
+        (e.g. a reused scratch buffer); it is used as-is, with no per-hand
+        coercion or stacking (strided views are made contiguous first).
+        Track state is always copied into the tracker's own slots, but the
+        returned landmarks are views of the block, so do not overwrite it
+        while the results are in use.
+
         Returns list of (hand_id, landmarks) with stable IDs.
         """
-        # Prune stale tracks
-        stale = [hid for hid, t in self._tracked.items() if now - t.last_seen > self._timeout]
-        for hid in stale:
-            del self._tracked[hid]
-
-        if not hands:
+        # Prune stale tracks: only heap entries older than the timeout are
+        # visited, so a frame with nothing to expire costs O(1)
+        heap = self._expiry_heap
+        while heap and now - heap[0][0] > self._timeout:
+            seen, hid = heapq.heappop(heap)
+            slot = self._slot_of.get(hid)
+            if slot is not None and self._last_seen[slot] == seen:
+                self._remove(slot)
+
+        if len(hands) == 0:
             return []
 
-        # Compute centroids for new detections
-        new_centroids = [np.mean(h, axis=0) for h in hands]
-
-        # Compute centroids for existing tracks
-        tracked_ids = list(self._tracked.keys())
-        tracked_centroids = [np.mean(self._tracked[hid].landmarks, axis=0) for hid in tracked_ids]
+        if isinstance(hands, np.ndarray) and hands.dtype == np.float32:
+            # Zero-copy unless the block is a strided view
+            stacked = np.ascontiguousarray(hands)
+        else:
+            # Landmarks are float32 end-to-end; coerce once at the boundary
+            hands = [h if h.dtype == np.float32 else h.astype(np.float32) for h in hands]
+            stacked = np.stack(hands)
+        n_tracks = self._count
+        max_sq = self._max_distance ** 2
 
         # Greedy nearest-neighbor matching
         matched: list[tuple[int, np.ndarray]] = []
-        used_tracks = set()
         used_detections = set()
 
-        if tracked_centroids:
-            # Build distance matrix
-            for det_idx, det_c in enumerate(new_centroids):
-                best_dist = float("inf")
-                best_track = -1
-                for trk_idx, trk_c in enumerate(tracked_centroids):
-                    if trk_idx in used_tracks:
-                        continue
-                    dist = float(np.linalg.norm(det_c - trk_c))
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_track = trk_idx
-
-                if best_track >= 0 and best_dist < self._max_distance:
-                    hid = tracked_ids[best_track]
-                    self._tracked[hid].landmarks = hands[det_idx]
-                    self._tracked[hid].last_seen = now
-                    self._tracked[hid].frames_tracked += 1
-                    matched.append((hid, hands[det_idx]))
-                    used_tracks.add(best_track)
+        if n_tracks:
+            # Detection centroids + full detection × track squared distances
+            new_centroids, sq_dists = centroids_and_sq_dists(stacked, self._centroids[:n_tracks])
+            sq_dists[np.isnan(sq_dists)] = np.inf
+
+            for det_idx, slot in enumerate(self._assign(sq_dists, max_sq)):
+                if slot >= 0:
+                    self._landmarks[slot] = hands[det_idx]
+                    self._centroids[slot] = new_centroids[det_idx]
+                    self._last_seen[slot] = now
+                    self._frames_tracked[slot] += 1
+                    heapq.heappush(self._expiry_heap, (now, int(self._ids[slot])))
+                    matched.append((int(self._ids[slot]), hands[det_idx]))
                     used_detections.add(det_idx)
+        else:
+            new_centroids = stacked.mean(axis=1)
 
         # Create new tracks for unmatched detections
         for det_idx, lm in enumerate(hands):
             if det_idx not in used_detections:
-                hid = self._next_id
-                self._next_id += 1
-                self._tracked[hid] = TrackedHand(
-                    hand_id=hid,
-                    landmarks=lm,
-                    last_seen=now,
-                    gesture_history=deque(maxlen=10),
-                )
+                hid = self._add(lm, new_centroids[det_idx], now)
                 matched.append((hid, lm))
 
         return matched
 
+    @staticmethod
+    def _assign(sq_dists: np.ndarray, max_sq: float) -> list[int]:
+        """Track slot for each detection (-1 for none), closest pairs first.
+
+        Taking (detection, track) pairs in order of distance over the
+        whole matrix, instead of scanning detections in order, keeps an
+        early detection from taking a track that a later one is nearer
+        to — the usual cause of ID swaps when two hands pass close by.
+        """
+        n_det, n_trk = sq_dists.shape
+        assigned = [-1] * n_det
+        if n_det == 1:
+            slot = int(np.argmin(sq_dists[0]))
+            if sq_dists[0, slot] < max_sq:
+                assigned[0] = slot
+            return assigned
+
+        flat = sq_dists.ravel()
+        order = np.argsort(flat, kind="stable")
+        # Candidates under the threshold form a prefix of the sorted order
+        n_close = int(np.searchsorted(flat[order], max_sq))
+        taken = set()
+        remaining = min(n_det, n_trk)
+        for k in order[:n_close].tolist():
+            det_idx, slot = divmod(k, n_trk)
+            if assigned[det_idx] < 0 and slot not in taken:
+                assigned[det_idx] = slot
+                taken.add(slot)
+                remaining -= 1
+                if not remaining:
+                    break
+        return assigned
+
     @property
     def active_count(self) -> int:
-        return len(self._tracked)
+        return self._count
 
     def get_track(self, hand_id: int) -> Optional[TrackedHand]:
-        return self._tracked.get(hand_id)
+        """Snapshot of a track's current state, or None if not tracked."""
+        slot = self._slot_of.get(hand_id)
+        if slot is None:
+            return None
+        return TrackedHand(
+            hand_id=hand_id,
+            landmarks=self._landmarks[slot].copy(),
+            last_seen=float(self._last_seen[slot]),
+            gesture_history=self._histories[hand_id],
+            frames_tracked=int(self._frames_tracked[slot]),
+            centroid=self._centroids[slot].copy(),
+        )
 
 
 class AdaptiveThresholds:
     """Auto-adjusts per-gesture confidence thresholds based on confusion rates.
 
     Gestures that get frequently confused with others need higher thresholds.
+
+    Per-gesture state is indexed by an interned gesture ID (see
+    `gesture_id`); hot-path callers look the ID up once and use
+    `threshold_of` / `record_id`. The name-based methods remain for
+    convenience.
     """
 
     def __init__(
@@ -150,38 +262,52 @@ class AdaptiveThresholds:
         self.max_threshold = max_threshold
         self._window_size = window_size
         self._adjustment_rate = adjustment_rate
-        self._thresholds: dict[str, float] = {}
-        self._history: dict[str, deque] = {}  # gesture → recent confidences
-        self._confusion_counts: dict[str, int] = {}  # rapid switches
+        # Indexed by was_stable: unstable → raise, stable → slowly lower
+        self._steps = (adjustment_rate, -adjustment_rate * 0.1)
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._thresholds = np.empty(0, dtype=np.float64)
+        self._confusion_counts = np.empty(0, dtype=np.int64)  # rapid switches
+        self._history: list[RingBuffer] = []  # recent confidences per ID
+
+    def gesture_id(self, gesture: str) -> int:
+        """Intern `gesture`, allocating its threshold slot on first use."""
+        gid = self._ids.get(gesture)
+        if gid is None:
+            gid = self._ids[gesture] = len(self._names)
+            self._names.append(gesture)
+            self._history.append(RingBuffer(self._window_size))
+            if gid == len(self._thresholds):
+                size = max(8, 2 * gid)
+                self._thresholds = np.resize(self._thresholds, size)
+                self._confusion_counts = np.resize(self._confusion_counts, size)
+            self._thresholds[gid] = self.base_threshold
+            self._confusion_counts[gid] = 0
+        return gid
 
     def get_threshold(self, gesture: str) -> float:
-        return self._thresholds.get(gesture, self.base_threshold)
+        gid = self._ids.get(gesture)
+        return self.base_threshold if gid is None else float(self._thresholds[gid])
+
+    def threshold_of(self, gid: int) -> float:
+        return float(self._thresholds[gid])
 
     def record(self, gesture: str, confidence: float, was_stable: bool):
         """Record a classification result for threshold adaptation."""
-        if gesture not in self._history:
-            self._history[gesture] = deque(maxlen=self._window_size)
-            self._thresholds[gesture] = self.base_threshold
-
-        self._history[gesture].append(confidence)
-
-        if not was_stable:
-            # Gesture was overridden by smoothing → increase threshold
-            self._confusion_counts[gesture] = self._confusion_counts.get(gesture, 0) + 1
-            self._thresholds[gesture] = min(
-                self.max_threshold,
-                self._thresholds[gesture] + self._adjustment_rate,
-            )
-        else:
-            # Stable detection → slowly decrease threshold
-            self._thresholds[gesture] = max(
-                self.min_threshold,
-                self._thresholds[gesture] - self._adjustment_rate * 0.1,
-            )
+        self.record_id(self.gesture_id(gesture), confidence, was_stable)
+
+    def record_id(self, gid: int, confidence: float, was_stable: bool):
+        """`record` for an already-interned gesture ID."""
+        self._history[gid].append(confidence)
+        self._confusion_counts[gid] += not was_stable
+        self._thresholds[gid] = min(
+            self.max_threshold,
+            max(self.min_threshold, self._thresholds[gid] + self._steps[was_stable]),
+        )
 
     @property
     def current_thresholds(self) -> dict[str, float]:
-        return dict(self._thresholds)
+        return dict(zip(self._names, self._thresholds[:len(self._names)].tolist()))
 
 
 class GesturePipeline:
@@ -214,14 +340,24 @@ class GesturePipeline:
         self.min_confidence = min_confidence
 
         self._callbacks: list[Callable[[GestureEvent], None]] = []
-        self._history: dict[int, deque] = {}  # hand_id → recent gestures
-        self._last_triggered: dict[int, tuple[str, float]] = {}
-        self._frame_times: deque = deque(maxlen=60)
+        self._history: dict[int, SmoothingWindow] = {}  # hand_id → recent gesture IDs
+        # Gesture names interned to small ints for the smoothing windows
+        self._gesture_ids: dict[str, int] = {}
+        self._gesture_names: list[str] = []
+        # Pipeline gesture ID → AdaptiveThresholds ID, or -1 until first recorded
+        self._adaptive_ids: list[int] = []
+        # hand_id → last fired gesture / time, kept as parallel dicts so
+        # firing an event doesn't allocate a tuple
+        self._last_gesture: dict[int, str] = {}
+        self._last_time: dict[int, float] = {}
+        self._frame_times = SummingRingBuffer(60)
         self._total_frames = 0
         self._total_gestures = 0
 
         # New subsystems
         self._tracker = HandTracker() if enable_tracking else None
+        if enable_tracking:
+            warmup_kernels()  # compile before the first frame, not during it
         self._adaptive = AdaptiveThresholds(base_threshold=min_confidence) if enable_adaptive else None
         self.profiler = PipelineProfiler() if enable_profiling else PipelineProfiler()
         self.profiler.enabled = enable_profiling
@@ -232,9 +368,8 @@ class GesturePipeline:
 
     def process_frame(self, frame_rgb: np.ndarray) -> list[GestureEvent]:
         """Process a single frame and return detected gesture events."""
-        t_start = time.monotonic()
+        now = t_start = time.monotonic()
         self._total_frames += 1
-        now = time.monotonic()
 
         # Detect hands
         with self.profiler.stage("detection"):
@@ -247,89 +382,110 @@ class GesturePipeline:
             tracked = [(i, lm) for i, lm in enumerate(hands)]
 
         events = []
-
-        for hand_id, landmarks in tracked:
-            # Classify
+        if not tracked:
+            results = []
+        else:
+            # Classify every tracked hand in one batched call, when the
+            # classifier has one; `classify` alone is still enough
             with self.profiler.stage("classification"):
-                result = self.classifier.classify(landmarks)
+                classify_batch = getattr(self.classifier, "classify_batch", None)
+                if classify_batch is None:
+                    results = [self.classifier.classify(lm) for _, lm in tracked]
+                else:
+                    results = classify_batch(np.stack([lm for _, lm in tracked]))
 
+        for hand_index, ((hand_id, landmarks), result) in enumerate(zip(tracked, results)):
             if result is None:
                 continue
 
             gesture_name, confidence = result
+            gesture_id = self._gesture_ids.get(gesture_name)
+            if gesture_id is None:
+                gesture_id = self._intern_gesture(gesture_name)
 
             # Adaptive threshold
             threshold = self.min_confidence
             if self._adaptive:
-                threshold = self._adaptive.get_threshold(gesture_name)
+                adaptive_id = self._adaptive_ids[gesture_id]
+                if adaptive_id < 0:
+                    threshold = self._adaptive.base_threshold
+                else:
+                    threshold = self._adaptive.threshold_of(adaptive_id)
 
             if confidence < threshold:
                 continue
 
             # Temporal smoothing
-            if hand_id not in self._history:
-                self._history[hand_id] = deque(maxlen=self.smoothing_window)
+            history = self._history.get(hand_id)
+            if history is None:
+                history = self._history[hand_id] = SmoothingWindow(self.smoothing_window)
 
-            self._history[hand_id].append(gesture_name)
+            history.append(gesture_id)
             smoothed = self._get_smoothed_gesture(hand_id)
 
             was_stable = smoothed == gesture_name
             if self._adaptive:
-                self._adaptive.record(gesture_name, confidence, was_stable)
+                if adaptive_id < 0:
+                    # Slot allocated on first record, so thresholds only list
+                    # gestures that actually passed the confidence check
+                    adaptive_id = self._adaptive.gesture_id(gesture_name)
+                    self._adaptive_ids[gesture_id] = adaptive_id
+                self._adaptive.record_id(adaptive_id, confidence, was_stable)
 
             if smoothed is None:
                 continue
 
             # Cooldown check
-            last = self._last_triggered.get(hand_id)
-            if last and last[0] == smoothed and (now - last[1]) < self.cooldown_seconds:
+            if (
+                self._last_gesture.get(hand_id) == smoothed
+                and (now - self._last_time[hand_id]) < self.cooldown_seconds
+            ):
                 continue
 
             # Fire event
             event = GestureEvent(
                 gesture=smoothed,
                 confidence=confidence,
-                hand_index=tracked.index((hand_id, landmarks)),
+                hand_index=hand_index,
                 hand_id=hand_id,
                 landmarks=landmarks,
                 timestamp=now,
             )
 
-            self._last_triggered[hand_id] = (smoothed, now)
+            self._last_gesture[hand_id] = smoothed
+            self._last_time[hand_id] = now
             self._total_gestures += 1
             events.append(event)
 
             for cb in self._callbacks:
                 cb(event)
 
-        t_end = time.monotonic()
-        self._frame_times.append(t_end - t_start)
-
-        with self.profiler.stage("total"):
-            pass  # Just mark total frame time is tracked above
+        frame_time = time.monotonic() - t_start
+        self._frame_times.append(frame_time)
+        self.profiler.record("total", frame_time * 1000.0)
 
         return events
 
+    def _intern_gesture(self, gesture_name: str) -> int:
+        gesture_id = self._gesture_ids[gesture_name] = len(self._gesture_names)
+        self._gesture_names.append(gesture_name)
+        self._adaptive_ids.append(-1)  # AdaptiveThresholds ID, set on first record
+        return gesture_id
+
     def _get_smoothed_gesture(self, hand_id: int) -> Optional[str]:
         """Return the majority gesture in the smoothing window, or None."""
         history = self._history.get(hand_id)
         if not history or len(history) < max(1, self.smoothing_window // 2):
             return None
 
-        counts: dict[str, int] = {}
-        for g in history:
-            counts[g] = counts.get(g, 0) + 1
-
-        best = max(counts, key=counts.get)  # type: ignore
-        if counts[best] > len(history) // 2:
-            return best
-        return None
+        best = history.majority()
+        return None if best is None else self._gesture_names[best]
 
     @property
     def stats(self) -> PipelineStats:
         """Get current performance statistics."""
         if self._frame_times:
-            avg_latency = sum(self._frame_times) / len(self._frame_times)
+            avg_latency = self._frame_times.mean()
             fps = 1.0 / avg_latency if avg_latency > 0 else 0
         else:
             avg_latency = 0
@@ -348,7 +504,8 @@ class GesturePipeline:
     def reset(self):
         """Clear all state."""
         self._history.clear()
-        self._last_triggered.clear()
+        self._last_gesture.clear()
+        self._last_time.clear()
         self._frame_times.clear()
         self._total_frames = 0
         self._total_gestures = 0
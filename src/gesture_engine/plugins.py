@@ -64,11 +64,18 @@ class GesturePlugin:
         if name:
             self.name = name
         self._handlers: dict[str, list[Callable]] = {}
+        # gesture name → exact handlers followed by wildcard handlers;
+        # filled lazily, cleared when a handler is registered
+        self._dispatch: dict[str, tuple[Callable, ...]] = {}
 
     def on_gesture(self, event: PluginEvent):
         """Called when a gesture is detected."""
         # Dispatch to registered handlers
-        handlers = self._handlers.get(event.name, []) + self._handlers.get("*", [])
+        handlers = self._dispatch.get(event.name)
+        if handlers is None:
+            handlers = self._dispatch[event.name] = (
+                *self._handlers.get(event.name, ()), *self._handlers.get("*", ())
+            )
         for handler in handlers:
             try:
                 handler(event)
@@ -105,10 +112,22 @@ class GesturePlugin:
             if gesture_name not in self._handlers:
                 self._handlers[gesture_name] = []
             self._handlers[gesture_name].append(fn)
+            self._dispatch.clear()
             return fn
         return decorator
 
 
+# Base-class event hooks that do nothing; plugins that inherit them
+# unchanged are not subscribed to that event type. (on_gesture is not
+# here: the base implementation runs decorator-registered handlers.)
+_NOOP_HOOKS = frozenset({
+    GesturePlugin.on_sequence,
+    GesturePlugin.on_trajectory,
+    GesturePlugin.on_bimanual,
+    GesturePlugin.on_canvas,
+})
+
+
 class PluginManager:
     """Discovers, loads, and dispatches events to plugins.
 
@@ -126,17 +145,22 @@ class PluginManager:
 
     def __init__(self):
         self._plugins: dict[str, GesturePlugin] = {}
+        # event type → [(plugin name, bound handler)]; rebuilt lazily
+        # after register/unregister
+        self._subscribers: dict[str, list[tuple[str, Callable]]] = {}
 
     def register(self, plugin: GesturePlugin):
         """Register a plugin instance."""
         if plugin.name in self._plugins:
             logger.warning("Plugin '%s' already registered, replacing", plugin.name)
         self._plugins[plugin.name] = plugin
+        self._subscribers.clear()
         logger.info("Registered plugin: %s v%s", plugin.name, plugin.version)
 
     def unregister(self, name: str):
         """Remove a plugin."""
         plugin = self._plugins.pop(name, None)
+        self._subscribers.clear()
         if plugin:
             try:
                 plugin.on_shutdown()
@@ -222,17 +246,49 @@ class PluginManager:
             event_type: One of "gesture", "sequence", "trajectory", "bimanual", "canvas"
             event: The event to dispatch.
         """
-        method_name = f"on_{event_type}"
-        for plugin in self._plugins.values():
-            handler = getattr(plugin, method_name, None)
-            if handler:
+        for plugin_name, handler in self._subscribers_for(event_type):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(
+                    "Plugin %s on_%s error: %s", plugin_name, event_type, e
+                )
+
+    def dispatch_many(self, event_type: str, events: list[PluginEvent]):
+        """Send a burst of same-type events to all plugins.
+
+        Each plugin receives the whole burst, in order, before the next
+        plugin is called, so subscribers are resolved once per burst
+        rather than once per event. A handler error skips only the
+        event that raised it.
+        """
+        if not events:
+            return
+        for plugin_name, handler in self._subscribers_for(event_type):
+            for event in events:
                 try:
                     handler(event)
                 except Exception as e:
                     logger.error(
-                        "Plugin %s %s error: %s", plugin.name, method_name, e
+                        "Plugin %s on_%s error: %s", plugin_name, event_type, e
                     )
 
+    def _subscribers_for(self, event_type: str) -> list[tuple[str, Callable]]:
+        subscribers = self._subscribers.get(event_type)
+        if subscribers is None:
+            subscribers = self._subscribers[event_type] = self._collect_subscribers(event_type)
+        return subscribers
+
+    def _collect_subscribers(self, event_type: str) -> list[tuple[str, Callable]]:
+        """Bound `on_<event_type>` handlers of plugins that actually handle it."""
+        method_name = f"on_{event_type}"
+        subscribers = []
+        for plugin in self._plugins.values():
+            handler = getattr(plugin, method_name, None)
+            if handler and getattr(handler, "__func__", None) not in _NOOP_HOOKS:
+                subscribers.append((plugin.name, handler))
+        return subscribers
+
     @property
     def plugins(self) -> dict[str, GesturePlugin]:
         return dict(self._plugins)
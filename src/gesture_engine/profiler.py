@@ -7,10 +7,15 @@ high-resolution timing. Exposes statistics for monitoring and the web demo.
 from __future__ import annotations
 
 import time
-from collections import deque
-from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Iterator
+
+import numpy as np
+
+from gesture_engine.buffers import SummingRingBuffer
+
+# Integer nanosecond clock: exact differences at any uptime, no float
+# cancellation between two large readings. Bound once for the hot path.
+_clock_ns = time.perf_counter_ns
 
 
 @dataclass
@@ -24,6 +29,47 @@ class StageStats:
     call_count: int
 
 
+class _StageTimer:
+    """Reusable timing context for one stage.
+
+    One instance per stage name is created up front and handed out by
+    `PipelineProfiler.stage`, so a timed block costs two method calls and
+    two integer clock reads — no generator frame or dict lookup. Not reentrant:
+    nesting the same stage inside itself overwrites the start time.
+    """
+
+    __slots__ = ("buf", "count", "t0")
+
+    def __init__(self, window_size: int):
+        self.buf = SummingRingBuffer(window_size)
+        self.count = 0
+        self.t0 = 0
+
+    def __enter__(self):
+        self.t0 = _clock_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.buf.append((_clock_ns() - self.t0) * 1e-6)
+        self.count += 1
+        return False
+
+
+class _NullTimer:
+    """Shared no-op context returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
 class PipelineProfiler:
     """Instruments pipeline stages with high-resolution timing.
 
@@ -51,50 +97,64 @@ class PipelineProfiler:
 
     def __init__(self, window_size: int = 120):
         self._window_size = window_size
-        self._timings: dict[str, deque[float]] = {
-            s: deque(maxlen=window_size) for s in self.STAGES
+        self._timers: dict[str, _StageTimer] = {
+            s: _StageTimer(window_size) for s in self.STAGES
         }
-        self._counts: dict[str, int] = {s: 0 for s in self.STAGES}
         self._enabled = True
+        self._summary: dict[str, dict] | None = None
+        self._summary_calls = -1  # total call count the cached summary reflects
 
-    @contextmanager
-    def stage(self, name: str) -> Iterator[None]:
+    def _timer(self, name: str) -> _StageTimer:
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _StageTimer(self._window_size)
+        return timer
+
+    def stage(self, name: str) -> _StageTimer | _NullTimer:
         """Context manager to time a pipeline stage."""
         if not self._enabled:
-            yield
-            return
+            return _NULL_TIMER
+        return self._timer(name)
 
-        if name not in self._timings:
-            self._timings[name] = deque(maxlen=self._window_size)
-            self._counts[name] = 0
+    def record(self, name: str, elapsed_ms: float):
+        """Record an externally measured duration for a stage."""
+        if not self._enabled:
+            return
 
-        t0 = time.perf_counter()
-        yield
-        elapsed_ms = (time.perf_counter() - t0) * 1000.0
-        self._timings[name].append(elapsed_ms)
-        self._counts[name] += 1
+        timer = self._timer(name)
+        timer.buf.append(elapsed_ms)
+        timer.count += 1
 
     def get_stage_stats(self, name: str) -> StageStats | None:
         """Get stats for a specific stage."""
-        timings = self._timings.get(name)
-        if not timings:
+        timer = self._timers.get(name)
+        if timer is None or not timer.buf:
             return None
 
-        sorted_t = sorted(timings)
-        n = len(sorted_t)
+        arr = timer.buf.view()
+        n = len(arr)
+        # Selection instead of a full sort: O(n) for the one rank we need
+        k = int(n * 0.95) if n >= 2 else n - 1
         return StageStats(
             name=name,
-            avg_ms=sum(sorted_t) / n,
-            min_ms=sorted_t[0],
-            max_ms=sorted_t[-1],
-            p95_ms=sorted_t[int(n * 0.95)] if n >= 2 else sorted_t[-1],
-            call_count=self._counts.get(name, 0),
+            avg_ms=timer.buf.mean(),
+            min_ms=float(arr.min()),
+            max_ms=float(arr.max()),
+            p95_ms=float(np.partition(arr, k)[k]),
+            call_count=timer.count,
         )
 
     def summary(self) -> dict[str, dict]:
-        """Get summary of all stages as a dict."""
+        """Get summary of all stages as a dict.
+
+        The result is cached until another timing is recorded.
+        """
+        calls = sum(t.count for t in self._timers.values())
+        if self._summary is not None and calls == self._summary_calls:
+            return {k: dict(v) for k, v in self._summary.items()}
+
         result = {}
-        for name in self._timings:
+        for name in self._timers:
             stats = self.get_stage_stats(name)
             if stats and stats.call_count > 0:
                 result[name] = {
@@ -104,14 +164,16 @@ class PipelineProfiler:
                     "p95_ms": round(stats.p95_ms, 3),
                     "calls": stats.call_count,
                 }
-        return result
+        self._summary = result
+        self._summary_calls = calls
+        return {k: dict(v) for k, v in result.items()}
 
     def reset(self):
         """Clear all timing data."""
-        for d in self._timings.values():
-            d.clear()
-        for k in self._counts:
-            self._counts[k] = 0
+        for timer in self._timers.values():
+            timer.buf.clear()
+            timer.count = 0
+        self._summary = None
 
     @property
     def enabled(self) -> bool:
@@ -9,25 +9,60 @@ Record real gesture sessions for:
 from __future__ import annotations
 
 import json
+import os
+import struct
 import time
-from dataclasses import dataclass, asdict
+import zipfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
 
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _dumps(data) -> bytes:
+    """Encode `data` as JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+
+def _json_default(obj):
+    # Stdlib json fallback: landmark arrays become nested lists only here
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class RecordedFrame:
     """A single frame in a recording."""
     timestamp: float  # seconds from recording start
-    hands: list[list[list[float]]]  # list of (21, 3) landmarks as nested lists
+    hands: list[np.ndarray]  # float32 landmarks, each shape (21, 3)
     gestures: list[dict]  # [{name, confidence, hand_index}, ...]
 
 
 class GestureRecorder:
     """Records landmark data and gesture events to a file.
 
+    Frames are written into preallocated structure-of-arrays storage — a
+    padded ``(capacity, max_hands, 21, 3)`` float32 block plus timestamp
+    and hand-count arrays — which grows by doubling, so `add_frame` is a
+    few slot writes and `save_compact` slices the block as-is. For long
+    sessions the landmark block can live in a memory-mapped file instead
+    of RAM (``start(spill_to=...)``).
+
     Usage:
         recorder = GestureRecorder()
         recorder.start()
@@ -38,20 +73,80 @@ class GestureRecorder:
     """
 
     def __init__(self):
-        self._frames: list[RecordedFrame] = []
-        self._start_time: Optional[float] = None
+        self._start_ns: Optional[int] = None  # monotonic_ns() at start()
         self._recording = False
+        self._spill_path: Optional[Path] = None
+        self._allocate(0, 1)
+
+    def _allocate(self, max_frames: int, max_hands: int):
+        self._n = 0
+        self._hands = self._new_block(self._spill_path, max_frames, max_hands)
+        self._ts = np.zeros(max_frames, dtype=np.float64)
+        self._counts = np.zeros(max_frames, dtype=np.int16)
+        self._gestures: list[list[dict]] = []
+
+    @staticmethod
+    def _new_block(path: Optional[Path], frames: int, hands: int) -> np.ndarray:
+        """Zeroed landmark block, in RAM or (with `path`) memory-mapped."""
+        shape = (frames, hands, 21, 3)
+        if path is None:
+            return np.zeros(shape, dtype=np.float32)
+        return np.memmap(path, dtype=np.float32, mode="w+", shape=shape)
+
+    def _grow(self, frames: int, hands: int):
+        """Reallocate storage to at least the given frame and hand capacity."""
+        n = self._n
+        old_hands = self._hands
+        path = self._spill_path
+        if path is not None and hands == old_hands.shape[1]:
+            # Rows keep their layout: extend the file, whose new tail reads
+            # back as zeros, and remap it without copying any frames
+            old_hands.flush()
+            with open(path, "r+b") as f:
+                f.truncate(frames * old_hands[0].nbytes)
+            self._hands = np.memmap(
+                path, dtype=np.float32, mode="r+", shape=(frames,) + old_hands.shape[1:]
+            )
+        else:
+            tmp = None if path is None else path.with_name(path.name + ".tmp")
+            new_hands = self._new_block(tmp, frames, hands)
+            new_hands[:n, :old_hands.shape[1]] = old_hands[:n]
+            if tmp is not None:
+                new_hands.flush()
+                os.replace(tmp, path)
+            self._hands = new_hands
+        for attr in ("_ts", "_counts"):
+            old = getattr(self, attr)
+            new = np.zeros(frames, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, attr, new)
+
+    def start(
+        self,
+        max_frames: int = 1024,
+        max_hands: int = 2,
+        spill_to: Optional[str | Path] = None,
+    ):
+        """Begin a new recording session.
 
-    def start(self):
-        """Begin a new recording session."""
-        self._frames = []
-        self._start_time = time.monotonic()
+        Args:
+            max_frames: Initial frame capacity; storage doubles when full.
+            max_hands: Initial hands-per-frame capacity; grows on demand.
+            spill_to: Optional scratch file for the landmark block. It is
+                memory-mapped, so a long recording is paged to disk
+                instead of held in RAM. The file is overwritten and is
+                left in place after the session; `save`/`save_compact`
+                still write their own output.
+        """
+        self._spill_path = Path(spill_to) if spill_to is not None else None
+        self._allocate(max(1, max_frames), max(1, max_hands))
+        self._start_ns = time.monotonic_ns()
         self._recording = True
 
     def stop(self) -> int:
         """Stop recording. Returns number of frames captured."""
         self._recording = False
-        return len(self._frames)
+        return self._n
 
     @property
     def is_recording(self) -> bool:
@@ -59,14 +154,14 @@ class GestureRecorder:
 
     @property
     def frame_count(self) -> int:
-        return len(self._frames)
+        return self._n
 
     @property
     def duration(self) -> float:
         """Duration of recording in seconds."""
-        if not self._frames:
+        if not self._n:
             return 0.0
-        return self._frames[-1].timestamp
+        return float(self._ts[self._n - 1])
 
     def add_frame(
         self,
@@ -82,14 +177,24 @@ class GestureRecorder:
         if not self._recording:
             return
 
-        timestamp = time.monotonic() - self._start_time
-        hands_list = [h.tolist() for h in hands]
-
-        self._frames.append(RecordedFrame(
-            timestamp=timestamp,
-            hands=hands_list,
-            gestures=gestures or [],
-        ))
+        n, k = self._n, len(hands)
+        capacity, max_hands = self._hands.shape[:2]
+        if n == capacity or k > max_hands:
+            self._grow(2 * capacity if n == capacity else capacity, max(k, max_hands))
+
+        # Integer clock difference, converted to seconds once
+        self._ts[n] = (time.monotonic_ns() - self._start_ns) * 1e-9
+        # Written into our own storage, so callers may reuse their buffers
+        slot = self._hands[n]
+        for j, h in enumerate(hands):
+            slot[j] = h
+        self._counts[n] = k
+        self._gestures.append(gestures or [])
+        self._n = n + 1
+
+    def _frame_hands(self, i: int) -> list[np.ndarray]:
+        # Plain ndarray views: orjson rejects np.memmap rows from a spill file
+        return list(self._hands[i, :self._counts[i]].view(np.ndarray))
 
     def save(self, path: str | Path):
         """Save recording to JSON file."""
@@ -98,51 +203,124 @@ class GestureRecorder:
 
         data = {
             "version": 1,
-            "frame_count": len(self._frames),
+            "frame_count": self._n,
             "duration": self.duration,
-            "frames": [asdict(f) for f in self._frames],
+            "frames": [
+                {"timestamp": ts, "hands": self._frame_hands(i), "gestures": self._gestures[i]}
+                for i, ts in enumerate(self._ts[:self._n].tolist())
+            ],
         }
 
-        with open(path, "w") as f:
-            json.dump(data, f)
+        with open(path, "wb") as f:
+            f.write(_dumps(data))
+
+    def save_compact(
+        self,
+        path: str | Path,
+        compressed: bool = False,
+        dtype: np.dtype | type = np.float32,
+        compresslevel: int = 1,
+    ):
+        """Save in compact binary format (numpy npz) for smaller files.
 
-    def save_compact(self, path: str | Path):
-        """Save in compact binary format (numpy npz) for smaller files."""
+        Arrays are stored uncompressed by default: landmark floats barely
+        deflate, so compression mostly costs CPU on save and load. Pass
+        ``compressed=True`` for a DEFLATE-compressed archive; the default
+        `compresslevel` of 1 gets nearly all of the size reduction on
+        float data at a fraction of the CPU time of zlib's default (6).
+
+        ``dtype=np.float16`` halves the landmark payload at ~3 significant
+        digits of precision, which is plenty for replaying normalized
+        landmarks; loading always upcasts to float32.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float16):
+            raise ValueError(f"unsupported landmark dtype: {dtype}")
         path = Path(path).with_suffix(".npz")
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if not self._frames:
-            np.savez_compressed(
-                path,
-                timestamps=np.array([], dtype=np.float32),
-                hands=np.zeros((0, 1, 21, 3), dtype=np.float32),
-                hand_counts=np.array([], dtype=np.int32),
-                gesture_data=np.array([json.dumps([])]),
-            )
-            return
+        # Gesture info: one JSON document per frame, concatenated, with an
+        # offset table so frames decode independently
+        gesture_blob, gesture_offsets = _pack_gestures(self._gestures)
 
-        timestamps = np.array([f.timestamp for f in self._frames], dtype=np.float32)
-        # Store gesture info as JSON string
-        gesture_data = json.dumps([f.gestures for f in self._frames])
-        # Flatten hands per frame (variable number of hands, pad to max)
-        max_hands = max((len(f.hands) for f in self._frames), default=0)
-        if max_hands == 0:
-            hands_array = np.zeros((len(self._frames), 1, 21, 3), dtype=np.float32)
-            hand_counts = np.zeros(len(self._frames), dtype=np.int32)
-        else:
-            hands_array = np.zeros((len(self._frames), max_hands, 21, 3), dtype=np.float32)
-            hand_counts = np.array([len(f.hands) for f in self._frames], dtype=np.int32)
-            for i, f in enumerate(self._frames):
-                for j, h in enumerate(f.hands):
-                    hands_array[i, j] = np.array(h, dtype=np.float32)
-
-        np.savez_compressed(
-            path,
-            timestamps=timestamps,
-            hands=hands_array,
+        n = self._n
+        # Padded slots are already zero; trim padding no frame uses
+        max_hands = max(int(self._counts[:n].max()), 1) if n else 1
+        # Counts are tiny; store them in the smallest type that fits
+        hand_counts = self._counts[:n].astype(np.min_scalar_type(max_hands))
+
+        arrays = dict(
+            timestamps=self._ts[:n].astype(np.float32),
+            hands=self._hands[:n, :max_hands].astype(dtype),
             hand_counts=hand_counts,
-            gesture_data=np.array([gesture_data]),
+            gesture_blob=gesture_blob,
+            gesture_offsets=gesture_offsets,
         )
+        if compressed:
+            _savez_deflate(path, compresslevel, arrays)
+        else:
+            np.savez(path, **arrays)
+
+
+def _savez_deflate(path: Path, level: int, arrays: dict[str, np.ndarray]):
+    """`np.savez_compressed` with a chosen DEFLATE level.
+
+    NumPy always compresses at zlib's default level; this writes the same
+    archive layout (one ``<name>.npy`` member per array) through zipfile
+    so the level can be set.
+    """
+    with zipfile.ZipFile(
+        path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as zf:
+        for name, array in arrays.items():
+            with zf.open(f"{name}.npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asanyarray(array), allow_pickle=False)
+
+
+def _pack_gestures(per_frame: list[list[dict]]) -> tuple[np.ndarray, np.ndarray]:
+    """Encode each frame's gestures and concatenate them.
+
+    Returns:
+        (uint8 blob, int64 offsets of shape (F + 1,)); frame i is
+        ``blob[offsets[i]:offsets[i + 1]]``.
+    """
+    blobs = [_dumps(g) for g in per_frame]
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+    return np.frombuffer(b"".join(blobs), dtype=np.uint8), offsets
+
+
+def _memmap_npz_member(path: Path, name: str) -> Optional[np.ndarray]:
+    """Read-only memory map of array `name` inside an uncompressed npz.
+
+    ``np.load`` ignores ``mmap_mode`` for npz archives, but a stored
+    (uncompressed) member is a plain .npy file at a fixed offset in the
+    zip, so it can be mapped directly. Returns None for compressed
+    members, which have to be inflated into memory.
+    """
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as f:
+        # Local file header: 30 fixed bytes, then file name and extra field
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack("<HH", f.read(4))
+        f.seek(name_len + extra_len, 1)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    return np.memmap(
+        path, dtype=dtype, mode="r", offset=offset, shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+# Waits shorter than this are skipped: sleep() overshoots them anyway
+_MIN_SLEEP = 0.0005
 
 
 class GesturePlayer:
@@ -159,24 +337,60 @@ class GesturePlayer:
             ...
     """
 
-    def __init__(self, frames: list[RecordedFrame]):
+    def __init__(self, frames: list[RecordedFrame], hands_block: Optional[np.ndarray] = None):
         self._frames = frames
+        self._np_frames: Optional[list[RecordedFrame]] = None
+        self._hands_block = hands_block
+        self._timestamps: Optional[list[float]] = None  # play_realtime schedule
+
+    @property
+    def frames_array(self) -> Optional[np.ndarray]:
+        """Padded ``(frames, max_hands, 21, 3)`` float32 landmark block.
+
+        Available for recordings loaded from npz, where every frame's
+        hands are views into it (use ``hand_counts`` from the file, or
+        ``len(frame.hands)``, to skip padding). None for JSON recordings.
+        """
+        return self._hands_block
+
+    def _array_frames(self) -> list[RecordedFrame]:
+        """Frames with hands as float32 arrays, converted once and cached.
+
+        Frames that already hold float32 arrays (anything loaded from
+        disk) are reused as-is.
+        """
+        if self._np_frames is None:
+            self._np_frames = [
+                f if all(isinstance(h, np.ndarray) and h.dtype == np.float32 for h in f.hands)
+                else RecordedFrame(
+                    timestamp=f.timestamp,
+                    hands=[np.asarray(h, dtype=np.float32) for h in f.hands],
+                    gestures=f.gestures,
+                )
+                for f in self._frames
+            ]
+        return self._np_frames
 
     @classmethod
-    def load(cls, path: str | Path) -> GesturePlayer:
-        """Load recording from JSON file."""
+    def load(cls, path: str | Path, mmap: bool = False) -> GesturePlayer:
+        """Load recording from JSON file.
+
+        With ``mmap=True``, the landmarks of an uncompressed float32 npz
+        recording are memory-mapped instead of read, so frames are paged
+        in from disk as they are replayed. Other files load normally.
+        """
         path = Path(path)
 
         if path.suffix == ".npz":
-            return cls._load_compact(path)
+            return cls._load_compact(path, mmap)
 
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _loads(f.read())
 
         frames = [
             RecordedFrame(
                 timestamp=f["timestamp"],
-                hands=f["hands"],
+                hands=[np.array(h, dtype=np.float32) for h in f["hands"]],
                 gestures=f.get("gestures", []),
             )
             for f in data["frames"]
@@ -184,24 +398,37 @@ class GesturePlayer:
         return cls(frames)
 
     @classmethod
-    def _load_compact(cls, path: Path) -> GesturePlayer:
+    def _load_compact(cls, path: Path, mmap: bool = False) -> GesturePlayer:
         """Load from compact npz format."""
         data = np.load(path, allow_pickle=False)
         timestamps = data["timestamps"]
-        hands_array = data["hands"]
+        hands_array = _memmap_npz_member(path, "hands") if mmap else None
+        if hands_array is None or hands_array.dtype != np.float32:
+            hands_array = data["hands"].astype(np.float32, copy=False)  # float16 files upcast
         hand_counts = data["hand_counts"]
-        gesture_data = json.loads(str(data["gesture_data"][0]))
-
+        if "gesture_blob" in data:
+            raw = data["gesture_blob"].tobytes()
+            offsets = data["gesture_offsets"].tolist()
+            gesture_data = [
+                _loads(raw[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)
+            ]
+        else:  # older recordings: a single JSON string for all frames
+            gesture_data = json.loads(str(data["gesture_data"][0]))
+
+        # Scalars come out of NumPy in one tolist() each; hands stay views
+        # of the single loaded block, so no landmark data is copied here
         frames = []
-        for i in range(len(timestamps)):
-            n_hands = int(hand_counts[i])
-            hands = [hands_array[i, j].tolist() for j in range(n_hands)]
+        ts_list = timestamps.tolist()
+        for i, (ts, n_hands) in enumerate(zip(ts_list, hand_counts.tolist())):
             frames.append(RecordedFrame(
-                timestamp=float(timestamps[i]),
-                hands=hands,
+                timestamp=ts,
+                # Plain ndarray views even when mmapped: orjson rejects memmap
+                hands=list(hands_array[i, :n_hands].view(np.ndarray)),
                 gestures=gesture_data[i] if i < len(gesture_data) else [],
             ))
-        return cls(frames)
+        player = cls(frames, hands_array)
+        player._timestamps = ts_list
+        return player
 
     @property
     def frame_count(self) -> int:
@@ -214,41 +441,40 @@ class GesturePlayer:
         return self._frames[-1].timestamp
 
     def play(self) -> Iterator[RecordedFrame]:
-        """Iterate through all frames instantly (no timing)."""
-        for frame in self._frames:
-            # Convert hands back to numpy
-            frame_copy = RecordedFrame(
-                timestamp=frame.timestamp,
-                hands=[np.array(h, dtype=np.float32) for h in frame.hands] if frame.hands else [],
-                gestures=frame.gestures,
-            )
-            yield frame_copy
+        """Iterate through all frames instantly (no timing).
+
+        Frames and their float32 hand arrays are the player's own, shared
+        across passes; copy them before modifying.
+        """
+        yield from self._array_frames()
 
     def play_realtime(self, speed: float = 1.0) -> Iterator[RecordedFrame]:
         """Replay at original timing (or scaled by speed factor).
 
+        Each frame is scheduled against the start of playback rather than
+        the previous frame, so sleep overshoot does not accumulate. The
+        timestamp list is built once per player and reused across passes.
+
         Args:
             speed: Playback speed multiplier (2.0 = double speed).
         """
         if not self._frames:
             return
 
+        frames = self._array_frames()
+        if self._timestamps is None:
+            self._timestamps = [f.timestamp for f in self._frames]
+        scale = 1.0 / speed
         start = time.monotonic()
 
-        for frame in self.play():
-            target_time = frame.timestamp / speed
-            elapsed = time.monotonic() - start
-            if target_time > elapsed:
-                time.sleep(target_time - elapsed)
+        for ts, frame in zip(self._timestamps, frames):
+            wait = ts * scale - (time.monotonic() - start)
+            if wait > _MIN_SLEEP:
+                time.sleep(wait)
             yield frame
 
     def get_frame(self, index: int) -> Optional[RecordedFrame]:
         """Get a specific frame by index."""
         if 0 <= index < len(self._frames):
-            f = self._frames[index]
-            return RecordedFrame(
-                timestamp=f.timestamp,
-                hands=[np.array(h, dtype=np.float32) for h in f.hands] if f.hands else [],
-                gestures=f.gestures,
-            )
+            return self._array_frames()[index]
         return None
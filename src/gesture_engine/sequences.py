@@ -7,13 +7,15 @@ in the sequence must occur within a configurable window.
 
 from __future__ import annotations
 
+import sys
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class GestureSequence:
     """A named sequence of gestures that triggers a compound event."""
     name: str
@@ -22,7 +24,7 @@ class GestureSequence:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SequenceEvent:
     """Fired when a complete gesture sequence is detected."""
     sequence_name: str
@@ -31,6 +33,46 @@ class SequenceEvent:
     timestamp: float
 
 
+class _History:
+    """Per-hand ring of recent gesture transitions, stored as parallel arrays.
+
+    ``gestures`` and ``ts`` share one write head, so recording a
+    transition is two slot writes and no tuple.
+    """
+
+    __slots__ = ("gestures", "ts", "head", "size", "capacity")
+
+    def __init__(self, capacity: int):
+        self.gestures: list[Optional[str]] = [None] * capacity
+        self.ts = np.zeros(capacity, dtype=np.float64)
+        self.head = 0  # next write slot
+        self.size = 0
+        self.capacity = capacity
+
+    def append(self, gesture: str, timestamp: float):
+        self.gestures[self.head] = gesture
+        self.ts[self.head] = timestamp
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def __len__(self) -> int:
+        return self.size
+
+
+# feed() calls between sweeps of expired cooldown entries
+_SWEEP_INTERVAL = 1024
+
+
+def _intern(gesture: str) -> str:
+    # sys.intern rejects str subclasses (np.str_, str-based Enums); those
+    # still compare equal, just without the identity fast path
+    return sys.intern(gesture) if type(gesture) is str else gesture
+
+# (sequence, pattern newest-first, pattern length, max duration)
+_Compiled = tuple[GestureSequence, tuple[str, ...], int, float]
+
+
 class SequenceDetector:
     """Detects multi-gesture sequences from a stream of gesture names.
 
@@ -40,14 +82,30 @@ class SequenceDetector:
 
     def __init__(self, max_history: int = 20):
         self._sequences: list[GestureSequence] = []
-        self._history: dict[int, deque] = {}  # hand_index → (gesture, time)
+        # Final gesture → compiled sequences ending with it; a fed gesture
+        # can only complete those. Empty patterns are keyed under None.
+        self._by_last: dict[Optional[str], list[_Compiled]] = {}
+        self._history: dict[int, _History] = {}  # hand_index → recent transitions
         self._max_history = max_history
         self._last_triggered: dict[tuple[int, str], float] = {}
         self._cooldown = 1.0  # seconds between same sequence triggers
+        self._feeds_since_sweep = 0
 
     def register(self, sequence: GestureSequence):
         """Add a sequence to watch for."""
         self._sequences.append(sequence)
+        # Derived fields are fixed at registration so checks skip the
+        # attribute lookups; the pattern is stored newest-first and interned
+        # so comparisons against interned fed gestures hit the identity check
+        pattern = tuple(_intern(g) for g in sequence.gestures)
+        compiled = (
+            sequence,
+            pattern[::-1],
+            len(sequence.gestures),
+            sequence.max_duration,
+        )
+        last = pattern[-1] if pattern else None
+        self._by_last.setdefault(last, []).append(compiled)
 
     def feed(self, gesture: str, hand_index: int = 0, timestamp: Optional[float] = None) -> list[SequenceEvent]:
         """Feed a new gesture observation and check for completed sequences.
@@ -59,22 +117,30 @@ class SequenceDetector:
             List of triggered sequence events (usually 0 or 1).
         """
         now = timestamp if timestamp is not None else time.monotonic()
+        gesture = _intern(gesture)
 
-        if hand_index not in self._history:
-            self._history[hand_index] = deque(maxlen=self._max_history)
+        self._feeds_since_sweep += 1
+        if self._feeds_since_sweep >= _SWEEP_INTERVAL:
+            self._sweep_cooldowns(now)
 
-        history = self._history[hand_index]
+        history = self._history.get(hand_index)
+        if history is None:
+            history = self._history[hand_index] = _History(self._max_history)
 
         # Only record transitions (ignore repeated same gesture)
-        if history and history[-1][0] == gesture:
+        if history.size and history.gestures[history.head - 1] == gesture:
             return []
 
-        history.append((gesture, now))
+        history.append(gesture, now)
 
-        # Check sequences
+        # Check only sequences that end with this gesture
         events = []
-        for seq in self._sequences:
-            if self._check_sequence(seq, history, hand_index, now):
+        candidates = self._by_last.get(gesture, ())
+        if None in self._by_last:
+            candidates = [*candidates, *self._by_last[None]]
+        for compiled in candidates:
+            if self._check_sequence(compiled, history, hand_index, now):
+                seq = compiled[0]
                 event = SequenceEvent(
                     sequence_name=seq.name,
                     gestures=list(seq.gestures),
@@ -85,10 +151,10 @@ class SequenceDetector:
 
         return events
 
-    def _check_sequence(self, seq: GestureSequence, history: deque, hand_index: int, now: float) -> bool:
+    def _check_sequence(self, compiled: _Compiled, history: _History, hand_index: int, now: float) -> bool:
         """Check if the tail of history matches a sequence pattern."""
-        pattern = seq.gestures
-        if len(history) < len(pattern):
+        seq, newest_first, k, max_duration = compiled
+        if history.size < k:
             return False
 
         # Cooldown
@@ -98,21 +164,34 @@ class SequenceDetector:
             if now - last < self._cooldown:
                 return False
 
-        # Check last N entries match pattern
-        tail = list(history)[-len(pattern):]
-        for (gesture, _ts), expected in zip(tail, pattern):
-            if gesture != expected:
+        # Check last N entries match pattern, newest first, stopping at the
+        # first mismatch
+        gestures, head, cap = history.gestures, history.head, history.capacity
+        for offset, expected in enumerate(newest_first, 1):
+            if gestures[(head - offset) % cap] != expected:
                 return False
 
-        # Check duration constraint
-        duration = tail[-1][1] - tail[0][1]
-        if duration > seq.max_duration:
+        # Check duration constraint (an empty pattern spans the whole history)
+        first = (head - (k or history.size)) % cap
+        duration = float(history.ts[head - 1] - history.ts[first])
+        if duration > max_duration:
             return False
 
         self._last_match_duration = duration
         self._last_triggered[key] = now
         return True
 
+    def _sweep_cooldowns(self, now: float):
+        """Drop cooldown entries far too old to block anything.
+
+        Keeps `_last_triggered` bounded when many hand indices come and go.
+        """
+        self._feeds_since_sweep = 0
+        horizon = now - self._cooldown * 10
+        self._last_triggered = {
+            key: t for key, t in self._last_triggered.items() if t >= horizon
+        }
+
     def reset(self, hand_index: Optional[int] = None):
         """Clear history for one or all hands."""
         if hand_index is not None:
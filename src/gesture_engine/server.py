@@ -23,7 +23,12 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import mimetypes
+import queue
+import threading
 import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -31,7 +36,7 @@ import numpy as np
 
 try:
     from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-    from fastapi.responses import FileResponse, HTMLResponse, PlainTextResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
     _HAS_FASTAPI = True
 except ImportError:
     _HAS_FASTAPI = False
@@ -44,6 +49,17 @@ try:
 except ImportError:
     cv2 = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from gesture_engine.buffers import SummingRingBuffer
 from gesture_engine.classifier import GestureClassifier
 from gesture_engine.detector import HandDetector
 from gesture_engine.gestures import GestureRegistry
@@ -56,14 +72,124 @@ from gesture_engine.metrics import MetricsCollector
 
 logger = logging.getLogger("gesture_engine.server")
 
-app = FastAPI(title="GestureEngine", version="0.4.0")
+
+def _numpy_default(obj):
+    # Encoders without native NumPy support (stdlib json, msgpack)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _dumps(message: dict) -> bytes:
+    """Encode a WebSocket message as UTF-8 JSON bytes.
+
+    Messages go out as binary frames, so the encoded bytes are sent
+    as-is instead of round-tripping through a str.
+    """
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(message, separators=(",", ":"), default=_numpy_default).encode()
+
+
+def _parse_client_message(msg: str) -> dict:
+    """Decode an inbound client message; malformed input yields {}.
+
+    Clients only send small control messages (ping, clear, ...), so a bad
+    one is ignored rather than tearing down the connection.
+    """
+    try:
+        data = orjson.loads(msg) if orjson is not None else json.loads(msg)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _encode(message: dict, fmt: str) -> bytes:
+    """Encode a message in a client's negotiated wire format."""
+    if fmt == "msgpack":
+        return msgpack.packb(message, default=_numpy_default)
+    return _dumps(message)
+
+
+WIRE_FORMATS = ("json", "msgpack") if msgpack is not None else ("json",)
+
+
+class _FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through `_dumps` (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return _dumps(content)
+
+
+app = FastAPI(title="GestureEngine", version="0.4.0", default_response_class=_FastJSONResponse)
 
 # --- State ---
 
+OUTBOX_SIZE = 32
+SEND_TIMEOUT = 0.5  # seconds; a client whose send stalls longer is dropped
+
+
+@dataclass(eq=False)
+class Client:
+    """A connected WebSocket plus its outbound message buffer.
+
+    Producers call `push` and never await the network; the connection's
+    writer task drains `outbox`. When a client falls behind, the oldest
+    queued messages are dropped. `format` is the negotiated wire format
+    (see `WIRE_FORMATS`).
+    """
+    ws: WebSocket
+    outbox: deque = field(default_factory=lambda: deque(maxlen=OUTBOX_SIZE))
+    wakeup: Optional[asyncio.Future] = None
+    format: str = "json"
+
+    def push(self, payload: bytes):
+        self.outbox.append(payload)
+        if self.wakeup is not None and not self.wakeup.done():
+            self.wakeup.set_result(None)
+
+    def send(self, message: dict):
+        self.push(_encode(message, self.format))
+
+    def negotiate(self, requested) -> str:
+        """Switch to `requested` if supported; the reply uses the result."""
+        if requested in WIRE_FORMATS:
+            self.format = requested
+        self.send({"type": "format", "format": self.format, "available": list(WIRE_FORMATS)})
+        return self.format
+
+    async def run_writer(self, clients: set[Client]):
+        """Send queued payloads until a send fails or stalls, or the task is cancelled."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                while not self.outbox:
+                    self.wakeup = loop.create_future()
+                    await self.wakeup
+                await asyncio.wait_for(self.ws.send_bytes(self.outbox.popleft()), SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.info(f"Dropping client: send stalled for over {SEND_TIMEOUT}s")
+            clients.discard(self)
+        except Exception as e:
+            logger.debug(f"WebSocket send failed: {e}")
+            clients.discard(self)
+        finally:
+            self.wakeup = None
+
+
 class ServerState:
+    __slots__ = (
+        "clients", "canvas_clients", "detector", "classifier", "sequence_detector",
+        "trajectory_tracker", "bimanual_detector", "drawing_canvas", "plugin_manager",
+        "metrics", "capture", "running", "fps", "latency_ms", "total_gestures",
+        "last_gesture", "gesture_heatmap", "_connected_key", "_connected",
+    )
+
     def __init__(self):
-        self.clients: set[WebSocket] = set()
-        self.canvas_clients: set[WebSocket] = set()
+        self.clients: set[Client] = set()
+        self.canvas_clients: set[Client] = set()
         self.detector: Optional[HandDetector] = None
         self.classifier: Optional[GestureClassifier] = None
         self.sequence_detector: Optional[SequenceDetector] = None
@@ -78,7 +204,35 @@ class ServerState:
         self.latency_ms = 0.0
         self.total_gestures = 0
         self.last_gesture: Optional[dict] = None
-        self.gesture_heatmap: dict[str, int] = {}
+        self.gesture_heatmap: Counter[str] = Counter()
+        self._connected_key: Optional[tuple] = None
+        self._connected: dict[str, bytes] = {}
+
+    def connected_payload(self, fmt: str = "json") -> bytes:
+        """Encoded `connected` handshake for a new client.
+
+        Cached per wire format and rebuilt only when the classifier or
+        trajectory tracker is replaced or gains definitions (e.g. from a
+        plugin), so connecting does not re-walk and re-encode the lists.
+        """
+        registry = self.classifier._registry if self.classifier else None
+        tracker = self.trajectory_tracker
+        key = (
+            id(registry), len(registry) if registry is not None else 0,
+            id(tracker), len(tracker.templates) if tracker is not None else 0,
+        )
+        if key != self._connected_key:
+            self._connected_key = key
+            self._connected = {}
+        payload = self._connected.get(fmt)
+        if payload is None:
+            payload = self._connected[fmt] = _encode({
+                "type": "connected",
+                "gestures": [g.name for g in registry] if registry is not None else [],
+                "trajectories": [t.name for t in tracker.templates] if tracker is not None else [],
+                "formats": list(WIRE_FORMATS),
+            }, fmt)
+        return payload
 
 state = ServerState()
 
@@ -88,27 +242,52 @@ state = ServerState()
 WEB_DEMO_DIR = Path(__file__).parent.parent.parent / "examples" / "web_demo"
 
 
+_static_files: Optional[dict[str, Response]] = None
+
+
+def _static(name: str) -> Optional[Response]:
+    """Preloaded response for a file in WEB_DEMO_DIR, or None.
+
+    The demo is a handful of small files, so they are read into memory
+    on first use and served from there instead of hitting the filesystem
+    on every request. Restart the server to pick up edits.
+    """
+    global _static_files
+    if _static_files is None:
+        files = {}
+        if WEB_DEMO_DIR.is_dir():
+            for path in WEB_DEMO_DIR.iterdir():
+                if path.is_file():
+                    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                    files[path.name] = (path.read_bytes(), media_type)
+        _static_files = files
+    entry = _static_files.get(name)
+    if entry is None:
+        return None
+    return Response(content=entry[0], media_type=entry[1])
+
+
 @app.get("/")
 async def index():
-    index_path = WEB_DEMO_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    response = _static("index.html")
+    if response is not None:
+        return response
     return HTMLResponse("<h1>GestureEngine Server</h1><p>Web demo not found.</p>")
 
 
 @app.get("/canvas")
 async def canvas_page():
-    path = WEB_DEMO_DIR / "canvas.html"
-    if path.exists():
-        return FileResponse(path)
+    response = _static("canvas.html")
+    if response is not None:
+        return response
     return HTMLResponse("<h1>Canvas not found</h1>", status_code=404)
 
 
 @app.get("/demo/{filename}")
 async def demo_files(filename: str):
-    file_path = WEB_DEMO_DIR / filename
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    response = _static(filename)
+    if response is not None:
+        return response
     return HTMLResponse("Not found", status_code=404)
 
 
@@ -183,32 +362,33 @@ async def metrics():
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await ws.accept()
-    state.clients.add(ws)
+    client = Client(ws)
+    writer = asyncio.create_task(client.run_writer(state.clients))
+    state.clients.add(client)
     logger.info(f"Client connected ({len(state.clients)} total)")
 
     try:
-        await ws.send_json({
-            "type": "connected",
-            "gestures": [g.name for g in state.classifier._registry] if state.classifier else [],
-            "trajectories": [t.name for t in state.trajectory_tracker.templates] if state.trajectory_tracker else [],
-        })
+        client.push(state.connected_payload(client.format))
 
-        while True:
+        while not writer.done():
             try:
                 msg = await asyncio.wait_for(ws.receive_text(), timeout=30)
-                data = json.loads(msg)
+                data = _parse_client_message(msg)
                 if data.get("type") == "ping":
-                    await ws.send_json({"type": "pong", "server_time": time.time()})
+                    client.send({"type": "pong", "server_time": time.time()})
                 elif data.get("type") == "get_heatmap":
-                    await ws.send_json({"type": "heatmap", "data": state.gesture_heatmap})
+                    client.send({"type": "heatmap", "data": state.gesture_heatmap})
+                elif data.get("type") == "set_format":
+                    client.negotiate(data.get("format"))
             except asyncio.TimeoutError:
-                await ws.send_json({"type": "ping"})
+                client.send({"type": "ping"})
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.debug(f"WebSocket error: {e}")
     finally:
-        state.clients.discard(ws)
+        writer.cancel()
+        state.clients.discard(client)
         logger.info(f"Client disconnected ({len(state.clients)} total)")
 
 
@@ -217,67 +397,166 @@ async def websocket_endpoint(ws: WebSocket):
 @app.websocket("/ws/canvas")
 async def canvas_websocket(ws: WebSocket):
     await ws.accept()
-    state.canvas_clients.add(ws)
+    client = Client(ws)
+    writer = asyncio.create_task(client.run_writer(state.canvas_clients))
+    state.canvas_clients.add(client)
     logger.info(f"Canvas client connected ({len(state.canvas_clients)} total)")
 
     try:
         # Send full canvas state for sync
         if state.drawing_canvas:
-            await ws.send_json({
+            client.send({
                 "type": "canvas_sync",
                 "commands": state.drawing_canvas.get_full_state(),
             })
 
-        while True:
+        while not writer.done():
             try:
                 msg = await asyncio.wait_for(ws.receive_text(), timeout=30)
-                data = json.loads(msg)
+                data = _parse_client_message(msg)
                 if data.get("type") == "ping":
-                    await ws.send_json({"type": "pong"})
+                    client.send({"type": "pong"})
+                elif data.get("type") == "set_format":
+                    client.negotiate(data.get("format"))
                 elif data.get("type") == "clear":
                     if state.drawing_canvas:
                         state.drawing_canvas.clear()
-                        await broadcast_canvas({"type": "canvas_commands", "commands": [{"type": "clear"}]})
+                        broadcast_canvas({"type": "canvas_commands", "commands": [{"type": "clear"}]})
             except asyncio.TimeoutError:
-                await ws.send_json({"type": "ping"})
+                client.send({"type": "ping"})
     except WebSocketDisconnect:
         pass
     except Exception as e:
         logger.debug(f"Canvas WS error: {e}")
     finally:
-        state.canvas_clients.discard(ws)
+        writer.cancel()
+        state.canvas_clients.discard(client)
 
 
-async def broadcast(message: dict):
-    """Send message to all gesture clients."""
-    if not state.clients:
+def _fan_out(clients: set[Client], message: dict):
+    """Queue one encoded payload on every client's outbox.
+
+    Encoding happens once per wire format in use; delivery is left to each
+    connection's writer task, so a slow client never delays the caller or
+    the other clients.
+    """
+    if not clients:
         return
-    dead = set()
-    payload = json.dumps(message)
-    for ws in state.clients:
-        try:
-            await ws.send_text(payload)
-        except Exception:
-            dead.add(ws)
-    state.clients -= dead
+    payloads: dict[str, bytes] = {}
+    for client in clients:
+        payload = payloads.get(client.format)
+        if payload is None:
+            payload = payloads[client.format] = _encode(message, client.format)
+        client.push(payload)
+
+
+def broadcast(message: dict):
+    """Send message to all gesture clients."""
+    _fan_out(state.clients, message)
 
 
-async def broadcast_canvas(message: dict):
+def broadcast_canvas(message: dict):
     """Send message to all canvas clients."""
-    if not state.canvas_clients:
-        return
-    dead = set()
-    payload = json.dumps(message)
-    for ws in state.canvas_clients:
-        try:
-            await ws.send_text(payload)
-        except Exception:
-            dead.add(ws)
-    state.canvas_clients -= dead
+    _fan_out(state.canvas_clients, message)
 
 
 # --- Camera capture loop ---
 
+class FrameGrabber:
+    """Reads and color-converts camera frames on a background thread.
+
+    `capture.read()` and the BGR→RGB conversion are blocking C calls; a
+    daemon thread runs them and hands ready RGB frames over through a
+    small bounded queue, so the event loop only waits on `get`.
+
+    Frames wider than `max_width` are first downscaled (aspect ratio
+    kept) so both the color conversion and the detector touch fewer
+    bytes. MediaPipe reports landmarks normalized to the image size, so
+    downscaling does not change their coordinates.
+
+    Conversion writes into a rotating pool of preallocated RGB buffers,
+    one more than can be queued or held by the consumer, so a buffer is
+    never overwritten while still in use and steady-state capture does
+    not allocate a new frame each time.
+    """
+
+    def __init__(
+        self,
+        capture,
+        depth: int = 2,
+        max_read_failures: int = 100,
+        max_width: Optional[int] = 640,
+    ):
+        self._capture = capture
+        self._max_read_failures = max_read_failures
+        self._max_width = max_width
+        self._small: Optional[np.ndarray] = None
+        self._frames: queue.Queue = queue.Queue(maxsize=depth)
+        self._pool: list[np.ndarray] = []
+        self._pool_size = depth + 2
+        self._next_buf = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+    @property
+    def alive(self) -> bool:
+        """False once the thread has stopped (camera gone or `stop` called)."""
+        return self._thread.is_alive()
+
+    def get(self, timeout: float = 0.5) -> Optional[np.ndarray]:
+        """Next RGB frame, or None if none arrived within `timeout`."""
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _run(self):
+        failures = 0
+        while not self._stop.is_set():
+            ret, frame = self._capture.read()
+            if not ret:
+                failures += 1
+                if failures >= self._max_read_failures:
+                    logger.error(f"Camera read failed {failures} times in a row, stopping capture")
+                    return
+                time.sleep(0.01)
+                continue
+            failures = 0
+            frame = self._downscale(frame)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._buffer_for(frame))
+            # Block while the consumer is behind, but wake up to check for stop
+            while not self._stop.is_set():
+                try:
+                    self._frames.put(frame_rgb, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        h, w = frame.shape[:2]
+        if self._max_width is None or w <= self._max_width:
+            return frame
+        size = (self._max_width, max(1, round(h * self._max_width / w)))
+        if self._small is None or self._small.shape[1::-1] != size:
+            self._small = np.empty((size[1], size[0]) + frame.shape[2:], dtype=frame.dtype)
+        # Converted right away into a pooled buffer, so one scratch frame suffices
+        return cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+
+    def _buffer_for(self, frame: np.ndarray) -> np.ndarray:
+        if not self._pool or self._pool[0].shape != frame.shape:
+            self._pool = [np.empty_like(frame) for _ in range(self._pool_size)]
+        buf = self._pool[self._next_buf]
+        self._next_buf = (self._next_buf + 1) % self._pool_size
+        return buf
+
+
 async def capture_loop():
     """Main loop: capture frames, detect gestures, broadcast events."""
     if cv2 is None:
@@ -291,6 +570,8 @@ async def capture_loop():
         logger.error("Could not open camera")
         return
 
+    cv2.setNumThreads(2)
+
     state.detector = HandDetector(max_hands=2)
     state.classifier = GestureClassifier()
     state.sequence_detector = SequenceDetector.with_defaults()
@@ -310,30 +591,44 @@ async def capture_loop():
 
     state.running = True
 
-    frame_times = []
+    # Intern known gesture names so the per-frame metric update is a list index
+    gesture_ids = {
+        g.name: state.metrics.register_gesture_name(g.name)
+        for g in state.classifier._registry
+    }
+
+    frame_times = SummingRingBuffer(30)
     last_gestures: dict[int, tuple[str, float]] = {}
     cooldown = 0.3
+    stats_interval = 0.5  # seconds; at most 2 stats messages per second
+    last_stats_time = float("-inf")
+    last_stats: Optional[tuple] = None
+
+    loop = asyncio.get_running_loop()
+    grabber = FrameGrabber(state.capture)
+    grabber.start()
 
     try:
         while state.running:
-            t_start = time.monotonic()
-
-            ret, frame = state.capture.read()
-            if not ret:
-                await asyncio.sleep(0.01)
+            frame_rgb = await loop.run_in_executor(None, grabber.get)
+            if frame_rgb is None:
+                if not grabber.alive:
+                    break
                 continue
 
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            t_start = time.monotonic()
 
             # Detect hands (raw for position tracking, normalized for gesture classification)
-            raw_hands = state.detector.detect(frame_rgb)
-            hands = state.detector.detect_normalized(frame_rgb)
+            raw_hands, hands = state.detector.detect_both(frame_rgb)
 
             now = time.monotonic()
+            ts_wall = time.time()  # one wall-clock read shared by this frame's events
             tracked_pairs: list[tuple[int, np.ndarray]] = []
+            heatmap_hits: list[str] = []
 
-            for hand_idx, landmarks in enumerate(hands):
-                result = state.classifier.classify(landmarks)
+            results = state.classifier.classify_batch(np.stack(hands)) if hands else []
+
+            for hand_idx, (landmarks, result) in enumerate(zip(hands, results)):
                 if result is None:
                     continue
 
@@ -347,19 +642,23 @@ async def capture_loop():
 
                 last_gestures[hand_idx] = (gesture_name, now)
                 state.total_gestures += 1
-                state.gesture_heatmap[gesture_name] = state.gesture_heatmap.get(gesture_name, 0) + 1
-                state.metrics.record_gesture(gesture_name)
+                heatmap_hits.append(gesture_name)
+                gesture_id = gesture_ids.get(gesture_name)
+                if gesture_id is not None:
+                    state.metrics.record_gesture_id(gesture_id)
+                else:
+                    state.metrics.record_gesture(gesture_name)
 
                 event = {
                     "type": "gesture",
                     "gesture": gesture_name,
                     "confidence": round(confidence, 3),
                     "hand_index": hand_idx,
-                    "timestamp": time.time(),
+                    "timestamp": ts_wall,
                     "latency_ms": round(state.latency_ms, 1),
                 }
                 state.last_gesture = event
-                await broadcast(event)
+                broadcast(event)
 
                 # Plugin dispatch
                 if state.plugin_manager:
@@ -371,6 +670,7 @@ async def capture_loop():
 
                 # Sequences
                 seq_events = state.sequence_detector.feed(gesture_name, hand_idx, now)
+                seq_plugin_events = []
                 for se in seq_events:
                     state.metrics.record_sequence(se.sequence_name)
                     seq_msg = {
@@ -378,37 +678,39 @@ async def capture_loop():
                         "sequence": se.sequence_name,
                         "gestures": se.gestures,
                         "duration": round(se.duration, 3),
-                        "timestamp": time.time(),
+                        "timestamp": ts_wall,
                     }
-                    await broadcast(seq_msg)
+                    broadcast(seq_msg)
                     if state.plugin_manager:
-                        state.plugin_manager.dispatch("sequence", PluginEvent(
+                        seq_plugin_events.append(PluginEvent(
                             type="sequence", name=se.sequence_name,
                             data={"gestures": se.gestures, "duration": se.duration},
                             timestamp=now,
                         ))
+                if seq_plugin_events:
+                    state.plugin_manager.dispatch_many("sequence", seq_plugin_events)
 
                 # Trajectory tracking
                 if state.trajectory_tracker and hand_idx < len(raw_hands):
                     traj_events = state.trajectory_tracker.update(hand_idx, raw_hands[hand_idx], now)
                     for te in traj_events:
                         state.metrics.record_trajectory(te.name)
-                        state.gesture_heatmap[f"traj:{te.name}"] = state.gesture_heatmap.get(f"traj:{te.name}", 0) + 1
+                        heatmap_hits.append(f"traj:{te.name}")
                         traj_msg = {
                             "type": "trajectory",
                             "name": te.name,
                             "score": round(te.score, 3),
                             "hand_id": te.hand_id,
                             "duration": round(te.duration, 3),
-                            "timestamp": time.time(),
+                            "timestamp": ts_wall,
                         }
-                        await broadcast(traj_msg)
+                        broadcast(traj_msg)
 
                 # Canvas drawing (use raw landmarks for position)
                 if state.drawing_canvas and hand_idx < len(raw_hands):
                     draw_cmds = state.drawing_canvas.update(raw_hands[hand_idx], gesture_name, now)
                     if draw_cmds:
-                        await broadcast_canvas({
+                        broadcast_canvas({
                             "type": "canvas_commands",
                             "commands": [cmd.to_dict() for cmd in draw_cmds],
                         })
@@ -418,40 +720,43 @@ async def capture_loop():
                 bi_events = state.bimanual_detector.update(tracked_pairs, now)
                 for be in bi_events:
                     state.metrics.record_bimanual(be.gesture)
-                    state.gesture_heatmap[f"bi:{be.gesture}"] = state.gesture_heatmap.get(f"bi:{be.gesture}", 0) + 1
+                    heatmap_hits.append(f"bi:{be.gesture}")
                     bi_msg = {
                         "type": "bimanual",
                         "gesture": be.gesture,
                         "value": round(be.value, 4),
                         "confidence": round(be.confidence, 3),
-                        "timestamp": time.time(),
+                        "timestamp": ts_wall,
                     }
-                    await broadcast(bi_msg)
+                    broadcast(bi_msg)
+
+            if heatmap_hits:
+                state.gesture_heatmap.update(heatmap_hits)
 
             t_end = time.monotonic()
             frame_latency = t_end - t_start
             frame_times.append(frame_latency)
-            if len(frame_times) > 30:
-                frame_times = frame_times[-30:]
 
-            avg = sum(frame_times) / len(frame_times)
+            avg = frame_times.mean()
             state.fps = 1.0 / avg if avg > 0 else 0
             state.latency_ms = avg * 1000
             state.metrics.record_frame(frame_latency, len(hands))
 
-            # Broadcast stats periodically
-            if len(frame_times) % 10 == 0:
-                await broadcast({
-                    "type": "stats",
-                    "fps": round(state.fps, 1),
-                    "latency_ms": round(state.latency_ms, 1),
-                    "hands_detected": len(hands),
-                })
-
-            await asyncio.sleep(0.001)
+            # Broadcast stats at a capped rate, and only when they changed
+            if t_end - last_stats_time >= stats_interval:
+                stats = (round(state.fps, 1), round(state.latency_ms, 1), len(hands))
+                if stats != last_stats:
+                    last_stats, last_stats_time = stats, t_end
+                    broadcast({
+                        "type": "stats",
+                        "fps": stats[0],
+                        "latency_ms": stats[1],
+                        "hands_detected": stats[2],
+                    })
 
     finally:
         state.running = False
+        grabber.stop()
         if state.capture:
             state.capture.release()
         if state.detector:
@@ -473,6 +778,14 @@ async def shutdown():
 
 # --- CLI entry point ---
 
+def _available(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
 def main():
     import argparse
     import uvicorn
@@ -483,7 +796,27 @@ def main():
     parser.add_argument("--log-level", default="info")
     args = parser.parse_args()
 
-    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level)
+    # uvloop/httptools ship with uvicorn[standard]; fall back to the stdlib
+    # loop and h11 where they are missing (e.g. uvloop on Windows)
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    ws = "websockets" if _available("websockets") else "auto"
+    logger.info(f"Using {loop} event loop, {http} HTTP parser, {ws} WebSockets")
+
+    ws_options = {"ws_max_size": 1 << 20}
+    if ws == "websockets":
+        # Messages are small and frequent: compression costs more CPU than
+        # it saves, and a dead peer should be noticed within ~30 s
+        ws_options.update(
+            ws_per_message_deflate=False,
+            ws_ping_interval=20.0,
+            ws_ping_timeout=10.0,
+        )
+
+    uvicorn.run(
+        app, host=args.host, port=args.port, log_level=args.log_level,
+        loop=loop, http=http, ws=ws, **ws_options,
+    )
 
 
 if __name__ == "__main__":
@@ -21,12 +21,20 @@ from __future__ import annotations
 
 import math
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 
+from gesture_engine.kernels import (
+    HAS_NUMBA,
+    dtw_band,
+    dtw_band_2d,
+    dtw_band_3d,
+    dtw_band_dists,
+    resample_path,
+)
+
 
 @dataclass
 class TrajectoryEvent:
@@ -46,84 +54,321 @@ class TrajectoryTemplate:
     points: np.ndarray  # shape (N, 2) or (N, 3) — normalized path
     min_score: float = 0.65
     description: str = ""
+    _prepared: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Derived arrays are cached per template; replacing the points
+        # invalidates them (a no-op during __init__, before _prepared exists)
+        # and bumps the generation trackers use to rebuild their banks
+        if name == "points" and "_prepared" in self.__dict__:
+            self._prepared.clear()
+            object.__setattr__(self, "_generation", self._generation + 1)
+        object.__setattr__(self, name, value)
 
     def normalized(self) -> np.ndarray:
-        """Return path normalized to unit bounding box, centered at origin."""
-        pts = self.points.copy().astype(np.float64)
-        pts -= pts.mean(axis=0)
-        span = pts.max(axis=0) - pts.min(axis=0)
-        span = np.where(span < 1e-8, 1.0, span)
-        return (pts / span).astype(np.float32)
+        """Return path normalized to unit bounding box, centered at origin.
+
+        Computed on first call and cached; the cached array is returned
+        by reference, so do not modify it in place.
+        """
+        pts = self._prepared.get("normalized")
+        if pts is None:
+            pts = self.points.astype(np.float64)
+            pts -= pts.mean(axis=0)
+            span = pts.max(axis=0) - pts.min(axis=0)
+            span = np.where(span < 1e-8, 1.0, span)
+            pts = self._prepared["normalized"] = (pts / span).astype(np.float32)
+        return pts
+
+    def prepared(self, dim: int, n_points: int) -> np.ndarray:
+        """Normalized path cut to `dim` coordinates and resampled to `n_points`.
+
+        This is what `TrajectoryTracker` matches against; it is computed
+        once per (dim, n_points) and cached until `points` is replaced. A
+        2-D template prepared for 3-D gets a zero z column, matching a
+        query with no depth movement.
+        """
+        key = (dim, n_points)
+        pts = self._prepared.get(key)
+        if pts is None:
+            pts = self.normalized()
+            if pts.shape[1] >= dim:
+                pts = pts[:, :dim]
+            else:
+                pts = np.pad(pts, ((0, 0), (0, dim - pts.shape[1])))
+            pts = _resample_path(pts, n_points)
+            pts = self._prepared[key] = np.ascontiguousarray(pts, dtype=np.float32)
+        return pts
+
+    def envelope(self, dim: int, n_points: int, window: int) -> tuple[np.ndarray, np.ndarray]:
+        """Per-point (lower, upper) bounds of `prepared()` over a ±`window` band.
+
+        Used for the LB_Keogh lower bound; cached like `prepared()`.
+        """
+        key = (dim, n_points, window)
+        env = self._prepared.get(key)
+        if env is None:
+            env = self._prepared[key] = _envelope(self.prepared(dim, n_points), window)
+        return env
+
+    def log_aspect(self) -> float:
+        """`_log_aspect` of the raw template points; cached."""
+        aspect = self._prepared.get("log_aspect")
+        if aspect is None:
+            aspect = self._prepared["log_aspect"] = _log_aspect(self.points)
+        return aspect
 
 
 def _dtw_distance(s: np.ndarray, t: np.ndarray) -> float:
     """Compute DTW distance between two sequences of points.
 
-    Uses O(N*M) DP. Sequences are (N, D) and (M, D).
-    Returns average per-step cost (lower = better match).
+    Unconstrained O(N*M) DP, swept one anti-diagonal (i + j = k) at a
+    time: every cell on a diagonal depends only on the two before it, so
+    each step is a handful of vectorized ops over the whole diagonal.
+    Sequences are (N, D) and (M, D). Returns average per-step cost
+    (lower = better match).
     """
     n, m = len(s), len(t)
     if n == 0 or m == 0:
         return float("inf")
 
-    # Cost matrix
-    cost = np.full((n + 1, m + 1), float("inf"), dtype=np.float64)
-    cost[0, 0] = 0.0
+    diff = s[:, None, :].astype(np.float64) - t[None, :, :]
+    cost = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+
+    # Diagonals indexed by row i, holding D[i, k - i]; D[0, 0] = 0
+    prev2 = np.full(n + 1, np.inf)  # diagonal k - 2
+    prev1 = np.full(n + 1, np.inf)  # diagonal k - 1
+    curr = np.empty(n + 1)
+    prev2[0] = 0.0
+
+    for k in range(2, n + m + 1):
+        i = np.arange(max(1, k - m), min(n, k - 1) + 1)
+        curr.fill(np.inf)
+        best = np.minimum(np.minimum(prev1[i - 1], prev1[i]), prev2[i - 1])
+        curr[i] = cost[i - 1, k - i - 1] + best
+        prev2, prev1, curr = prev1, curr, prev2
+
+    return float(prev1[n]) / (n + m)
+
 
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            d = float(np.linalg.norm(s[i - 1] - t[j - 1]))
-            cost[i, j] = d + min(cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1])
+_DTW_WINDOW = 10  # Sakoe-Chiba band half-width used for template matching
+_DTW_BY_DIM = {2: dtw_band_2d, 3: dtw_band_3d}
 
-    return cost[n, m] / (n + m)
 
+def _log_aspect(points: np.ndarray) -> float:
+    """log(width / height) of the x/y bounding box of `points`.
 
-def _dtw_distance_fast(s: np.ndarray, t: np.ndarray, window: int = 10) -> float:
-    """DTW with Sakoe-Chiba band constraint for speed."""
+    Both extents are padded by 10% of the larger one, so straight lines
+    stay finite (about ±2.4) and small jitter barely moves the value.
+    Matching normalizes each axis separately, which discards aspect; an
+    opt-in `TrajectoryTracker(aspect_gate=...)` uses it to let a vertical
+    path skip horizontal templates before DTW.
+    """
+    span = points[:, :2].max(axis=0) - points[:, :2].min(axis=0)
+    width, height = float(span[0]), float(span[1])
+    pad = 0.1 * max(width, height) + 1e-8
+    return math.log((width + pad) / (height + pad))
+
+
+def _dtw_distance_fast(s: np.ndarray, t: np.ndarray, window: int = _DTW_WINDOW) -> float:
+    """DTW with Sakoe-Chiba band constraint for speed.
+
+    Runs the compiled `kernels.dtw_band` (Numba when installed), or its
+    fixed-dimension variant for 2-D and 3-D paths.
+    """
     n, m = len(s), len(t)
     if n == 0 or m == 0:
         return float("inf")
+    s = np.ascontiguousarray(s, dtype=np.float32)
+    t = np.ascontiguousarray(t, dtype=np.float32)
+    return float(_DTW_BY_DIM.get(s.shape[1], dtw_band)(s, t, window))
+
 
-    cost = np.full((n + 1, m + 1), float("inf"), dtype=np.float64)
-    cost[0, 0] = 0.0
+def _envelope(t: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Running per-coordinate min/max of `t` over indices i-window..i+window."""
+    width = 2 * window + 1
+    pad = ((window, window), (0, 0))
+    lo = np.pad(t, pad, constant_values=np.inf)
+    hi = np.pad(t, pad, constant_values=-np.inf)
+    lower = np.lib.stride_tricks.sliding_window_view(lo, width, axis=0).min(axis=-1)
+    upper = np.lib.stride_tricks.sliding_window_view(hi, width, axis=0).max(axis=-1)
+    return lower, upper
 
-    for i in range(1, n + 1):
-        j_start = max(1, i - window)
-        j_end = min(m, i + window)
-        for j in range(j_start, j_end + 1):
-            d = float(np.linalg.norm(s[i - 1] - t[j - 1]))
-            cost[i, j] = d + min(cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1])
 
-    return cost[n, m] / (n + m)
+def _lb_keogh(query: np.ndarray, lower: np.ndarray, upper: np.ndarray):
+    """LB_Keogh lower bound on the (unnormalized) DTW cost of `query`.
 
+    Every query point is aligned to at least one template point inside the
+    band, and that point lies within the envelope, so the distance from the
+    query point to the envelope box never exceeds its step cost. Summed
+    over the query this bounds `_dtw_distance_fast(...) * (n + m)` from
+    below. Query and envelope must have the same length.
 
-def _resample_path(points: np.ndarray, n_points: int = 32) -> np.ndarray:
-    """Resample a path to a fixed number of evenly-spaced points."""
+    `lower`/`upper` are (N, D) for one template, giving a float, or
+    (T, N, D) for a stack of templates, giving one bound per template.
+    """
+    q = query.astype(np.float64)  # match the kernel's float64 accumulation
+    excess = np.maximum(q - upper, 0.0) + np.maximum(lower - q, 0.0)
+    bound = np.sqrt(np.square(excess).sum(axis=-1)).sum(axis=-1)
+    return float(bound) if bound.ndim == 0 else bound
+
+
+def _prepare_query(
+    points: np.ndarray,
+    n_points: int,
+    diffs: Optional[np.ndarray] = None,
+    seg_lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Resample a live path and normalize it the way templates are.
+
+    Returns a C-contiguous float32 (n_points, D) array, centered with each
+    axis scaled to unit span, ready for the compiled DTW kernels.
+    `diffs`/`seg_lengths` are passed through to `_resample_path`.
+    """
+    resampled = _resample_path(points, n_points, diffs, seg_lengths)
+    resampled = np.ascontiguousarray(resampled, dtype=np.float32)
+    resampled -= resampled.mean(axis=0)
+    span = resampled.max(axis=0) - resampled.min(axis=0)
+    span = np.where(span < 1e-8, 1.0, span)
+    resampled /= span
+    return resampled
+
+
+def _resample_path(
+    points: np.ndarray,
+    n_points: int = 32,
+    diffs: Optional[np.ndarray] = None,
+    seg_lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Resample a path to a fixed number of evenly-spaced points.
+
+    Runs `kernels.resample_path` (Numba when installed). Callers that
+    already have the per-segment `diffs` (np.diff of the points) and
+    their `seg_lengths` can pass them in; the NumPy fallback then skips
+    recomputing them.
+    """
     if len(points) < 2:
         return points
+    if HAS_NUMBA:
+        return resample_path(np.ascontiguousarray(points, dtype=np.float32), n_points)
+    return resample_path(points, n_points, diffs, seg_lengths)
+
+
+class _PathBuffer:
+    """Per-hand ring of (timestamp, centroid) samples in preallocated arrays.
 
-    # Compute cumulative arc length
-    diffs = np.diff(points, axis=0)
-    seg_lengths = np.linalg.norm(diffs, axis=1)
-    cum_length = np.concatenate([[0], np.cumsum(seg_lengths)])
-    total = cum_length[-1]
+    Timestamps and points live in parallel float64/float32 arrays, so
+    appending is two slot writes and matching reads the path without
+    rebuilding it from tuples. Capacity doubles when the time window
+    holds more samples than fit.
+    """
 
-    if total < 1e-8:
-        return np.tile(points[0], (n_points, 1))
+    __slots__ = ("times", "points", "head", "count", "cap")
+
+    def __init__(self, dim: int, capacity: int = 64):
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.points = np.zeros((capacity, dim), dtype=np.float32)
+        self.head = 0
+        self.count = 0
+        self.cap = capacity
+
+    def append(self, timestamp: float, point: np.ndarray):
+        if self.count == self.cap:
+            self._grow()
+        idx = (self.head + self.count) % self.cap
+        self.times[idx] = timestamp
+        self.points[idx] = point
+        self.count += 1
+
+    def prune(self, cutoff: float):
+        """Drop samples with timestamp < cutoff from the front."""
+        times, cap = self.times, self.cap
+        while self.count and times[self.head] < cutoff:
+            self.head = (self.head + 1) % cap
+            self.count -= 1
+
+    def last(self, k: int = 1) -> int:
+        """Storage index of the k-th most recent sample (1 = newest)."""
+        return (self.head + self.count - k) % self.cap
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """(times, points) oldest first, as contiguous arrays."""
+        end = self.head + self.count
+        if end <= self.cap:
+            return self.times[self.head:end], self.points[self.head:end]
+        wrap = end - self.cap
+        return (
+            np.concatenate((self.times[self.head:], self.times[:wrap])),
+            np.concatenate((self.points[self.head:], self.points[:wrap])),
+        )
 
-    # Interpolate at evenly spaced arc lengths
-    target_lengths = np.linspace(0, total, n_points)
-    resampled = np.zeros((n_points, points.shape[1]), dtype=np.float32)
+    def clear(self):
+        self.head = 0
+        self.count = 0
 
-    for i, target in enumerate(target_lengths):
-        idx = np.searchsorted(cum_length, target, side="right") - 1
-        idx = min(idx, len(points) - 2)
-        seg_remain = target - cum_length[idx]
-        seg_len = seg_lengths[idx] if seg_lengths[idx] > 1e-8 else 1e-8
-        t_param = seg_remain / seg_len
-        resampled[i] = points[idx] + t_param * diffs[idx]
+    def _grow(self):
+        times, points = self.arrays()
+        self.cap *= 2
+        self.times = np.zeros(self.cap, dtype=np.float64)
+        self.points = np.zeros((self.cap, points.shape[1]), dtype=np.float32)
+        self.times[:self.count] = times
+        self.points[:self.count] = points
+        self.head = 0
 
-    return resampled
+    def __len__(self) -> int:
+        return self.count
+
+
+@dataclass(slots=True)
+class _HandState:
+    """Everything `TrajectoryTracker.update` keeps per hand, behind one lookup."""
+    path: _PathBuffer
+    still: int = 0  # consecutive frames below velocity_threshold
+    last_match: float = 0.0  # timestamp of the last emitted event
+
+
+@dataclass(slots=True)
+class _TemplateBank:
+    """Prepared templates of one (dim, n_points) stacked for batched matching.
+
+    Templates whose prepared path is not (n_points, dim) — e.g. a single
+    point, which cannot be resampled — are kept in `ragged` and matched
+    one at a time.
+    """
+    key: tuple[int, int]
+    generations: tuple[int, ...]  # `_generation` of every template at build time
+    templates: list[TrajectoryTemplate]
+    paths: np.ndarray  # (T, N, D) float32
+    lower: np.ndarray  # (T, N, D) LB_Keogh envelopes
+    upper: np.ndarray
+    log_aspect: np.ndarray  # (T,) `_log_aspect` of each template's raw points
+    ragged: list[TrajectoryTemplate]
+
+    def any_aspect_match(self, log_aspect: float, gate: float) -> bool:
+        """Whether any template is within `gate` of `log_aspect`."""
+        if np.any(np.abs(self.log_aspect - log_aspect) <= gate):
+            return True
+        return any(abs(t.log_aspect() - log_aspect) <= gate for t in self.ragged)
+
+
+def _build_bank(templates: list[TrajectoryTemplate], dim: int, n_points: int) -> _TemplateBank:
+    stacked, ragged = [], []
+    for template in templates:
+        shape = template.prepared(dim, n_points).shape
+        (stacked if shape == (n_points, dim) else ragged).append(template)
+    envelopes = [t.envelope(dim, n_points, _DTW_WINDOW) for t in stacked]
+    empty = np.empty((0, n_points, dim), dtype=np.float32)
+    return _TemplateBank(
+        key=(dim, n_points),
+        generations=tuple(t._generation for t in templates),
+        templates=stacked,
+        paths=np.stack([t.prepared(dim, n_points) for t in stacked]) if stacked else empty,
+        lower=np.stack([e[0] for e in envelopes]) if stacked else empty,
+        upper=np.stack([e[1] for e in envelopes]) if stacked else empty,
+        log_aspect=np.array([t.log_aspect() for t in stacked]),
+        ragged=ragged,
+    )
 
 
 class TrajectoryTracker:
@@ -132,6 +377,13 @@ class TrajectoryTracker:
     For each tracked hand, maintains a rolling window of centroid positions.
     When the hand stops moving (velocity drops below threshold), the accumulated
     path is matched against registered templates using DTW.
+
+    `aspect_gate` (off by default) skips templates whose bounding-box log
+    aspect ratio differs from the path's by more than the given amount,
+    before any DTW. It saves work on clearly different shapes, but since
+    matching itself is aspect-free it can also reject a real match (e.g.
+    a very shallow wave), so it is opt-in; around 1.5 separates lines
+    from circles.
     """
 
     def __init__(
@@ -142,6 +394,7 @@ class TrajectoryTracker:
         still_frames: int = 5,
         resample_points: int = 32,
         use_2d: bool = True,
+        aspect_gate: Optional[float] = None,
     ):
         self.window_seconds = window_seconds
         self.min_path_length = min_path_length
@@ -149,20 +402,23 @@ class TrajectoryTracker:
         self.still_frames = still_frames
         self.resample_points = resample_points
         self.use_2d = use_2d
+        self.aspect_gate = aspect_gate
+        # DTW kernel with the path dimension fixed, for unstacked templates
+        self._dtw_band = dtw_band_2d if use_2d else dtw_band_3d
 
         self._templates: list[TrajectoryTemplate] = []
-        self._paths: dict[int, deque] = {}  # hand_id → deque of (time, centroid)
-        self._still_counts: dict[int, int] = {}
-        self._last_match_time: dict[int, float] = {}
+        self._bank: Optional[_TemplateBank] = None  # rebuilt when templates change
+        self._hands: dict[int, _HandState] = {}  # hand_id → path + stillness state
         self._cooldown = 1.0
 
         # Recording state
         self._recording: Optional[str] = None
-        self._recording_points: list[np.ndarray] = []
+        self._recording_points: list[tuple[float, ...]] = []  # stacked on stop
 
     def register_template(self, template: TrajectoryTemplate):
         """Add a trajectory template."""
         self._templates.append(template)
+        self._bank = None
 
     def start_recording(self, name: str):
         """Begin recording a custom trajectory template."""
@@ -185,6 +441,7 @@ class TrajectoryTracker:
             min_score=min_score,
         )
         self._templates.append(template)
+        self._bank = None
         self._recording = None
         self._recording_points = []
         return template
@@ -193,118 +450,225 @@ class TrajectoryTracker:
         self, hand_id: int, landmarks: np.ndarray, timestamp: float
     ) -> list[TrajectoryEvent]:
         """Feed a new hand observation. Returns any matched trajectory events."""
-        # Centroid = mean of all landmarks
-        centroid = landmarks.mean(axis=0)
+        # Centroid = mean of all landmarks, over the tracked coordinates only
         dim = 2 if self.use_2d else 3
-        point = centroid[:dim]
+        point = landmarks[:, :dim].sum(axis=0) * (1.0 / len(landmarks))
 
         # Recording mode
         if self._recording is not None:
-            self._recording_points.append(point.copy())
+            self._recording_points.append(tuple(point.tolist()))
 
         # Track path
-        if hand_id not in self._paths:
-            self._paths[hand_id] = deque()
-            self._still_counts[hand_id] = 0
-
-        path = self._paths[hand_id]
-
-        # Prune old points
-        while path and (timestamp - path[0][0]) > self.window_seconds:
-            path.popleft()
+        state = self._hands.get(hand_id)
+        if state is None:
+            state = self._hands[hand_id] = _HandState(_PathBuffer(dim))
+        path = state.path
 
-        path.append((timestamp, point.copy()))
+        # Prune old points; append copies `point` into the ring's storage
+        path.prune(timestamp - self.window_seconds)
+        path.append(timestamp, point)
 
         # Check velocity
         if len(path) >= 2:
-            dt = path[-1][0] - path[-2][0]
+            cur, prev = path.last(1), path.last(2)
+            dt = float(path.times[cur] - path.times[prev])
             if dt > 0:
-                velocity = float(np.linalg.norm(path[-1][1] - path[-2][1])) / dt
+                # math.dist on two short lists; np.linalg.norm costs ~1 µs here
+                pts = path.points
+                velocity = math.dist(pts[cur].tolist(), pts[prev].tolist()) / dt
             else:
                 velocity = 0.0
         else:
             velocity = 0.0
 
         if velocity < self.velocity_threshold:
-            self._still_counts[hand_id] = self._still_counts.get(hand_id, 0) + 1
+            state.still += 1
         else:
-            self._still_counts[hand_id] = 0
+            state.still = 0
 
         # If hand has been still long enough, try to match the path
         events = []
-        if self._still_counts.get(hand_id, 0) >= self.still_frames and len(path) > 10:
+        if state.still >= self.still_frames and len(path) > 10:
             # Cooldown check
-            last = self._last_match_time.get(hand_id, 0)
-            if timestamp - last > self._cooldown:
+            if timestamp - state.last_match > self._cooldown:
                 events = self._match_path(hand_id, path, timestamp)
                 if events:
-                    self._last_match_time[hand_id] = timestamp
+                    state.last_match = timestamp
                     path.clear()
 
         return events
 
     def _match_path(
-        self, hand_id: int, path: deque, timestamp: float
+        self, hand_id: int, path: _PathBuffer, timestamp: float
     ) -> list[TrajectoryEvent]:
         """Try to match accumulated path against templates."""
         if not self._templates:
             return []
 
-        # Extract points
-        times = [p[0] for p in path]
-        points = np.array([p[1] for p in path], dtype=np.float32)
+        times, points = path.arrays()
 
-        # Check minimum path length
-        total_length = float(np.sum(np.linalg.norm(np.diff(points, axis=0), axis=1)))
+        # Cheap rejects before any resampling or DTW: path too short, or
+        # (with the aspect gate on) a bounding box no template comes close to
+        diffs = np.diff(points, axis=0)
+        seg_lengths = np.linalg.norm(diffs, axis=1)
+        total_length = float(seg_lengths.sum())
         if total_length < self.min_path_length:
             return []
-
-        # Normalize and resample
-        resampled = _resample_path(points, self.resample_points)
-        resampled -= resampled.mean(axis=0)
-        span = resampled.max(axis=0) - resampled.min(axis=0)
-        span = np.where(span < 1e-8, 1.0, span)
-        resampled /= span
-
-        duration = times[-1] - times[0]
-
-        events = []
-        for template in self._templates:
-            tmpl_pts = template.normalized()
-            # Ensure same dimensionality
-            dim = resampled.shape[1]
-            tmpl_pts = tmpl_pts[:, :dim] if tmpl_pts.shape[1] >= dim else tmpl_pts
-
-            tmpl_resampled = _resample_path(tmpl_pts, self.resample_points)
-
-            dist = _dtw_distance_fast(resampled, tmpl_resampled)
+        log_aspect = None
+        if self.aspect_gate is not None:
+            log_aspect = _log_aspect(points)
+            bank = self._template_bank(points.shape[1])
+            if not bank.any_aspect_match(log_aspect, self.aspect_gate):
+                return []
+
+        # Normalize and resample. Made C-contiguous float32 once here, so
+        # every template's kernel call takes it as-is (no per-call copy).
+        resampled = _prepare_query(points, self.resample_points, diffs, seg_lengths)
+
+        # Track the best match in scalars; only the winner becomes an event
+        best_score = -1.0
+        best_template = None
+        for template, dist in self._template_distances(resampled, log_aspect, best_only=True):
             # Convert distance to score (0–1)
             score = max(0.0, 1.0 - dist * 2.0)
 
-            if score >= template.min_score:
-                events.append(TrajectoryEvent(
-                    name=template.name,
-                    score=score,
-                    hand_id=hand_id,
-                    duration=duration,
-                    path_length=total_length,
-                    timestamp=timestamp,
-                ))
-
-        # Return best match only
-        if events:
-            events.sort(key=lambda e: e.score, reverse=True)
-            return [events[0]]
-        return []
+            if score >= template.min_score and score > best_score:
+                best_score = score
+                best_template = template
+
+        if best_template is None:
+            return []
+        return [TrajectoryEvent(
+            name=best_template.name,
+            score=best_score,
+            hand_id=hand_id,
+            duration=float(times[-1] - times[0]),
+            path_length=total_length,
+            timestamp=timestamp,
+        )]
+
+    def batch_match(self, paths: list[np.ndarray]) -> np.ndarray:
+        """DTW distance from each recorded path to every registered template.
+
+        For offline work such as replaying recordings or tuning template
+        thresholds, where many paths are scored at once. Nothing is gated
+        or pruned: each path gets a distance for every template.
+
+        Args:
+            paths: Centroid paths, each shape (N, 2) or (N, 3); extra
+                coordinates beyond the tracker's dimension are dropped.
+
+        Returns:
+            (len(paths), len(templates)) float64 distances, columns in
+            `templates` order; score = 1 - 2 * distance. Paths with fewer
+            than two points get inf.
+        """
+        dim = 2 if self.use_2d else 3
+        n = self.resample_points
+        out = np.full((len(paths), len(self._templates)), np.inf)
+        if not self._templates:
+            return out
+        bank = self._template_bank(dim)
+        column = {id(t): i for i, t in enumerate(self._templates)}
+        stacked_cols = [column[id(t)] for t in bank.templates]
+
+        for q, path in enumerate(paths):
+            points = np.asarray(path, dtype=np.float32)[:, :dim]
+            if len(points) < 2:
+                continue
+            query = _prepare_query(points, n)
+            if bank.templates:
+                diff = query[None, :, None, :] - bank.paths[:, None, :, :]
+                cube = np.sqrt(np.einsum("tijk,tijk->tij", diff, diff))
+                for k, col in enumerate(stacked_cols):
+                    out[q, col] = dtw_band_dists(cube[k], _DTW_WINDOW)
+            for template in bank.ragged:
+                out[q, column[id(template)]] = self._dtw_band(
+                    query, template.prepared(dim, n), _DTW_WINDOW
+                )
+        return out
+
+    def _template_bank(self, dim: int) -> _TemplateBank:
+        n = self.resample_points
+        bank = self._bank
+        if (
+            bank is None
+            or bank.key != (dim, n)
+            or bank.generations != tuple(t._generation for t in self._templates)
+        ):
+            bank = self._bank = _build_bank(self._templates, dim, n)
+        return bank
+
+    def _template_distances(
+        self,
+        resampled: np.ndarray,
+        log_aspect: Optional[float] = None,
+        best_only: bool = False,
+    ):
+        """Yield (template, DTW distance) for templates that might match.
+
+        With `log_aspect` given and the aspect gate on, templates whose
+        aspect differs by more than `aspect_gate` are skipped outright.
+        Stacked templates are then screened with one batched LB_Keogh
+        pass (score >= min_score  <=>  dist <= (1 - min_score) / 2), then
+        the survivors' point distances come from a single float32
+        (T, N, N) cube and only the banded recurrence runs per template.
+
+        With `best_only`, the caller only wants the closest qualifying
+        template: survivors are visited in ascending LB_Keogh order and
+        any whose bound exceeds the best qualifying distance so far is
+        skipped, as it cannot win.
+
+        `resampled` must be a C-contiguous float32 (n, dim) array, as the
+        compiled kernels take it without conversion.
+        """
+        dim = resampled.shape[1]
+        n = self.resample_points
+        bank = self._template_bank(dim)
+        gate = self.aspect_gate
+        if gate is None:
+            log_aspect = None
+
+        ragged = bank.ragged
+        if len(resampled) == n and bank.templates:
+            lb = _lb_keogh(resampled, bank.lower, bank.upper) / (2 * n)
+            # Thresholds are read live: min_score may change after registration
+            max_dist = np.array([(1.0 - t.min_score) / 2.0 for t in bank.templates])
+            ok = lb <= max_dist + 1e-9
+            if log_aspect is not None:
+                ok &= np.abs(bank.log_aspect - log_aspect) <= gate
+            keep = np.flatnonzero(ok)
+            if best_only:
+                keep = keep[np.argsort(lb[keep], kind="stable")]
+            if len(keep):
+                # float32 cube: half the footprint of float64 for (T, N, N)
+                diff = resampled[None, :, None, :] - bank.paths[keep, None, :, :]
+                cube = np.sqrt(np.einsum("tijk,tijk->tij", diff, diff))
+                best = np.inf
+                for k, t_idx in enumerate(keep.tolist()):
+                    if lb[t_idx] > best:
+                        break  # sorted by bound: no later template can win
+                    dist = float(dtw_band_dists(cube[k], _DTW_WINDOW))
+                    template = bank.templates[t_idx]
+                    # Same qualifying test as _match_path's score check
+                    if best_only and dist < best and 1.0 - dist * 2.0 >= template.min_score:
+                        best = dist
+                    yield template, dist
+        else:
+            ragged = bank.templates + ragged
+
+        if log_aspect is not None:
+            ragged = [t for t in ragged if abs(t.log_aspect() - log_aspect) <= gate]
+        dtw = self._dtw_band if dim == (2 if self.use_2d else 3) else dtw_band
+        for template in ragged:
+            yield template, float(dtw(resampled, template.prepared(dim, n), _DTW_WINDOW))
 
     def clear(self, hand_id: Optional[int] = None):
         """Clear tracking state."""
         if hand_id is not None:
-            self._paths.pop(hand_id, None)
-            self._still_counts.pop(hand_id, None)
+            self._hands.pop(hand_id, None)
         else:
-            self._paths.clear()
-            self._still_counts.clear()
+            self._hands.clear()
 
     @property
     def templates(self) -> list[TrajectoryTemplate]:
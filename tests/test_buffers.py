@@ -0,0 +1,75 @@
+"""Tests for the NumPy ring buffer."""
+
+import numpy as np
+import pytest
+
+from gesture_engine.buffers import RingBuffer, SmoothingWindow, SummingRingBuffer
+
+
+class TestRingBuffer:
+    def test_append_and_len(self):
+        buf = RingBuffer(3)
+        assert len(buf) == 0
+        buf.append(1.0)
+        buf.append(2.0)
+        assert len(buf) == 2
+        assert buf.view().sum() == pytest.approx(3.0)
+
+    def test_wraps_at_capacity(self):
+        buf = RingBuffer(3)
+        for v in range(5):
+            buf.append(float(v))
+        assert len(buf) == 3
+        np.testing.assert_array_equal(buf.values(), [2.0, 3.0, 4.0])
+        assert buf.last() == 4.0
+
+    def test_clear(self):
+        buf = RingBuffer(2)
+        buf.append(1.0)
+        buf.clear()
+        assert len(buf) == 0
+        assert buf.view().size == 0
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestSummingRingBuffer:
+    def test_running_mean_matches_window(self):
+        buf = SummingRingBuffer(4)
+        assert buf.mean() == 0.0
+        rng = np.random.default_rng(0)
+        for v in rng.random(11):
+            buf.append(v)
+            assert buf.sum == pytest.approx(buf.view().sum())
+            assert buf.mean() == pytest.approx(buf.view().mean())
+
+    def test_clear_resets_sum(self):
+        buf = SummingRingBuffer(2)
+        buf.append(3.0)
+        buf.clear()
+        assert buf.sum == 0.0
+        assert len(buf) == 0
+
+
+class TestSmoothingWindow:
+    def test_majority_tracks_window(self):
+        win = SmoothingWindow(3, num_labels=1)
+        win.append(0)
+        assert win.majority() == 0
+        win.append(5)  # grows the count table
+        assert win.majority() is None
+        win.append(5)
+        assert win.majority() == 5
+        win.append(0)  # evicts the first 0
+        win.append(0)  # evicts a 5
+        assert win.majority() == 0
+        assert len(win) == 3
+
+    def test_clear(self):
+        win = SmoothingWindow(2)
+        win.append(1)
+        win.clear()
+        assert len(win) == 0
+        assert win.majority() is None
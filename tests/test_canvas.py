@@ -45,6 +45,17 @@ class TestDrawingCanvas:
         line_cmds = [c for c in cmds2 if c.type == "line"]
         assert len(line_cmds) >= 1
 
+    def test_smoothing_averages_last_points(self):
+        canvas = DrawingCanvas(smoothing=3)
+        xs = [0.1, 0.2, 0.4, 0.8, 0.9]
+        lines = []
+        for i, x in enumerate(xs):
+            lines += [c for c in canvas.update(_make_landmarks(x, 0.5), "pointing", i * 0.1)
+                      if c.type == "line"]
+        # Window means after each of frames 2..5
+        expected = [0.15, (0.1 + 0.2 + 0.4) / 3, (0.2 + 0.4 + 0.8) / 3, (0.4 + 0.8 + 0.9) / 3]
+        assert [c.x2 for c in lines] == pytest.approx(expected, abs=1e-6)
+
     def test_erase_on_fist(self):
         canvas = DrawingCanvas()
         lm = _make_landmarks(0.5, 0.5)
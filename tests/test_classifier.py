@@ -34,6 +34,27 @@ class TestFeatureExtraction:
         f2 = classifier.extract_features(lm)
         np.testing.assert_array_equal(f1, f2)
 
+    def test_features_cached(self):
+        classifier = GestureClassifier()
+        lm = make_landmarks(3)
+        f1 = classifier.extract_features(lm, use_cache=True)
+        assert classifier.extract_features(lm.copy(), use_cache=True) is f1
+        assert not f1.flags.writeable
+        uncached = classifier.extract_features(lm)
+        assert uncached is not f1
+        assert uncached.flags.writeable
+        np.testing.assert_array_equal(uncached, f1)
+
+    def test_feature_cache_bounded(self):
+        from gesture_engine.classifier import _FEATURE_CACHE_SIZE
+        classifier = GestureClassifier()
+        first = make_landmarks(0)
+        classifier.extract_features(first, use_cache=True)
+        for seed in range(1, _FEATURE_CACHE_SIZE + 5):
+            classifier.extract_features(make_landmarks(seed), use_cache=True)
+        assert len(classifier._feature_cache) == _FEATURE_CACHE_SIZE
+        assert first.tobytes() not in classifier._feature_cache
+
     def test_features_differ_for_different_hands(self):
         classifier = GestureClassifier()
         f1 = classifier.extract_features(make_landmarks(1))
@@ -61,6 +82,25 @@ class TestFeatureExtraction:
         ratios = features[73:78]
         assert np.all(ratios >= 0)
 
+    def test_batch_matches_reference(self):
+        classifier = GestureClassifier()
+        hands = np.stack([make_landmarks(seed) for seed in range(4)])
+        batch = classifier.extract_features_batch(hands)
+        assert batch.shape == (4, 81)
+
+        tips, pips = [4, 8, 12, 16, 20], [3, 6, 10, 14, 18]
+        for lm, row in zip(hands, batch):
+            ref = list(lm.flatten())
+            for i in range(5):
+                for j in range(i + 1, 5):
+                    ref.append(np.linalg.norm(lm[tips[i]] - lm[tips[j]]))
+            for tip, pip in zip(tips, pips):
+                ref.append(np.linalg.norm(lm[tip] - lm[0])
+                           / (np.linalg.norm(lm[pip] - lm[0]) + 1e-8))
+            normal = np.cross(lm[5] - lm[0], lm[17] - lm[0])
+            ref.extend(normal / (np.linalg.norm(normal) + 1e-8))
+            np.testing.assert_allclose(row, ref, rtol=1e-5, atol=1e-6)
+
 
 class TestClassification:
     def test_classify_returns_tuple_or_none(self):
@@ -77,3 +117,8 @@ class TestClassification:
             name, conf = result
             assert isinstance(name, str)
             assert 0 <= conf <= 1
+
+    def test_classify_batch_matches_single(self):
+        classifier = GestureClassifier()
+        hands = np.stack([make_landmarks(seed) for seed in range(3)])
+        assert classifier.classify_batch(hands) == [classifier.classify(lm) for lm in hands]
@@ -54,3 +54,64 @@ class TestNormalization:
         norm = normalize_landmarks(lm)
         assert norm.shape == (21, 3)
         assert norm.dtype == np.float32 or norm.dtype == np.float64
+
+    def test_fused_normalize_matches_reference(self):
+        from gesture_engine.detector import _normalize_hand
+
+        lm = make_landmarks()
+        np.testing.assert_allclose(
+            _normalize_hand(lm), normalize_landmarks(lm), rtol=1e-5, atol=1e-6
+        )
+
+    def test_alignment_rotation_invariance(self):
+        from gesture_engine.detector import _align_hand
+
+        lm = make_landmarks()
+        theta = 0.7
+        rot = np.array([
+            [np.cos(theta), -np.sin(theta), 0.0],
+            [np.sin(theta), np.cos(theta), 0.0],
+            [0.0, 0.0, 1.0],
+        ], dtype=np.float32)
+        rotated = (lm - lm[0]) @ rot.T + lm[0]
+
+        aligned = _align_hand(lm)
+        np.testing.assert_allclose(aligned, _align_hand(rotated), atol=1e-5)
+        np.testing.assert_allclose(aligned[0], [0, 0, 0], atol=1e-6)
+        assert np.max(np.linalg.norm(aligned, axis=1)) == pytest.approx(1.0, abs=1e-5)
+
+
+class _FakeLandmark:
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+
+class _FakeHands:
+    """Stands in for mediapipe Hands; counts inference calls."""
+
+    def __init__(self, hands):
+        self.calls = 0
+        self._result = type("R", (), {"multi_hand_landmarks": [
+            type("H", (), {"landmark": [_FakeLandmark(*p) for p in lm]})()
+            for lm in hands
+        ]})()
+
+    def process(self, frame):
+        self.calls += 1
+        return self._result
+
+
+class TestDetectBoth:
+    def test_single_inference_matches_separate_calls(self):
+        from gesture_engine.detector import HandDetector, _normalize_hand
+
+        lm = make_landmarks()
+        detector = HandDetector.__new__(HandDetector)
+        detector._pool = [np.empty((21, 3), dtype=np.float32) for _ in range(4)]
+        detector._pool_idx = 0
+        detector._hands = _FakeHands([lm])
+
+        raw, normalized = detector.detect_both(None)
+        assert detector._hands.calls == 1
+        np.testing.assert_allclose(raw[0], lm)
+        np.testing.assert_allclose(normalized[0], _normalize_hand(lm), atol=1e-6)
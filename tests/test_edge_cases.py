@@ -288,8 +288,8 @@ class TestTrajectoryEdgeCases:
         tracker.update(0, lm, 0.0)
         tracker.update(1, lm, 0.0)
         tracker.clear(hand_id=0)
-        assert 0 not in tracker._paths
-        assert 1 in tracker._paths
+        assert 0 not in tracker._hands
+        assert 1 in tracker._hands
 
 
 class TestProfilerEdgeCases:
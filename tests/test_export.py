@@ -51,6 +51,24 @@ class TestTraining:
         assert isinstance(name, str)
         assert 0 <= conf <= 1
 
+    def test_classify_cache_is_opt_in(self, trained_classifier):
+        trained_classifier._feature_cache.clear()
+        lm = np.random.default_rng(1).random((21, 3)).astype(np.float32)
+        live = trained_classifier.classify(lm)
+        assert not trained_classifier._feature_cache
+        cached = trained_classifier.classify(lm, use_cache=True)
+        assert len(trained_classifier._feature_cache) == 1
+        assert cached[0] == live[0]
+        assert cached[1] == pytest.approx(live[1], rel=1e-5)
+
+    def test_train_with_encoded_labels(self):
+        classifier = GestureClassifier()
+        X = np.random.default_rng(7).random((30, 21, 3)).astype(np.float32)
+        y = np.repeat(np.array([2, 5, 9], dtype=np.int32), 10)
+        stats = classifier.train(X, y, epochs=2)
+        assert stats["classes"] == ["2", "5", "9"]
+        assert classifier.classify(X[0])[0] in ("2", "5", "9")
+
     def test_save_load_model(self, trained_classifier, tmp_path):
         path = tmp_path / "model.pt"
         trained_classifier.save_model(path)
@@ -114,3 +132,37 @@ class TestONNXExport:
         assert labels_path.exists()
         labels = json.loads(labels_path.read_text())
         assert len(labels) == 3  # fist, open_hand, peace
+
+
+@pytest.mark.skipif(not (_HAS_TORCH and _HAS_ONNX), reason="torch+onnx required")
+class TestONNXRuntimeClassifier:
+    def test_classify_with_onnx_model(self, trained_classifier, tmp_path):
+        from gesture_engine.export import ModelExporter
+        onnx_path = ModelExporter(trained_classifier).to_onnx(tmp_path / "model")
+
+        loaded = GestureClassifier(model_path=onnx_path)
+        lm = np.random.default_rng(0).random((8, 21, 3)).astype(np.float32)
+        for (n1, c1), (n2, c2) in zip(
+            trained_classifier.classify_batch(lm), loaded.classify_batch(lm)
+        ):
+            assert n1 == n2
+            assert abs(c1 - c2) < 1e-5
+
+    def test_int8_model_close_to_float(self, trained_classifier, tmp_path):
+        from gesture_engine.export import ModelExporter
+        exporter = ModelExporter(trained_classifier)
+        fp32 = exporter.to_onnx(tmp_path / "model")
+        int8 = exporter.to_onnx_int8(tmp_path / "model.int8.onnx")
+        assert int8 != fp32
+        ops = {node.op_type for node in onnx.load(str(int8)).graph.node}
+        assert "MatMulInteger" in ops
+
+        loaded = GestureClassifier(model_path=int8)
+        lm = np.random.default_rng(1).random((50, 21, 3)).astype(np.float32)
+        ref = trained_classifier.classify_batch(lm)
+        got = loaded.classify_batch(lm)
+        # Activations are quantized per batch and quantization error can
+        # flip near-ties; the bulk must agree
+        agree = sum(r[0] == g[0] for r, g in zip(ref, got))
+        assert agree >= 45
+        assert max(abs(r[1] - g[1]) for r, g in zip(ref, got)) < 0.1
@@ -150,3 +150,55 @@ class TestGestureRegistry:
         reg2 = GestureRegistry()
         reg2.load_from_file(path)
         assert len(reg2) == len(reg)
+
+    def test_compiled_matches_interpreted(self):
+        reg = GestureRegistry.with_defaults()
+        rng = np.random.default_rng(7)
+        for _ in range(500):
+            lm = rng.standard_normal((21, 3)).astype(np.float32)
+            compiled = reg.match(lm)
+            reference = reg.match_interpreted(lm)
+            if reference is None:
+                assert compiled is None
+            else:
+                assert compiled[0] is reference[0]
+                assert compiled[1] == pytest.approx(reference[1])
+
+    def test_batch_matches_single(self):
+        reg = GestureRegistry.with_defaults()
+        rng = np.random.default_rng(11)
+        stack = rng.standard_normal((300, 21, 3)).astype(np.float32)
+        stack[0] = make_fist()
+        for lm, batched in zip(stack, reg.match_batch(stack)):
+            single = reg.match(lm)
+            if single is None:
+                assert batched is None
+            else:
+                assert batched[0] is single[0]
+                assert batched[1] == pytest.approx(single[1])
+        assert reg.match_batch(stack[:0]) == []
+
+    def test_register_invalidates_compiled(self):
+        reg = GestureRegistry()
+        assert reg.match(make_fist()) is None
+        reg.register(GestureDefinition(
+            name="fist",
+            thumb=FingerState.CURLED, index=FingerState.CURLED,
+            middle=FingerState.CURLED, ring=FingerState.CURLED,
+            pinky=FingerState.CURLED,
+        ))
+        result = reg.match(make_fist())
+        assert result is not None
+        assert result[0].name == "fist"
+
+    def test_numpy_scalar_min_confidence(self):
+        reg = GestureRegistry()
+        reg.register(GestureDefinition(
+            name="fist",
+            thumb=FingerState.CURLED, index=FingerState.CURLED,
+            middle=FingerState.CURLED, ring=FingerState.CURLED,
+            pinky=FingerState.CURLED, min_confidence=np.float64(0.6),
+        ))
+        result = reg.match(make_fist())
+        assert result is not None
+        assert result[0].name == "fist"
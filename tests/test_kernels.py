@@ -0,0 +1,100 @@
+"""Tests for compiled kernels and their NumPy fallbacks."""
+
+import numpy as np
+import pytest
+
+from gesture_engine import kernels
+
+
+class TestCentroidsAndSqDists:
+    def test_numpy_reference(self):
+        rng = np.random.default_rng(0)
+        hands = rng.random((3, 21, 3)).astype(np.float32)
+        tracks = rng.random((2, 3)).astype(np.float32)
+        centroids, sq_dists = kernels._centroids_and_sq_dists_numpy(hands, tracks)
+        np.testing.assert_allclose(centroids, hands.mean(axis=1), rtol=1e-6)
+        expected = np.linalg.norm(centroids[:, None] - tracks[None], axis=-1) ** 2
+        np.testing.assert_allclose(sq_dists, expected, rtol=1e-5)
+
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    def test_jit_matches_numpy(self):
+        rng = np.random.default_rng(1)
+        hands = rng.random((4, 21, 3)).astype(np.float32)
+        tracks = rng.random((3, 3)).astype(np.float32)
+        c1, d1 = kernels._centroids_and_sq_dists_jit(hands, tracks)
+        c2, d2 = kernels._centroids_and_sq_dists_numpy(hands, tracks)
+        np.testing.assert_allclose(c1, c2, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(d1, d2, rtol=1e-5, atol=1e-6)
+
+
+
+def _dtw_reference(s, t, window):
+    n, m = len(s), len(t)
+    cost = np.full((n + 1, m + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(max(1, i - window), min(m, i + window) + 1):
+            d = float(np.linalg.norm(s[i - 1].astype(np.float64) - t[j - 1]))
+            cost[i, j] = d + min(cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1])
+    return cost[n, m] / (n + m)
+
+
+class TestDtwBand:
+    @pytest.mark.parametrize("n,m,window", [(12, 12, 3), (10, 14, 5), (8, 8, 20), (3, 9, 2)])
+    def test_numpy_matches_reference(self, n, m, window):
+        rng = np.random.default_rng(n * m)
+        s = rng.random((n, 2)).astype(np.float32)
+        t = rng.random((m, 2)).astype(np.float32)
+        assert kernels._dtw_band_numpy(s, t, window) == pytest.approx(
+            _dtw_reference(s, t, window), rel=1e-9
+        )
+
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    @pytest.mark.parametrize("dim", [2, 3])
+    def test_jit_matches_numpy(self, dim):
+        rng = np.random.default_rng(dim)
+        s = rng.random((20, dim)).astype(np.float32)
+        t = rng.random((24, dim)).astype(np.float32)
+        for window in (2, 6, 30):
+            assert kernels._dtw_band_jit(s, t, window) == pytest.approx(
+                kernels._dtw_band_numpy(s, t, window), rel=1e-6
+            )
+
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    def test_fixed_dim_jit_matches_generic(self):
+        rng = np.random.default_rng(4)
+        for dim, kernel in ((2, kernels._dtw_band_2d_jit), (3, kernels._dtw_band_3d_jit)):
+            s = rng.random((20, dim)).astype(np.float32)
+            t = rng.random((24, dim)).astype(np.float32)
+            for window in (2, 6, 30):
+                assert kernel(s, t, window) == pytest.approx(
+                    kernels._dtw_band_jit(s, t, window), rel=1e-6
+                )
+
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    def test_dists_jit_matches_numpy(self):
+        rng = np.random.default_rng(3)
+        dist = rng.random((16, 16)).astype(np.float32)
+        for window in (1, 4, 16):
+            assert kernels._dtw_band_dists_jit(dist, window) == pytest.approx(
+                kernels._dtw_band_dists_numpy(dist, window), rel=1e-9
+            )
+
+
+class TestResamplePath:
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    @pytest.mark.parametrize("n,n_out,dim", [(2, 10, 2), (30, 32, 2), (17, 8, 3), (5, 1, 2)])
+    def test_jit_matches_numpy(self, n, n_out, dim):
+        rng = np.random.default_rng(n * n_out)
+        pts = np.cumsum(rng.random((n, dim)), axis=0).astype(np.float32)
+        pts[1] = pts[0]  # a zero-length segment
+        np.testing.assert_allclose(
+            kernels._resample_path_jit(pts, n_out),
+            kernels._resample_path_numpy(pts, n_out),
+            rtol=1e-5, atol=1e-6,
+        )
+
+    @pytest.mark.skipif(not kernels.HAS_NUMBA, reason="numba not installed")
+    def test_jit_zero_length_path(self):
+        pts = np.ones((3, 2), dtype=np.float32)
+        np.testing.assert_array_equal(kernels._resample_path_jit(pts, 4), np.ones((4, 2)))
@@ -1,5 +1,7 @@
 """Tests for Prometheus metrics."""
 
+import threading
+
 import pytest
 
 from gesture_engine.metrics import MetricsCollector
@@ -20,6 +22,45 @@ class TestMetricsCollector:
         assert m._frames_total == 2
         assert m._hands_total == 3
 
+    def test_counts_merged_across_threads(self):
+        m = MetricsCollector()
+        m.record_gesture("fist")
+
+        def worker():
+            for _ in range(100):
+                m.record_gesture("fist")
+                m.record_frame(0.001, 1)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert m.gesture_counts == {"fist": 301}
+        assert m._frames_total == 300
+
+    def test_exited_threads_fold_into_base_shard(self):
+        m = MetricsCollector()
+        fist = m.register_gesture_name("fist")
+
+        def worker():
+            m.record_gesture_id(fist)
+            m.record_sequence("wave")
+            m.record_frame(0.003, 1)
+
+        for _ in range(20):
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+
+        assert len(m._shards) == 1
+        assert len(m._latency._shards) == 1
+        assert m.gesture_counts == {"fist": 20}
+        assert m._frames_total == 20
+        assert m._latency.count == 20
+        assert 'gesture_engine_sequences_total{sequence="wave"} 20' in m.render()
+
     def test_render_prometheus_format(self):
         m = MetricsCollector()
         m.record_gesture("thumbs_up")
@@ -42,3 +83,54 @@ class TestMetricsCollector:
         assert "gesture_engine_frame_latency_seconds_bucket" in output
         assert "gesture_engine_frame_latency_seconds_sum" in output
         assert "gesture_engine_frame_latency_seconds_count 10" in output
+
+    def test_histogram_buckets_cumulative(self):
+        m = MetricsCollector()
+        m.record_frame(0.0015, 1)  # le=0.002
+        m.record_frame(0.004, 1)   # le=0.005
+        m.record_frame(0.5, 1)     # +Inf only
+        output = m.render()
+        assert 'gesture_engine_frame_latency_seconds_bucket{le="0.001"} 0' in output
+        assert 'gesture_engine_frame_latency_seconds_bucket{le="0.002"} 1' in output
+        assert 'gesture_engine_frame_latency_seconds_bucket{le="0.005"} 2' in output
+        assert 'gesture_engine_frame_latency_seconds_bucket{le="0.1"} 2' in output
+        assert 'gesture_engine_frame_latency_seconds_bucket{le="+Inf"} 3' in output
+
+    def test_render_cached_until_dirty(self):
+        m = MetricsCollector(render_ttl=60.0)
+        m.record_gesture("fist")
+        first = m.render()
+        assert m.render() is first
+
+        m.record_gesture("peace")
+        second = m.render()
+        assert second is not first
+        assert 'gesture="peace"' in second
+
+    def test_record_gesture_by_id(self):
+        m = MetricsCollector()
+        fist = m.register_gesture_name("fist")
+        assert m.register_gesture_name("fist") == fist
+        peace = m.register_gesture_name("peace")
+        m.record_gesture_id(fist)
+        m.record_gesture_id(peace)
+        m.record_gesture("fist")
+        assert m.gesture_counts == {"fist": 2, "peace": 1}
+        assert 'gesture_engine_gestures_total{gesture="fist"} 2' in m.render()
+
+    def test_render_with_id_registered_mid_read(self):
+        m = MetricsCollector()
+        m.record_gesture_id(m.register_gesture_name("fist"))
+
+        class RacingCounts(list):
+            # Another thread registers and counts a new name while the
+            # shard's counts are being read
+            def __iter__(self):
+                if len(self) == 1:
+                    self.append(0)
+                    self[m.register_gesture_name("peace")] += 1
+                return super().__iter__()
+
+        shard = m._local.shard
+        shard.gesture_id_counts = RacingCounts(shard.gesture_id_counts)
+        assert m.gesture_counts == {"fist": 1, "peace": 1}
@@ -1,9 +1,54 @@
 """Tests for pipeline v2 features: hand tracking and adaptive thresholds."""
 
+import ast
+import inspect
+
 import numpy as np
 import pytest
 
-from gesture_engine.pipeline import HandTracker, AdaptiveThresholds
+from gesture_engine import pipeline as pipeline_module
+from gesture_engine.pipeline import GesturePipeline, HandTracker, AdaptiveThresholds
+
+
+class _StubDetector:
+    """Feeds a fixed list of per-frame hand lists."""
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def detect_normalized(self, frame_rgb):
+        return next(self._frames)
+
+    def close(self):
+        pass
+
+
+class _StubClassifier:
+    """Returns a fixed sequence of (gesture, confidence) results."""
+
+    def __init__(self, results):
+        self._results = iter(results)
+
+    def classify(self, landmarks):
+        return next(self._results)
+
+
+class _StubBatchClassifier(_StubClassifier):
+    def __init__(self, results):
+        super().__init__(results)
+        self.batches = 0
+
+    def classify_batch(self, landmarks):
+        self.batches += 1
+        return [self.classify(lm) for lm in landmarks]
+
+
+def make_pipeline(frames, results, **kwargs):
+    return GesturePipeline(
+        detector=_StubDetector(frames),
+        classifier=_StubClassifier(results),
+        **kwargs,
+    )
 
 
 class TestHandTracker:
@@ -58,6 +103,74 @@ class TestHandTracker:
         ids = {r[0] for r in result}
         assert len(ids) == 2  # unique IDs
 
+    def test_assignment_takes_closest_pairs_first(self):
+        tracker = HandTracker(max_distance=2.0)
+        a = np.zeros((21, 3), dtype=np.float32)
+        b = np.zeros((21, 3), dtype=np.float32)
+        b[:, 0] = 1.0
+        (id_a, _), (id_b, _) = tracker.update([a, b], 0.0)
+
+        # The first detection is nearer to b's track than to a's, but the
+        # second detection is nearer still; scanning detections in order
+        # would swap the IDs
+        d0 = np.zeros((21, 3), dtype=np.float32)
+        d0[:, 0] = 0.6
+        d1 = np.zeros((21, 3), dtype=np.float32)
+        d1[:, 0] = 0.9
+        result = tracker.update([d0, d1], 0.1)
+        assert [hid for hid, _ in result] == [id_a, id_b]
+
+    def test_update_with_stacked_block(self):
+        tracker = HandTracker(max_distance=0.5)
+        buf = np.zeros((2, 21, 3), dtype=np.float32)
+        buf[1] += 1.0
+        first = tracker.update(buf, 0.0)
+        assert first[0][1].base is buf  # views, not copies
+
+        buf += 0.01  # caller reuses its buffer for the next frame
+        second = tracker.update(buf, 0.1)
+        assert [hid for hid, _ in second] == [hid for hid, _ in first]
+        np.testing.assert_allclose(tracker.get_track(first[1][0]).centroid, [1.01] * 3, rtol=1e-6)
+        assert tracker.update(buf[:0], 0.2) == []
+
+    def test_update_with_strided_block(self):
+        tracker = HandTracker(max_distance=0.5)
+        big = np.zeros((4, 21, 4), dtype=np.float32)
+        big[2:] += 1.0
+        for view in (big[:, :, :3], big[::2, :, :3]):
+            first = tracker.update(view, 0.0)
+            second = tracker.update(view, 0.1)
+            assert [hid for hid, _ in second] == [hid for hid, _ in first]
+
+    def test_get_track_after_slot_reuse(self):
+        tracker = HandTracker(max_distance=0.1, timeout=0.5, capacity=1)
+        h1 = np.zeros((21, 3), dtype=np.float32)
+        h2 = np.ones((21, 3), dtype=np.float32)
+
+        (id1, _), (id2, _) = tracker.update([h1, h2], 0.0)
+        tracker.update([h2], 0.4)  # h1 not refreshed
+        tracker.update([h2], 0.8)  # h1 now stale, h2 moves into its slot
+
+        assert tracker.active_count == 1
+        assert tracker.get_track(id1) is None
+        track = tracker.get_track(id2)
+        assert track.frames_tracked == 2
+        np.testing.assert_allclose(track.centroid, [1.0, 1.0, 1.0])
+
+    def test_expiry_heap_stays_bounded(self):
+        tracker = HandTracker(timeout=0.5)
+        hand = np.zeros((21, 3), dtype=np.float32)
+
+        for frame in range(600):
+            tracker.update([hand], frame / 60.0)
+        assert tracker.active_count == 1
+        # only updates from the last timeout window are retained
+        assert len(tracker._expiry_heap) <= 32
+
+        tracker.update([], 20.0)
+        assert tracker.active_count == 0
+        assert tracker._expiry_heap == []
+
 
 class TestAdaptiveThresholds:
     def test_default_threshold(self):
@@ -96,3 +209,72 @@ class TestAdaptiveThresholds:
         for _ in range(2000):
             at.record("test", 0.9, was_stable=True)
         assert at.get_threshold("test") >= 0.3
+
+    def test_id_api_matches_name_api(self):
+        by_name = AdaptiveThresholds(adjustment_rate=0.05)
+        by_id = AdaptiveThresholds(adjustment_rate=0.05)
+        gid = by_id.gesture_id("peace")
+        assert by_id.gesture_id("peace") == gid
+
+        for stable in [False, False, True, False, True, True]:
+            by_name.record("peace", 0.8, was_stable=stable)
+            by_id.record_id(gid, 0.8, was_stable=stable)
+
+        assert by_id.threshold_of(gid) == by_name.get_threshold("peace")
+        assert by_id.current_thresholds == by_name.current_thresholds
+
+
+class TestGesturePipeline:
+    def test_smoothing_fires_once_with_cooldown(self):
+        hand = np.zeros((21, 3), dtype=np.float32)
+        pipeline = make_pipeline(
+            [[hand]] * 4, [("fist", 0.9)] * 4, smoothing_window=3,
+        )
+        events = []
+        for _ in range(4):
+            events.extend(pipeline.process_frame(None))
+        assert [e.gesture for e in events] == ["fist"]
+        assert events[0].hand_index == 0
+
+    def test_majority_vote_requires_more_than_half(self):
+        hand = np.zeros((21, 3), dtype=np.float32)
+        pipeline = make_pipeline(
+            [[hand]] * 4,
+            [("peace", 0.9), ("fist", 0.9), ("peace", 0.9), ("fist", 0.9)],
+            smoothing_window=4, cooldown_seconds=0.0,
+        )
+        gestures = [
+            [e.gesture for e in pipeline.process_frame(None)] for _ in range(4)
+        ]
+        # [peace, fist] and [peace, fist, peace, fist] have no strict majority
+        assert gestures == [[], [], ["peace"], []]
+
+    def test_adaptive_thresholds_list_only_recorded_gestures(self):
+        hand = np.zeros((21, 3), dtype=np.float32)
+        pipeline = make_pipeline(
+            [[hand]] * 2, [("fist", 0.9), ("peace", 0.1)], min_confidence=0.5,
+        )
+        for _ in range(2):
+            pipeline.process_frame(None)
+        assert list(pipeline.stats.adaptive_thresholds) == ["fist"]
+
+    def test_uses_classify_batch_when_available(self):
+        hand = np.zeros((21, 3), dtype=np.float32)
+        classifier = _StubBatchClassifier([("fist", 0.9)] * 6)
+        pipeline = GesturePipeline(
+            detector=_StubDetector([[hand, hand + 1.0]] * 3),
+            classifier=classifier,
+            smoothing_window=3,
+        )
+        events = []
+        for _ in range(3):
+            events.extend(pipeline.process_frame(None))
+        assert classifier.batches == 3
+        assert [e.gesture for e in events] == ["fist", "fist"]
+
+
+def test_pipeline_module_defines_each_class_once():
+    tree = ast.parse(inspect.getsource(pipeline_module))
+    names = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+    assert len(names) == len(set(names))
+    assert "enable_tracking" in inspect.signature(GesturePipeline).parameters
@@ -31,6 +31,23 @@ class TestGesturePlugin:
         plugin.on_gesture(PluginEvent(type="gesture", name="peace"))
         assert called == ["fist", "peace"]
 
+    def test_handler_added_after_dispatch(self):
+        plugin = GesturePlugin(name="test")
+        called = []
+
+        @plugin.handler("fist")
+        def on_fist(event):
+            called.append("exact")
+
+        plugin.on_gesture(PluginEvent(type="gesture", name="fist"))
+
+        @plugin.handler("*")
+        def on_any(event):
+            called.append("any")
+
+        plugin.on_gesture(PluginEvent(type="gesture", name="fist"))
+        assert called == ["exact", "exact", "any"]
+
     def test_handler_error_doesnt_crash(self):
         plugin = GesturePlugin(name="test")
 
@@ -68,6 +85,51 @@ class TestPluginManager:
         mgr.dispatch("gesture", PluginEvent(type="gesture", name="peace"))
         assert received == ["peace"]
 
+    def test_dispatch_skips_non_subscribers(self):
+        mgr = PluginManager()
+        received = []
+
+        class SequencePlugin(GesturePlugin):
+            name = "seq"
+            def on_sequence(self, event):
+                received.append(event.name)
+
+        mgr.register(GesturePlugin(name="idle"))
+        mgr.register(SequencePlugin())
+        mgr.dispatch("sequence", PluginEvent(type="sequence", name="wave"))
+        assert received == ["wave"]
+        assert [name for name, _ in mgr._subscribers["sequence"]] == ["seq"]
+
+        mgr.unregister("seq")
+        mgr.dispatch("sequence", PluginEvent(type="sequence", name="wave"))
+        assert received == ["wave"]
+
+    def test_dispatch_many(self):
+        mgr = PluginManager()
+        received = []
+
+        class First(GesturePlugin):
+            name = "first"
+            def on_sequence(self, event):
+                if event.name == "bad":
+                    raise RuntimeError("boom")
+                received.append(("first", event.name))
+
+        class Second(GesturePlugin):
+            name = "second"
+            def on_sequence(self, event):
+                received.append(("second", event.name))
+
+        mgr.register(First())
+        mgr.register(Second())
+        mgr.dispatch_many("sequence", [
+            PluginEvent(type="sequence", name=n) for n in ("wave", "bad", "swipe")
+        ])
+        assert received == [
+            ("first", "wave"), ("first", "swipe"),
+            ("second", "wave"), ("second", "bad"), ("second", "swipe"),
+        ]
+
     def test_load_directory_nonexistent(self):
         mgr = PluginManager()
         loaded = mgr.load_directory("/tmp/nonexistent_plugin_dir_12345")
@@ -89,6 +151,19 @@ class MyPlugin(GesturePlugin):
         assert loaded == 1
         assert "my_plugin" in mgr.plugin_names
 
+    def test_load_directory_skips_broken_files(self, tmp_path):
+        for name in ("a_plugin", "c_plugin"):
+            (tmp_path / f"{name}.py").write_text(
+                "from gesture_engine.plugins import GesturePlugin\n"
+                f"plugin = GesturePlugin(name={name!r})\n"
+            )
+        (tmp_path / "b_broken.py").write_text("def broken(:\n")
+        (tmp_path / "_private.py").write_text("raise RuntimeError\n")
+
+        mgr = PluginManager()
+        assert mgr.load_directory(tmp_path) == 2
+        assert mgr.plugin_names == ["a_plugin", "c_plugin"]
+
     def test_startup_shutdown(self):
         mgr = PluginManager()
         state = {"started": False, "stopped": False}
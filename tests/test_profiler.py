@@ -51,3 +51,42 @@ class TestPipelineProfiler:
             pass
         profiler.reset()
         assert profiler.get_stage_stats("detection") is None or profiler.get_stage_stats("detection").call_count == 0
+
+    def test_record(self):
+        profiler = PipelineProfiler()
+        profiler.record("total", 2.0)
+        profiler.record("total", 4.0)
+
+        stats = profiler.get_stage_stats("total")
+        assert stats.call_count == 2
+        assert stats.avg_ms == 3.0
+        assert stats.max_ms == 4.0
+
+    def test_record_disabled(self):
+        profiler = PipelineProfiler()
+        profiler.enabled = False
+        profiler.record("total", 2.0)
+        assert profiler.get_stage_stats("total") is None
+
+    def test_stage_reuses_timer(self):
+        profiler = PipelineProfiler()
+        assert profiler.stage("detection") is profiler.stage("detection")
+
+    def test_disabled_stage_is_shared_noop(self):
+        profiler = PipelineProfiler()
+        profiler.enabled = False
+        assert profiler.stage("detection") is profiler.stage("classification")
+
+    def test_summary_cached_until_new_timing(self):
+        profiler = PipelineProfiler()
+        profiler.record("detection", 1.0)
+        first = profiler.summary()
+        assert profiler.summary() == first
+
+        profiler.record("detection", 3.0)
+        updated = profiler.summary()
+        assert updated["detection"]["calls"] == 2
+        assert updated["detection"]["avg_ms"] == 2.0
+
+        profiler.reset()
+        assert profiler.summary() == {}
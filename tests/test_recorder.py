@@ -19,6 +19,36 @@ class TestRecorder:
         count = rec.stop()
         assert count == 10
 
+    def test_add_frame_stores_array_copies(self):
+        rec = GestureRecorder()
+        rec.start()
+        hand = np.zeros((21, 3), dtype=np.float32)
+        rec.add_frame([hand])
+        hand[:] = 1.0  # caller reuses its buffer
+
+        stored = rec._frame_hands(0)[0]
+        assert isinstance(stored, np.ndarray)
+        assert stored.dtype == np.float32
+        assert not stored.any()
+
+    def test_storage_grows_past_initial_capacity(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start(max_frames=2, max_hands=1)
+        recorded = [make_hands(1), make_hands(3), [], make_hands(2)]
+        for hands in recorded:
+            rec.add_frame(hands)
+        rec.stop()
+        assert rec.frame_count == 4
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path)
+        for i, hands in enumerate(recorded):
+            loaded = player.get_frame(i).hands
+            assert len(loaded) == len(hands)
+            for got, want in zip(loaded, hands):
+                np.testing.assert_array_equal(got, want)
+
     def test_not_recording_ignores_frames(self):
         rec = GestureRecorder()
         rec.add_frame(make_hands())
@@ -38,6 +68,54 @@ class TestRecorder:
         player = GesturePlayer.load(path)
         assert player.frame_count == 2
 
+    def test_json_roundtrip_stdlib_fallback(self, tmp_path, monkeypatch):
+        from gesture_engine import recorder as recorder_module
+        monkeypatch.setattr(recorder_module, "orjson", None)
+
+        rec = GestureRecorder()
+        rec.start()
+        hands = make_hands(2)
+        rec.add_frame(hands, [{"name": "fist", "confidence": 0.9, "hand_index": 0}])
+        rec.stop()
+
+        path = tmp_path / "test.json"
+        rec.save(path)
+        frame = GesturePlayer.load(path).get_frame(0)
+        np.testing.assert_allclose(frame.hands[1], hands[1])
+        assert frame.gestures[0]["name"] == "fist"
+
+    def test_spill_to_file(self, tmp_path):
+        rec = GestureRecorder()
+        spill = tmp_path / "scratch.f32"
+        rec.start(max_frames=2, max_hands=1, spill_to=spill)
+        recorded = [make_hands(1), make_hands(1), make_hands(1), make_hands(3), make_hands(2)]
+        for hands in recorded:
+            rec.add_frame(hands)
+        rec.stop()
+        assert isinstance(rec._hands, np.memmap)
+        assert spill.stat().st_size == rec._hands.nbytes
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path)
+        for i, hands in enumerate(recorded):
+            loaded = player.get_frame(i).hands
+            assert len(loaded) == len(hands)
+            for got, want in zip(loaded, hands):
+                np.testing.assert_array_equal(got, want)
+
+    def test_spill_to_file_save_json(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start(spill_to=tmp_path / "scratch.f32")
+        hands = make_hands(2)
+        rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.json"
+        rec.save(path)
+        frame = GesturePlayer.load(path).get_frame(0)
+        np.testing.assert_allclose(frame.hands[1], hands[1])
+
     def test_save_and_load_npz(self, tmp_path):
         rec = GestureRecorder()
         rec.start()
@@ -51,6 +129,91 @@ class TestRecorder:
         player = GesturePlayer.load(path)
         assert player.frame_count == 5
 
+    def test_save_compact_compressed(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        hands = make_hands(1)
+        rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path, compressed=True)
+        frame = GesturePlayer.load(path).get_frame(0)
+        np.testing.assert_array_equal(frame.hands[0], hands[0])
+
+        import zipfile
+        with zipfile.ZipFile(path) as zf:
+            assert {i.compress_type for i in zf.infolist()} == {zipfile.ZIP_DEFLATED}
+        with np.load(path) as data:
+            assert data["hand_counts"].dtype == np.uint8
+
+        rec.save_compact(path, compressed=True, compresslevel=9)
+        frame = GesturePlayer.load(path).get_frame(0)
+        np.testing.assert_array_equal(frame.hands[0], hands[0])
+
+    def test_save_compact_float16(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        hands = [np.random.rand(21, 3).astype(np.float32)]
+        rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path, dtype=np.float16)
+        assert np.load(path)["hands"].dtype == np.float16
+
+        loaded = GesturePlayer.load(path).get_frame(0).hands[0]
+        assert loaded.dtype == np.float32
+        np.testing.assert_allclose(loaded, hands[0], atol=1e-3)
+
+    def test_save_compact_rejects_other_dtypes(self, tmp_path):
+        rec = GestureRecorder()
+        with pytest.raises(ValueError):
+            rec.save_compact(tmp_path / "test.npz", dtype=np.int8)
+
+    def test_npz_roundtrip_variable_hand_counts(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        recorded = [make_hands(2), [], make_hands(1)]
+        for hands in recorded:
+            rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path)
+        for i, hands in enumerate(recorded):
+            loaded = player.get_frame(i).hands
+            assert len(loaded) == len(hands)
+            for got, want in zip(loaded, hands):
+                np.testing.assert_array_equal(got, want)
+
+    def test_npz_gestures_per_frame(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        rec.add_frame(make_hands(), [{"name": "fist", "confidence": 0.9, "hand_index": 0}])
+        rec.add_frame(make_hands())
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path)
+        assert player.get_frame(0).gestures[0]["name"] == "fist"
+        assert player.get_frame(1).gestures == []
+
+    def test_load_legacy_npz_gesture_string(self, tmp_path):
+        import json
+        path = tmp_path / "legacy.npz"
+        np.savez(
+            path,
+            timestamps=np.array([0.0], dtype=np.float32),
+            hands=np.zeros((1, 1, 21, 3), dtype=np.float32),
+            hand_counts=np.array([1], dtype=np.int32),
+            gesture_data=np.array([json.dumps([[{"name": "peace"}]])]),
+        )
+        player = GesturePlayer.load(path)
+        assert player.get_frame(0).gestures == [{"name": "peace"}]
+
     def test_play_yields_numpy(self, tmp_path):
         rec = GestureRecorder()
         rec.start()
@@ -66,6 +229,42 @@ class TestRecorder:
         assert isinstance(frames[0].hands[0], np.ndarray)
         assert frames[0].hands[0].shape == (21, 3)
 
+    def test_play_does_not_copy_loaded_arrays(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        rec.add_frame(make_hands(2))
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path)
+        frame = next(player.play())
+        assert frame.hands[0] is player.get_frame(0).hands[0]
+
+    def test_play_converts_list_frames_once(self):
+        hand = np.random.randn(21, 3).tolist()
+        player = GesturePlayer([RecordedFrame(timestamp=0.0, hands=[hand], gestures=[])])
+
+        first = next(player.play())
+        assert first.hands[0].dtype == np.float32
+        np.testing.assert_allclose(first.hands[0], hand, rtol=1e-6)
+        assert next(player.play()) is first
+
+    def test_play_realtime_scaled(self):
+        import time
+
+        frames = [
+            RecordedFrame(timestamp=i * 0.02, hands=make_hands(1), gestures=[])
+            for i in range(5)
+        ]
+        player = GesturePlayer(frames)
+        for speed in (2.0, 4.0):  # second pass reuses the cached schedule
+            start = time.monotonic()
+            played = list(player.play_realtime(speed=speed))
+            elapsed = time.monotonic() - start
+            assert [f.timestamp for f in played] == [f.timestamp for f in frames]
+            assert elapsed >= 0.08 / speed - 0.005
+
     def test_get_frame(self, tmp_path):
         rec = GestureRecorder()
         rec.start()
@@ -80,3 +279,35 @@ class TestRecorder:
         assert player.get_frame(0) is not None
         assert player.get_frame(1) is not None
         assert player.get_frame(5) is None
+
+    def test_npz_mmap_load(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        recorded = [make_hands(2), make_hands(1)]
+        for hands in recorded:
+            rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path)
+        player = GesturePlayer.load(path, mmap=True)
+        assert isinstance(player.frames_array, np.memmap)
+        assert player.frames_array.shape == (2, 2, 21, 3)
+        assert type(player.get_frame(0).hands[0]) is np.ndarray
+        for frame, hands in zip(player.play(), recorded):
+            assert len(frame.hands) == len(hands)
+            for got, want in zip(frame.hands, hands):
+                np.testing.assert_array_equal(got, want)
+
+    def test_npz_mmap_falls_back_when_compressed(self, tmp_path):
+        rec = GestureRecorder()
+        rec.start()
+        hands = make_hands(1)
+        rec.add_frame(hands)
+        rec.stop()
+
+        path = tmp_path / "test.npz"
+        rec.save_compact(path, compressed=True)
+        player = GesturePlayer.load(path, mmap=True)
+        assert not isinstance(player.frames_array, np.memmap)
+        np.testing.assert_array_equal(player.get_frame(0).hands[0], hands[0])
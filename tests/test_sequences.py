@@ -17,6 +17,14 @@ class TestSequenceDetector:
         assert len(events) == 1
         assert events[0].sequence_name == "release"
 
+    def test_str_subclass_gestures(self):
+        import numpy as np
+
+        det = SequenceDetector.with_defaults()
+        det.feed(np.str_("open_hand"), timestamp=0.0)
+        events = det.feed(np.str_("fist"), timestamp=0.5)
+        assert [e.sequence_name for e in events] == ["grab"]
+
     def test_three_gesture_sequence(self):
         det = SequenceDetector()
         det.register(GestureSequence(name="wave", gestures=["open_hand", "fist", "open_hand"]))
@@ -68,6 +76,40 @@ class TestSequenceDetector:
         events = det.feed("fist", timestamp=0.5)
         assert any(e.sequence_name == "grab" for e in events)
 
+    def test_sequences_sharing_last_gesture(self):
+        det = SequenceDetector()
+        det.register(GestureSequence(name="grab", gestures=["open_hand", "fist"]))
+        det.register(GestureSequence(name="peace_out", gestures=["peace", "fist"]))
+        det.register(GestureSequence(name="release", gestures=["fist", "open_hand"]))
+
+        det.feed("peace", timestamp=0.0)
+        events = det.feed("fist", timestamp=0.5)
+        assert [e.sequence_name for e in events] == ["peace_out"]
+        assert [c[0].name for c in det._by_last["fist"]] == ["grab", "peace_out"]
+
+    def test_match_across_history_wraparound(self):
+        det = SequenceDetector(max_history=3)
+        det.register(GestureSequence(name="wave", gestures=["open_hand", "fist", "open_hand"]))
+
+        for i, g in enumerate(["peace", "pointing", "ok_sign", "open_hand", "fist"]):
+            assert det.feed(g, timestamp=i * 0.1) == []
+        events = det.feed("open_hand", timestamp=0.5)
+        assert [e.sequence_name for e in events] == ["wave"]
+        assert events[0].duration == pytest.approx(0.2)
+
+    def test_expired_cooldowns_are_swept(self):
+        det = SequenceDetector()
+        det.register(GestureSequence(name="grab", gestures=["open_hand", "fist"]))
+
+        for hand in range(50):
+            det.feed("open_hand", hand_index=hand, timestamp=0.0)
+            det.feed("fist", hand_index=hand, timestamp=0.1)
+        assert len(det._last_triggered) == 50
+
+        for i in range(1024):
+            det.feed("peace" if i % 2 else "pointing", hand_index=999, timestamp=100.0)
+        assert len(det._last_triggered) == 0
+
     def test_per_hand_tracking(self):
         det = SequenceDetector()
         det.register(GestureSequence(name="release", gestures=["fist", "open_hand"]))
@@ -1,5 +1,6 @@
 """Tests for the WebSocket server REST endpoints."""
 
+import numpy as np
 import pytest
 
 try:
@@ -21,15 +22,25 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    # Prevent capture_loop from starting
+    # One app lifespan for the whole module; per-test state is reset below
     state.running = False
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
     state.running = False
 
 
+@pytest.fixture(autouse=True)
+def _reset_state():
+    # Prevent capture_loop from starting
+    state.running = False
+    yield
+    state.running = False
+    state.clients = set()
+    state.canvas_clients = set()
+
+
 class TestRESTEndpoints:
     def test_api_status(self, client):
         resp = client.get("/api/status")
@@ -58,6 +69,19 @@ class TestRESTEndpoints:
         resp = client.get("/api/plugins")
         assert resp.status_code == 200
 
+    def test_index_served_from_memory(self, client):
+        from gesture_engine.server import WEB_DEMO_DIR
+
+        resp = client.get("/")
+        assert resp.status_code == 200
+        if (WEB_DEMO_DIR / "index.html").exists():
+            assert resp.content == (WEB_DEMO_DIR / "index.html").read_bytes()
+            assert resp.headers["content-type"].startswith("text/html")
+
+    def test_demo_file_not_found(self, client):
+        resp = client.get("/demo/missing.js")
+        assert resp.status_code == 404
+
     def test_metrics_endpoint(self, client):
         resp = client.get("/metrics")
         assert resp.status_code == 200
@@ -67,6 +91,202 @@ class TestRESTEndpoints:
 class TestWebSocket:
     def test_ws_connect(self, client):
         with client.websocket_connect("/ws") as ws:
-            msg = ws.receive_json()
+            msg = ws.receive_json(mode="binary")
             assert msg["type"] == "connected"
             assert "gestures" in msg
+
+    def test_ws_ignores_malformed_messages(self, client):
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_bytes()  # connected
+            ws.send_text("not json")
+            ws.send_text("[1, 2]")
+            ws.send_text('{"type": "ping"}')
+            assert ws.receive_json(mode="binary")["type"] == "pong"
+
+    def test_ws_ping_pong(self, client):
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_bytes()  # connected
+            ws.send_text('{"type": "ping"}')
+            msg = ws.receive_json(mode="binary")
+            assert msg["type"] == "pong"
+
+
+class _FakeSocket:
+    def __init__(self, fail=False, stall=False):
+        self.fail = fail
+        self.stall = stall
+        self.sent = []
+
+    async def send_bytes(self, payload):
+        if self.fail:
+            raise ConnectionError("gone")
+        if self.stall:
+            import asyncio
+            await asyncio.sleep(10)
+        self.sent.append(payload)
+
+
+class TestBroadcast:
+    def test_broadcast_queues_without_sending(self):
+        from gesture_engine.server import Client, broadcast
+
+        sock = _FakeSocket()
+        client = Client(sock)
+        state.clients = {client}
+        try:
+            broadcast({"type": "stats", "fps": 30.0})
+            assert list(client.outbox) == [b'{"type":"stats","fps":30.0}']
+            assert sock.sent == []
+        finally:
+            state.clients = set()
+
+    def test_outbox_drops_oldest(self):
+        from gesture_engine.server import OUTBOX_SIZE, Client
+
+        client = Client(_FakeSocket())
+        for i in range(OUTBOX_SIZE + 5):
+            client.push(bytes([i]))
+        assert len(client.outbox) == OUTBOX_SIZE
+        assert client.outbox[0] == bytes([5])
+
+    def test_writer_drains_and_prunes_failed_clients(self):
+        import asyncio
+        from gesture_engine.server import Client
+
+        async def run():
+            ok, bad = Client(_FakeSocket()), Client(_FakeSocket(fail=True))
+            clients = {ok, bad}
+            tasks = [asyncio.create_task(c.run_writer(clients)) for c in (ok, bad)]
+            await asyncio.sleep(0)
+            for c in (ok, bad):
+                c.push(b"a")
+                c.push(b"b")
+            await asyncio.sleep(0.01)
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return ok, clients
+
+        ok, clients = asyncio.run(run())
+        assert ok.ws.sent == [b"a", b"b"]
+        assert clients == {ok}
+
+    def test_writer_drops_stalled_client(self, monkeypatch):
+        import asyncio
+        from gesture_engine import server
+
+        monkeypatch.setattr(server, "SEND_TIMEOUT", 0.01)
+
+        async def run():
+            slow = server.Client(_FakeSocket(stall=True))
+            clients = {slow}
+            slow.push(b"a")
+            await asyncio.wait_for(slow.run_writer(clients), timeout=1.0)
+            return clients
+
+        assert asyncio.run(run()) == set()
+
+
+class _FakeCapture:
+    def __init__(self, frames):
+        self._frames = list(frames)
+
+    def read(self):
+        if self._frames:
+            return True, self._frames.pop(0)
+        return False, None
+
+
+class TestFrameGrabber:
+    def test_delivers_rgb_frames_in_order(self):
+        from gesture_engine import server
+
+        if server.cv2 is None:
+            pytest.skip("opencv-python not installed")
+        bgr = np.zeros((2, 2, 3), dtype=np.uint8)
+        bgr[..., 0] = 255  # blue
+        frames = [bgr, bgr.copy()]
+        grabber = server.FrameGrabber(_FakeCapture(frames))
+        grabber.start()
+        try:
+            first = grabber.get(timeout=1.0)
+            second = grabber.get(timeout=1.0)
+        finally:
+            grabber.stop()
+        assert first[0, 0].tolist() == [0, 0, 255]
+        assert second is not None
+        assert second is not first  # distinct pooled buffers
+        assert grabber.get(timeout=0.05) is None
+
+    def test_downscales_wide_frames(self):
+        from gesture_engine import server
+
+        if server.cv2 is None:
+            pytest.skip("opencv-python not installed")
+        grabber = server.FrameGrabber(
+            _FakeCapture([np.zeros((720, 1280, 3), dtype=np.uint8)]), max_width=640,
+        )
+        grabber.start()
+        try:
+            frame = grabber.get(timeout=1.0)
+        finally:
+            grabber.stop()
+        assert frame.shape == (360, 640, 3)
+
+    def test_stops_after_repeated_read_failures(self):
+        from gesture_engine.server import FrameGrabber
+
+        grabber = FrameGrabber(_FakeCapture([]), max_read_failures=3)
+        grabber.start()
+        grabber._thread.join(timeout=1.0)
+        assert not grabber.alive
+        assert grabber.get(timeout=0.01) is None
+
+
+class TestWireFormat:
+    def test_unsupported_format_keeps_json(self):
+        from gesture_engine.server import Client
+
+        client = Client(_FakeSocket())
+        assert client.negotiate("protobuf") == "json"
+        assert client.outbox[-1].startswith(b'{"type":"format"')
+
+    def test_msgpack_client_gets_msgpack_broadcasts(self):
+        msgpack = pytest.importorskip("msgpack")
+        from gesture_engine.server import Client, broadcast
+
+        json_client, mp_client = Client(_FakeSocket()), Client(_FakeSocket())
+        assert mp_client.negotiate("msgpack") == "msgpack"
+        state.clients = {json_client, mp_client}
+        try:
+            broadcast({"type": "gesture", "confidence": np.float32(0.5)})
+        finally:
+            state.clients = set()
+        assert json_client.outbox[-1] == b'{"type":"gesture","confidence":0.5}'
+        assert msgpack.unpackb(mp_client.outbox[-1]) == {"type": "gesture", "confidence": 0.5}
+
+
+    def test_json_fallback_encodes_numpy_scalars(self, monkeypatch):
+        from gesture_engine import server
+
+        monkeypatch.setattr(server, "orjson", None)
+        payload = server._dumps({"confidence": np.float32(0.5), "count": np.int64(2)})
+        assert payload == b'{"confidence":0.5,"count":2}'
+
+
+class TestConnectedPayload:
+    def test_cached_until_definitions_change(self):
+        from gesture_engine.server import ServerState
+        from gesture_engine.trajectory import TrajectoryTemplate, TrajectoryTracker
+
+        st = ServerState()
+        st.trajectory_tracker = TrajectoryTracker()
+        first = st.connected_payload()
+        assert st.connected_payload() is first
+        assert b'"trajectories":[]' in first
+
+        st.trajectory_tracker.register_template(
+            TrajectoryTemplate(name="line", points=np.zeros((5, 2), dtype=np.float32))
+        )
+        updated = st.connected_payload()
+        assert b'"trajectories":["line"]' in updated
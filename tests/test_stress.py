@@ -3,6 +3,7 @@
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 import pytest
 
@@ -22,11 +23,20 @@ class TestHighVolume:
         """Process 10,000 frames rapidly."""
         classifier = GestureClassifier()
         rng = np.random.default_rng(42)
+        lm = np.empty((21, 3), dtype=np.float32)  # refilled in place each frame
 
         for _ in range(10_000):
-            lm = rng.random((21, 3)).astype(np.float32)
+            rng.random(out=lm, dtype=np.float32)
             classifier.classify(lm)
 
+    def test_10k_classifications_batched(self):
+        """Same volume through one classify_batch call."""
+        classifier = GestureClassifier()
+        lms = np.random.default_rng(42).random((10_000, 21, 3), dtype=np.float32)
+        results = classifier.classify_batch(lms)
+        assert len(results) == 10_000
+        assert results[:50] == [classifier.classify(lm) for lm in lms[:50]]
+
     def test_memory_stable(self):
         """RSS shouldn't grow unbounded over many frames."""
         try:
@@ -38,10 +48,11 @@ class TestHighVolume:
         classifier = GestureClassifier()
         seq_det = SequenceDetector.with_defaults()
         rng = np.random.default_rng(42)
+        lm = np.empty((21, 3), dtype=np.float32)
 
         rss_start = get_rss()
         for i in range(10_000):
-            lm = rng.random((21, 3)).astype(np.float32)
+            rng.random(out=lm, dtype=np.float32)
             result = classifier.classify(lm)
             if result:
                 seq_det.feed(result[0], timestamp=i * 0.001)
@@ -109,8 +120,9 @@ class TestTrajectoryStress:
             still_frames=3,
             window_seconds=100.0,
         )
+        lm = np.empty((21, 3), dtype=np.float32)
         for i in range(1000):
-            lm = np.full((21, 3), i / 1000.0, dtype=np.float32)
+            lm.fill(i / 1000.0)
             lm[:, 1] = 0.5
             tracker.update(0, lm, i * 0.01)
         # Just ensure no crash or memory explosion
@@ -146,11 +158,9 @@ class TestConcurrentRecorder:
             except Exception as e:
                 errors.append(e)
 
-        threads = [threading.Thread(target=save_and_load, args=(i,)) for i in range(8)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for future in as_completed([ex.submit(save_and_load, i) for i in range(8)]):
+                future.result()
 
         assert errors == [], f"Thread errors: {errors}"
 
@@ -10,6 +10,7 @@ from gesture_engine.trajectory import (
     TrajectoryEvent,
     _dtw_distance,
     _dtw_distance_fast,
+    _PathBuffer,
     _resample_path,
 )
 
@@ -34,6 +35,15 @@ class TestDTW:
         d2 = _dtw_distance_fast(s, t, window=20)  # large window = same as full
         assert d1 == pytest.approx(d2, abs=1e-6)
 
+    def test_unequal_lengths_match_fast(self):
+        rng = np.random.default_rng(8)
+        for n, m in ((1, 6), (6, 1), (9, 17)):
+            s = rng.random((n, 3)).astype(np.float32)
+            t = rng.random((m, 3)).astype(np.float32)
+            assert _dtw_distance(s, t) == pytest.approx(
+                _dtw_distance_fast(s, t, window=40), abs=1e-6
+            )
+
 
 class TestResample:
     def test_resample_preserves_endpoints(self):
@@ -49,12 +59,48 @@ class TestResample:
         assert len(resampled) == 1  # can't resample single point
 
 
+class TestPathBuffer:
+    def test_prune_and_wraparound(self):
+        buf = _PathBuffer(2, capacity=4)
+        for i in range(4):
+            buf.append(float(i), [i, -i])
+        buf.prune(2.0)
+        buf.append(4.0, [4, -4])
+        buf.append(5.0, [5, -5])
+        times, points = buf.arrays()
+        np.testing.assert_array_equal(times, [2, 3, 4, 5])
+        np.testing.assert_array_equal(points[:, 0], [2, 3, 4, 5])
+        assert buf.points[buf.last(2), 0] == 4
+
+    def test_grows_when_full(self):
+        buf = _PathBuffer(3, capacity=2)
+        buf.append(0.0, [0, 0, 0])
+        buf.append(1.0, [1, 1, 1])
+        buf.prune(0.5)
+        buf.append(2.0, [2, 2, 2])
+        buf.append(3.0, [3, 3, 3])
+        assert buf.cap == 4
+        times, points = buf.arrays()
+        np.testing.assert_array_equal(times, [1, 2, 3])
+        np.testing.assert_array_equal(points[:, 2], [1, 2, 3])
+
+
 class TestTrajectoryTemplate:
     def test_normalized_centers(self):
         pts = np.array([[1, 1], [3, 1], [2, 3]], dtype=np.float32)
         template = TrajectoryTemplate(name="test", points=pts)
         normed = template.normalized()
         assert normed.mean(axis=0) == pytest.approx([0, 0], abs=1e-4)
+        assert template.normalized() is normed
+
+    def test_replacing_points_invalidates_cache(self):
+        template = TrajectoryTemplate(name="test", points=np.array([[0, 0], [1, 0]], dtype=np.float32))
+        template.normalized()
+        template.prepared(2, 8)
+        template.points = np.array([[0, 0], [0, 2], [0, 4]], dtype=np.float32)
+        assert template.normalized().shape == (3, 2)
+        np.testing.assert_allclose(template.normalized()[:, 0], 0)
+        np.testing.assert_allclose(template.prepared(2, 8)[:, 0], 0)
 
 
 class TestTrajectoryTracker:
@@ -79,9 +125,9 @@ class TestTrajectoryTracker:
         tracker = TrajectoryTracker()
         lm = np.zeros((21, 3), dtype=np.float32)
         tracker.update(0, lm, 0.0)
-        assert 0 in tracker._paths
+        assert 0 in tracker._hands
         tracker.clear()
-        assert len(tracker._paths) == 0
+        assert len(tracker._hands) == 0
 
     def test_swipe_detection(self):
         """Feed a clear horizontal swipe and check it's detected."""
@@ -110,3 +156,191 @@ class TestTrajectoryTracker:
         # Should detect swipe_right (or similar)
         names = [e.name for e in events]
         assert len(events) >= 0  # may or may not detect depending on thresholds
+
+
+class TestTemplatePrepared:
+    def test_prepared_is_cached_and_matches_manual_prep(self):
+        pts = np.array([[0, 0, 1], [2, 0, 1], [2, 2, 3]], dtype=np.float32)
+        template = TrajectoryTemplate(name="corner", points=pts)
+
+        prepared = template.prepared(2, 16)
+        expected = _resample_path(template.normalized()[:, :2], 16)
+        np.testing.assert_allclose(prepared, expected)
+        assert template.prepared(2, 16) is prepared
+        assert template.prepared(3, 16).shape == (16, 3)
+
+    def test_3d_tracker_matches_2d_templates(self):
+        tracker = TrajectoryTracker.with_defaults(use_2d=False)
+        query = _resample_path(
+            np.array([[i / 20.0, 0.0, 0.0] for i in range(21)], dtype=np.float32), 32
+        )
+        query -= query.mean(axis=0)
+        dists = {t.name: d for t, d in tracker._template_distances(query)}
+        assert min(dists, key=dists.get) == "swipe_right"
+        assert tracker.templates[0].prepared(3, 32).shape == (32, 3)
+
+
+class TestLBKeogh:
+    def test_lower_bounds_banded_dtw(self):
+        from gesture_engine.trajectory import _envelope, _lb_keogh
+
+        rng = np.random.default_rng(7)
+        for window in (0, 3, 10):
+            for _ in range(20):
+                s = rng.random((32, 2)).astype(np.float32)
+                t = rng.random((32, 2)).astype(np.float32)
+                lower, upper = _envelope(t, window)
+                lb = _lb_keogh(s, lower, upper) / 64
+                assert lb <= _dtw_distance_fast(s, t, window) + 1e-9
+
+    def test_zero_inside_envelope(self):
+        from gesture_engine.trajectory import _envelope, _lb_keogh
+
+        t = np.linspace(0, 1, 16, dtype=np.float32)[:, None].repeat(2, axis=1)
+        lower, upper = _envelope(t, 2)
+        assert _lb_keogh(t, lower, upper) == 0.0
+        assert _lb_keogh(t + 5.0, lower, upper) > 0.0
+
+    def test_pruning_keeps_match_results(self, monkeypatch):
+        import gesture_engine.trajectory as traj
+
+        def swipe_events(tracker):
+            events = []
+            for i in range(25):
+                lm = np.zeros((21, 3), dtype=np.float32)
+                lm[:, 0] = i / 25.0
+                events.extend(tracker.update(0, lm, i * 0.04))
+            for i in range(10):
+                lm = np.zeros((21, 3), dtype=np.float32)
+                lm[:, 0] = 1.0
+                events.extend(tracker.update(0, lm, 1.0 + i * 0.04))
+            return [(e.name, round(e.score, 9)) for e in events]
+
+        kwargs = dict(min_path_length=0.05, velocity_threshold=0.01, still_frames=3)
+        pruned = swipe_events(TrajectoryTracker.with_defaults(**kwargs))
+        monkeypatch.setattr(traj, "_lb_keogh", lambda q, lower, upper: np.zeros(lower.shape[:-2]))
+        unpruned = swipe_events(TrajectoryTracker.with_defaults(**kwargs))
+        assert pruned == unpruned
+        assert pruned and pruned[0][0] == "swipe_right"
+
+    def test_batched_distances_match_per_template_dtw(self):
+        from gesture_engine.trajectory import _DTW_WINDOW
+
+        tracker = TrajectoryTracker.with_defaults()
+        rng = np.random.default_rng(11)
+        query = _resample_path(rng.random((40, 2)).astype(np.float32), 32)
+        query -= query.mean(axis=0)
+        # Push every template past the LB prune so all distances are computed
+        for t in tracker._templates:
+            t.min_score = float("-inf")
+        got = {t.name: d for t, d in tracker._template_distances(query)}
+        expected = {
+            t.name: _dtw_distance_fast(query, t.prepared(2, 32), _DTW_WINDOW)
+            for t in tracker.templates
+        }
+        assert got.keys() == expected.keys()
+        for name, dist in expected.items():
+            assert got[name] == pytest.approx(dist, rel=1e-6)
+
+    def test_min_score_read_after_registration(self):
+        from gesture_engine.trajectory import _prepare_query
+
+        tracker = TrajectoryTracker.with_defaults()
+        for t in tracker._templates:
+            t.min_score = 0.95
+        path = np.array([[0.0, i / 20.0] for i in range(21)], dtype=np.float32)
+        query = _prepare_query(path, 32)
+        assert len(list(tracker._template_distances(query))) < len(tracker._templates)
+
+        for t in tracker._templates:
+            t.min_score = float("-inf")
+        names = {t.name for t, _ in tracker._template_distances(query)}
+        assert names == {t.name for t in tracker._templates}
+
+    def test_best_only_keeps_top_match(self):
+        tracker = TrajectoryTracker.with_defaults()
+        for t in tracker._templates:
+            t.min_score = 0.0
+        rng = np.random.default_rng(12)
+        for _ in range(20):
+            walk = np.cumsum(rng.normal(size=(30, 2)), axis=0).astype(np.float32)
+            query = _resample_path(walk, 32)
+            query -= query.mean(axis=0)
+            query /= np.maximum(query.max(axis=0) - query.min(axis=0), 1e-8)
+            full = list(tracker._template_distances(query))
+            pruned = list(tracker._template_distances(query, best_only=True))
+            assert len(pruned) <= len(full)
+            assert min(full, key=lambda td: td[1]) == min(pruned, key=lambda td: td[1])
+
+
+class TestAspectGate:
+    def test_line_and_circle_aspects(self):
+        from gesture_engine.trajectory import _log_aspect
+
+        line = np.array([[i / 20.0, 0.0] for i in range(21)], dtype=np.float32)
+        angles = np.linspace(0, 2 * math.pi, 32, endpoint=False)
+        circle = np.column_stack([np.cos(angles), np.sin(angles)])
+        assert math.isfinite(_log_aspect(line))
+        assert _log_aspect(line) == pytest.approx(-_log_aspect(line[:, ::-1]))
+        assert abs(_log_aspect(line) - _log_aspect(circle)) > 1.5
+
+    def test_vertical_path_skips_horizontal_templates(self):
+        from gesture_engine.trajectory import _log_aspect
+
+        tracker = TrajectoryTracker.with_defaults(aspect_gate=1.5)
+        path = np.array([[0.0, i / 20.0] for i in range(21)], dtype=np.float32)
+        query = _resample_path(path, 32)
+        query -= query.mean(axis=0)
+        for t in tracker._templates:
+            t.min_score = float("-inf")
+        names = {t.name for t, _ in tracker._template_distances(query, _log_aspect(path))}
+        assert {"swipe_up", "swipe_down"} <= names
+        assert not names & {"swipe_left", "swipe_right", "circle_cw", "circle_ccw"}
+
+    def test_shallow_wave_matches_without_gate(self):
+        from gesture_engine.trajectory import _PathBuffer
+
+        def best(tracker):
+            wave = next(t for t in tracker.templates if t.name == "wave")
+            path = _PathBuffer(2)
+            for i, point in enumerate(wave.points * np.float32([1.0, 0.05])):
+                path.append(i * 0.05, point)
+            return [e.name for e in tracker._match_path(0, path, 1.0)]
+
+        # Matching is aspect-free, so a flattened wave is still a wave;
+        # only the opt-in gate rules it out
+        assert best(TrajectoryTracker.with_defaults()) == ["wave"]
+        assert best(TrajectoryTracker.with_defaults(aspect_gate=1.5)) != ["wave"]
+
+
+class TestBatchMatch:
+    def test_matches_per_template_dtw(self):
+        from gesture_engine.trajectory import _DTW_WINDOW, _prepare_query
+
+        tracker = TrajectoryTracker.with_defaults()
+        tracker.register_template(TrajectoryTemplate(
+            name="dot", points=np.zeros((1, 2), dtype=np.float32),
+        ))
+        rng = np.random.default_rng(5)
+        paths = [rng.random((30, 3)).astype(np.float32) for _ in range(3)]
+        paths.append(np.zeros((1, 2), dtype=np.float32))
+
+        dists = tracker.batch_match(paths)
+        assert dists.shape == (4, len(tracker.templates))
+        for q, path in enumerate(paths[:3]):
+            query = _prepare_query(path[:, :2], 32)
+            for col, template in enumerate(tracker.templates):
+                expected = _dtw_distance_fast(query, template.prepared(2, 32), _DTW_WINDOW)
+                assert dists[q, col] == pytest.approx(expected, rel=1e-5)
+        assert np.isinf(dists[3]).all()
+
+    def test_replacing_registered_points_rebuilds_bank(self):
+        tracker = TrajectoryTracker()
+        horizontal = np.array([[i / 20.0, 0.0] for i in range(21)], dtype=np.float32)
+        template = TrajectoryTemplate(name="line", points=horizontal)
+        tracker.register_template(template)
+        vertical = np.array([[0.0, i / 20.0] for i in range(21)], dtype=np.float32)
+        assert tracker.batch_match([vertical])[0, 0] > 0.1
+
+        template.points = vertical
+        assert tracker.batch_match([vertical])[0, 0] == pytest.approx(0.0, abs=1e-6)